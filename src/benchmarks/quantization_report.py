@@ -0,0 +1,136 @@
+"""
+Recall and latency of quantized two-pass search against exact float32 search.
+
+A synthetic corpus is loaded once per quantization type. The exact ground
+truth is the flat float32 scan of the same table, and the two-pass search is
+measured for several oversampling factors.
+
+Run from the repository root:
+
+    PYTHONPATH=src python -m benchmarks.quantization_report --rows 100000 --output quantization.json
+"""
+import json
+import logging
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import lancedb
+from tabulate import tabulate
+
+from benchmarks.synthetic_corpus import SyntheticCorpus
+from benchmarks.vector_search_benchmark import time_searches
+from procureme.clients.fake_embedder import DEFAULT_FAKE_DIMENSION, FakeEmbeddingClient
+from procureme.vectordb.lance_vectordb import LanceDBVectorStore
+from procureme.vectordb.quantization import QuantizationType, code_width
+from procureme.vectordb.search_metrics import recall_at_k
+
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger("quantization_report")
+
+
+def evaluate_quantization(
+    db_path: Path,
+    quantization: QuantizationType,
+    num_rows: int,
+    dimension: int,
+    num_queries: int,
+    top_k: int,
+    oversample_factors: List[int],
+) -> List[Dict[str, Any]]:
+    """
+    Load the corpus with one quantization type and measure every oversampling factor.
+
+    Returns:
+        One result row per oversampling factor
+    """
+    client = FakeEmbeddingClient(dimension)
+    corpus = SyntheticCorpus(num_rows)
+    table_name = f"quantization_{quantization}_{num_rows}"
+    lancedb.connect(db_path).drop_table(table_name, ignore_missing=True)
+    vector_store = LanceDBVectorStore(
+        db_path=db_path,
+        table_name=table_name,
+        embedding_client=client,
+        index_refresh_rows=None,
+        result_cache_size=0,
+        quantization=quantization,
+    )
+    for documents in corpus.iter_documents():
+        vector_store.insert(documents)
+
+    query_vectors = client.get_query_embeddings(corpus.queries(num_queries))
+    exact = time_searches(lambda vector: vector_store.search_by_vector(vector, top_k=top_k), query_vectors)
+    code_bytes = code_width(quantization, dimension)
+    results = [{
+        "rows": num_rows,
+        "search": "float32 flat",
+        "oversample": None,
+        "first_pass_bytes_per_vector": dimension * 4,
+        "p50_ms": exact["p50_ms"],
+        "p95_ms": exact["p95_ms"],
+        f"recall@{top_k}": 1.0,
+    }]
+
+    for oversample in oversample_factors:
+        start = time.perf_counter()
+        # The first call also loads the code matrix, keep it out of the timed queries
+        vector_store.search_quantized(query_vectors[0], top_k=top_k, oversample=oversample)
+        load_seconds = time.perf_counter() - start
+        measured = time_searches(
+            lambda vector: vector_store.search_quantized(vector, top_k=top_k, oversample=oversample),
+            query_vectors,
+        )
+        result = {
+            "rows": num_rows,
+            "search": f"{quantization} + rescore",
+            "oversample": oversample,
+            "first_pass_bytes_per_vector": code_bytes,
+            "p50_ms": measured["p50_ms"],
+            "p95_ms": measured["p95_ms"],
+            f"recall@{top_k}": recall_at_k(measured["retrieved"], exact["retrieved"]),
+        }
+        logger.info(f"{quantization} with oversample {oversample} (first call {load_seconds:.2f}s): {result}")
+        results.append(result)
+    return results
+
+
+def main():
+    """Write a recall/latency report of quantized two-pass search."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Compare quantized two-pass search with exact float32 search")
+    parser.add_argument("--rows", type=int, default=100_000, help="Corpus size in table rows")
+    parser.add_argument("--quantization", type=str, nargs="+", default=list(QuantizationType), choices=list(QuantizationType), help="Quantization types to compare")
+    parser.add_argument("--oversample", type=int, nargs="+", default=[1, 2, 4, 8, 16], help="Oversampling factors of the first pass")
+    parser.add_argument("--dimension", type=int, default=DEFAULT_FAKE_DIMENSION, help="Dimension of the fake embeddings")
+    parser.add_argument("--num-queries", type=int, default=200, help="Number of timed queries")
+    parser.add_argument("--top-k", type=int, default=10, help="Number of results per query")
+    parser.add_argument("--db-path", type=str, default=None, help="LanceDB directory for the report tables, a temporary one if omitted")
+    parser.add_argument("--output", type=str, default=None, help="Write the report as JSON to this file")
+
+    args = parser.parse_args()
+
+    db_path = Path(args.db_path) if args.db_path else Path(tempfile.mkdtemp(prefix="quantization_report_"))
+    results = []
+    for quantization in args.quantization:
+        results.extend(evaluate_quantization(
+            db_path, QuantizationType(quantization), args.rows, args.dimension,
+            args.num_queries, args.top_k, args.oversample,
+        ))
+
+    print(tabulate(results, headers="keys", floatfmt=".3f"))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"top_k": args.top_k, "dimension": args.dimension, "results": results}, f, indent=2)
+        logger.info(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
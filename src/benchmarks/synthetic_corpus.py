@@ -0,0 +1,89 @@
+"""
+Synthetic contract-like corpora for vector search benchmarks.
+
+Every page is drawn from one of a fixed set of topics, so pages of the same
+topic share vocabulary and cluster together under a bag-of-words embedder.
+Generation is seeded and fully deterministic.
+"""
+import random
+from typing import Iterator, List
+
+from procureme.models.contract_model import ParsedDocument, ParsedDocumentParts
+
+
+PAGES_PER_DOCUMENT = 10
+WORDS_PER_PAGE = 60
+TOPIC_WORDS = 40
+# Share of the words of a page taken from its topic, the rest is drawn from the whole vocabulary
+TOPIC_SHARE = 0.7
+
+_SYLLABLES = [
+    "pro", "cure", "con", "tract", "sup", "ply", "ven", "dor", "term", "pay",
+    "ment", "lia", "bil", "ity", "war", "ran", "ty", "ser", "vice", "lev",
+    "el", "in", "voice", "de", "liv", "ery", "pen", "al", "re", "new",
+]
+
+
+def build_vocabulary(size: int, seed: int) -> List[str]:
+    """Build a vocabulary of distinct pseudo-words."""
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(_SYLLABLES) for _ in range(rng.randint(2, 4))))
+    return sorted(words)
+
+
+class SyntheticCorpus:
+    """Deterministic generator of paged documents and matching page queries."""
+
+    def __init__(self, num_pages: int, num_topics: int = 200, vocabulary_size: int = 5000, seed: int = 42):
+        """
+        Initialize the corpus.
+
+        Args:
+            num_pages: Total number of pages (table rows) to generate
+            num_topics: Number of topics the pages are drawn from
+            vocabulary_size: Number of distinct words
+            seed: Seed of all random choices
+        """
+        self.num_pages = num_pages
+        self.seed = seed
+        self.vocabulary = build_vocabulary(vocabulary_size, seed)
+        rng = random.Random(seed)
+        self.topics = [rng.sample(self.vocabulary, TOPIC_WORDS) for _ in range(num_topics)]
+
+    def _page_text(self, rng: random.Random) -> str:
+        topic = rng.choice(self.topics)
+        return " ".join(
+            rng.choice(topic) if rng.random() < TOPIC_SHARE else rng.choice(self.vocabulary)
+            for _ in range(WORDS_PER_PAGE)
+        )
+
+    def iter_documents(self, batch_size: int = 1000) -> Iterator[List[ParsedDocument]]:
+        """Yield the corpus as lists of at most batch_size documents of PAGES_PER_DOCUMENT pages."""
+        rng = random.Random(self.seed + 1)
+        batch = []
+        for start in range(0, self.num_pages, PAGES_PER_DOCUMENT):
+            doc_index = start // PAGES_PER_DOCUMENT
+            total_pages = min(PAGES_PER_DOCUMENT, self.num_pages - start)
+            pages = [self._page_text(rng) for _ in range(total_pages)]
+            batch.append(ParsedDocument(
+                id_=f"doc-{doc_index:07d}",
+                file_name=f"CW{doc_index:07d}_synthetic.pdf",
+                total_pages=total_pages,
+                text="\n".join(pages),
+                parts=[
+                    ParsedDocumentParts(id_=f"doc-{doc_index:07d}-{page}", text=text, part=str(page))
+                    for page, text in enumerate(pages, start=1)
+                ],
+            ))
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def queries(self, num_queries: int) -> List[str]:
+        """Generate short queries, each a handful of words of one topic."""
+        rng = random.Random(self.seed + 2)
+        return [" ".join(rng.sample(rng.choice(self.topics), 8)) for _ in range(num_queries)]
@@ -0,0 +1,223 @@
+"""
+Benchmark ingest throughput, search latency, memory use and recall@k of the vector backends.
+
+For every corpus size a synthetic table is loaded with a deterministic fake
+embedder, then every backend is measured on the same pre-embedded queries:
+
+- flat:   LanceDB brute-force scan, the exact ground truth for recall@k
+- memory: InMemoryVectorStore, one matrix product per query
+- ivf_pq: LanceDB with an IVF_PQ index
+- hnsw:   LanceDB with an IVF_HNSW_SQ index
+
+Run from the repository root:
+
+    PYTHONPATH=src python -m benchmarks.vector_search_benchmark --rows 10000 100000 --output bench.json
+"""
+import json
+import logging
+import resource
+import tempfile
+import time
+from datetime import datetime, timezone
+from enum import StrEnum
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import lancedb
+from tabulate import tabulate
+
+from benchmarks.synthetic_corpus import SyntheticCorpus
+from procureme.clients.fake_embedder import DEFAULT_FAKE_DIMENSION, FakeEmbeddingClient
+from procureme.vectordb.lance_vectordb import LanceDBVectorStore, VectorIndexType
+from procureme.vectordb.memory_vectordb import InMemoryVectorStore
+from procureme.vectordb.search_metrics import percentile, recall_at_k
+
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger("vector_search_benchmark")
+
+DEFAULT_ROWS = [10_000, 100_000, 1_000_000]
+WARMUP_QUERIES = 5
+
+
+class Backend(StrEnum):
+    FLAT = "flat"
+    MEMORY = "memory"
+    IVF_PQ = "ivf_pq"
+    HNSW = "hnsw"
+
+
+INDEX_TYPES = {Backend.IVF_PQ: VectorIndexType.IVF_PQ, Backend.HNSW: VectorIndexType.HNSW}
+
+
+def rss_mb() -> float:
+    """Resident memory of this process in MB, the peak where the current value is unavailable."""
+    try:
+        with open("/proc/self/status", "r", encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def time_searches(
+    search: Callable[[List[float]], List[Dict[str, Any]]],
+    query_vectors: List[List[float]],
+) -> Dict[str, Any]:
+    """Run every query once after a short warm-up and collect latencies and hit ids."""
+    for query_vector in query_vectors[:WARMUP_QUERIES]:
+        search(query_vector)
+
+    latencies_ms = []
+    retrieved = []
+    for query_vector in query_vectors:
+        start = time.perf_counter()
+        hits = search(query_vector)
+        latencies_ms.append((time.perf_counter() - start) * 1000)
+        retrieved.append([hit["chunk_id"] for hit in hits])
+    return {
+        "p50_ms": percentile(latencies_ms, 50),
+        "p95_ms": percentile(latencies_ms, 95),
+        "p99_ms": percentile(latencies_ms, 99),
+        "retrieved": retrieved,
+    }
+
+
+def load_corpus(db_path: Path, corpus: SyntheticCorpus, client: FakeEmbeddingClient) -> Dict[str, Any]:
+    """Load the corpus into a fresh table and measure the ingest throughput."""
+    table_name = f"benchmark_{corpus.num_pages}"
+    lancedb.connect(db_path).drop_table(table_name, ignore_missing=True)
+    vector_store = LanceDBVectorStore(
+        db_path=db_path,
+        table_name=table_name,
+        embedding_client=client,
+        index_refresh_rows=None,
+        result_cache_size=0,
+    )
+
+    start = time.perf_counter()
+    for documents in corpus.iter_documents():
+        vector_store.insert(documents)
+    ingest_seconds = time.perf_counter() - start
+    rows = vector_store.table.count_rows()
+    logger.info(f"Loaded {rows} rows into {table_name} in {ingest_seconds:.1f}s")
+    return {
+        "vector_store": vector_store,
+        "rows": rows,
+        "ingest_seconds": ingest_seconds,
+        "ingest_rows_per_s": rows / ingest_seconds if ingest_seconds else 0.0,
+    }
+
+
+def benchmark_size(
+    db_path: Path,
+    num_rows: int,
+    backends: List[Backend],
+    dimension: int,
+    num_queries: int,
+    top_k: int,
+    nprobes: Optional[int],
+    refine_factor: Optional[int],
+) -> List[Dict[str, Any]]:
+    """
+    Measure every backend on one corpus size.
+
+    Returns:
+        One result row per backend
+    """
+    client = FakeEmbeddingClient(dimension)
+    corpus = SyntheticCorpus(num_rows)
+    loaded = load_corpus(db_path, corpus, client)
+    vector_store: LanceDBVectorStore = loaded["vector_store"]
+    query_vectors = client.get_query_embeddings(corpus.queries(num_queries))
+
+    # The flat scan runs first, before any index exists, and is the ground truth
+    ground_truth = time_searches(
+        lambda vector: vector_store.search_by_vector(vector, top_k=top_k), query_vectors
+    )["retrieved"]
+
+    results = []
+    for backend in sorted(backends, key=list(Backend).index):
+        start = time.perf_counter()
+        if backend == Backend.FLAT:
+            search = lambda vector: vector_store.search_by_vector(vector, top_k=top_k)
+        elif backend == Backend.MEMORY:
+            memory_store = InMemoryVectorStore(vector_store)
+            search = lambda vector: memory_store.search_by_vector(vector, top_k=top_k)
+        else:
+            # Every indexed backend starts from an unindexed table, not from the previous backend's index
+            vector_store.drop_vector_index()
+            vector_store.create_index(index_type=INDEX_TYPES[backend])
+            search = lambda vector: vector_store.search_by_vector(
+                vector, top_k=top_k, nprobes=nprobes, refine_factor=refine_factor
+            )
+        build_seconds = time.perf_counter() - start
+
+        measured = time_searches(search, query_vectors)
+        result = {
+            "rows": loaded["rows"],
+            "backend": str(backend),
+            "index_type": (vector_store.get_stats()["vector_index"] or {}).get("index_type"),
+            "ingest_rows_per_s": loaded["ingest_rows_per_s"],
+            "build_seconds": build_seconds,
+            "p50_ms": measured["p50_ms"],
+            "p95_ms": measured["p95_ms"],
+            "p99_ms": measured["p99_ms"],
+            f"recall@{top_k}": recall_at_k(measured["retrieved"], ground_truth),
+            "rss_mb": rss_mb(),
+            "disk_bytes": vector_store.get_storage_stats()["disk_bytes"],
+        }
+        logger.info(f"{backend} on {loaded['rows']} rows: {result}")
+        results.append(result)
+    return results
+
+
+def main():
+    """Run the benchmark for every corpus size and write the results as JSON."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the vector search backends on synthetic corpora")
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROWS, help="Corpus sizes in table rows")
+    parser.add_argument("--backends", type=str, nargs="+", default=list(Backend), choices=list(Backend), help="Backends to measure")
+    parser.add_argument("--dimension", type=int, default=DEFAULT_FAKE_DIMENSION, help="Dimension of the fake embeddings")
+    parser.add_argument("--num-queries", type=int, default=200, help="Number of timed queries per backend")
+    parser.add_argument("--top-k", type=int, default=10, help="Number of results per query")
+    parser.add_argument("--nprobes", type=int, default=None, help="IVF partitions to probe on indexed backends")
+    parser.add_argument("--refine-factor", type=int, default=None, help="Re-rank factor on indexed backends")
+    parser.add_argument("--db-path", type=str, default=None, help="LanceDB directory for the benchmark tables, a temporary one if omitted")
+    parser.add_argument("--output", type=str, default="vector_search_benchmark.json", help="JSON file the results are written to")
+
+    args = parser.parse_args()
+
+    db_path = Path(args.db_path) if args.db_path else Path(tempfile.mkdtemp(prefix="vector_benchmark_"))
+    backends = [Backend(backend) for backend in args.backends]
+    results = []
+    for num_rows in args.rows:
+        results.extend(benchmark_size(
+            db_path, num_rows, backends, args.dimension, args.num_queries,
+            args.top_k, args.nprobes, args.refine_factor,
+        ))
+
+    print(tabulate(results, headers="keys", floatfmt=".3f"))
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "dimension": args.dimension,
+        "top_k": args.top_k,
+        "num_queries": args.num_queries,
+        "nprobes": args.nprobes,
+        "refine_factor": args.refine_factor,
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    logger.info(f"Benchmark results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
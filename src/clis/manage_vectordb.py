@@ -1,10 +1,11 @@
+import os
 import typer
 import asyncio
 import polars as pl
 import chromadb
 from typing import List
 from dataclasses import dataclass, asdict
-from procureme.embeeders import MixedbreadEmbedder
+from procureme.embeeders import LocalRuntime, MixedbreadEmbedder
 from procureme.embeeding_funcs import MixedbreadEmbeddingFunction
 from pathlib import Path
 from procureme.models.chroma_cc_model import CommodityCodesListChromaDB
@@ -17,7 +18,13 @@ DATA_PATH = Path().absolute().parent.joinpath("data")
 COMMODITY_CODE_FILE_PATH = DATA_PATH.joinpath("raw", "commodity_codes.csv")
 
 # Embedder model
-emb_model = MixedbreadEmbedder(EMB_MODEL_PATH)
+# Loaded on the first encode, LOCAL_EMBEDDING_RUNTIME=onnx-int8 selects the quantized CPU runtime
+# and LOCAL_EMBEDDING_WORKERS > 1 encodes in that many processes
+emb_model = MixedbreadEmbedder(
+    EMB_MODEL_PATH,
+    runtime=os.getenv("LOCAL_EMBEDDING_RUNTIME", LocalRuntime.TORCH),
+    num_workers=int(os.getenv("LOCAL_EMBEDDING_WORKERS", "1")),
+)
 client = chromadb.HttpClient(host="localhost", port=8010)
 
 
@@ -60,6 +67,7 @@ def insert_documents(csv_file: str = typer.Argument(COMMODITY_CODE_FILE_PATH)):
 
     # Add documents to the collection
     collection.add(**cc_documents)
+    emb_model.close()
     typer.echo("Documents inserted successfully.")
 
 
@@ -0,0 +1,144 @@
+"""
+Compare recall@k and search latency of reduced embedding dimensions on the contracts corpus.
+
+Every dimension setting is loaded into its own table. The full-size table is
+the ground truth for recall@k, and query latency is measured on the table
+search alone, with the queries embedded beforehand.
+"""
+import json
+import logging
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import lancedb
+from tabulate import tabulate
+
+from procureme.models.contract_model import ParsedDocument
+from procureme.vectordb.lance_vectordb import LanceDBVectorStore
+from procureme.vectordb.search_metrics import percentile, recall_at_k
+from procureme.vectordb.utils import get_embedding_client
+
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger("dimension_report")
+
+
+def load_documents(directory_path: Path, limit: Optional[int] = None) -> List[ParsedDocument]:
+    """Load parsed contract documents from a directory of JSON files."""
+    documents = []
+    for file_path in sorted(directory_path.glob("*.json"))[:limit]:
+        with open(file_path, "r", encoding="utf-8") as f:
+            documents.append(ParsedDocument.model_validate(json.load(f)))
+    return documents
+
+
+def sample_queries(documents: List[ParsedDocument], num_queries: int, seed: int = 42) -> List[str]:
+    """Use the opening of randomly chosen pages as queries."""
+    parts = [part for doc in documents for part in doc.parts if part.text.strip()]
+    rng = random.Random(seed)
+    return [part.text[:300] for part in rng.sample(parts, min(num_queries, len(parts)))]
+
+
+def evaluate_dimension(
+    db_path: Path,
+    embed_client: str,
+    dimensions: Optional[int],
+    documents: List[ParsedDocument],
+    queries: List[str],
+    top_k: int,
+    create_index: bool,
+) -> Dict[str, Any]:
+    """
+    Load the documents with one dimension setting and time the searches.
+
+    Returns:
+        Measurements and the retrieved chunk ids of every query
+    """
+    client = get_embedding_client(embed_client, dimensions=dimensions)
+    table_name = f"dimension_report_{dimensions or 'full'}"
+    lancedb.connect(db_path).drop_table(table_name, ignore_missing=True)
+    vector_store = LanceDBVectorStore(
+        db_path=db_path,
+        table_name=table_name,
+        embedding_client=client,
+        index_refresh_rows=None,
+    )
+
+    start = time.perf_counter()
+    vector_store.insert(documents)
+    ingest_seconds = time.perf_counter() - start
+    if create_index:
+        vector_store.create_index()
+
+    query_vectors = client.get_query_embeddings(queries)
+    latencies_ms = []
+    retrieved = []
+    for query_vector in query_vectors:
+        start = time.perf_counter()
+        hits = vector_store.search_by_vector(query_vector, top_k=top_k)
+        latencies_ms.append((time.perf_counter() - start) * 1000)
+        retrieved.append([hit["chunk_id"] for hit in hits])
+
+    storage = vector_store.get_storage_stats()
+    logger.info(f"Evaluated {table_name} with dimension {client.dimension}")
+    return {
+        "setting": dimensions or "full",
+        "dimension": client.dimension,
+        "rows": vector_store.table.count_rows(),
+        "ingest_seconds": ingest_seconds,
+        "disk_bytes": storage["disk_bytes"],
+        "p50_ms": percentile(latencies_ms, 50),
+        "p95_ms": percentile(latencies_ms, 95),
+        "retrieved": retrieved,
+    }
+
+
+def main():
+    """Write a recall/latency report for a list of embedding dimensions."""
+    import argparse
+    from dotenv import load_dotenv
+
+    parser = argparse.ArgumentParser(description="Compare recall@k and latency of reduced embedding dimensions")
+    parser.add_argument("--data-dir", type=str, required=True, help="Directory containing parsed contract JSON files")
+    parser.add_argument("--embed-client", type=str, required=True, help="Embedding client to use")
+    parser.add_argument("--dimensions", type=int, nargs="+", default=[256, 512], help="Reduced dimensions to compare with the full size")
+    parser.add_argument("--db-path", type=str, default=None, help="LanceDB directory for the report tables, a temporary one if omitted")
+    parser.add_argument("--top-k", type=int, default=5, help="Number of results per query")
+    parser.add_argument("--num-queries", type=int, default=100, help="Number of sampled page queries")
+    parser.add_argument("--limit", type=int, default=None, help="Only load the first N documents")
+    parser.add_argument("--create-index", action="store_true", help="Build a vector index on every table before searching")
+    parser.add_argument("--output", type=str, default=None, help="Write the report as JSON to this file")
+
+    args = parser.parse_args()
+    load_dotenv(override=True)
+
+    db_path = Path(args.db_path) if args.db_path else Path(tempfile.mkdtemp(prefix="dimension_report_"))
+    documents = load_documents(Path(args.data_dir), args.limit)
+    queries = sample_queries(documents, args.num_queries)
+    logger.info(f"Comparing dimensions {args.dimensions} on {len(documents)} documents with {len(queries)} queries")
+
+    # The full-size table goes first, it is the ground truth for recall
+    results = [
+        evaluate_dimension(db_path, args.embed_client, dimensions, documents, queries, args.top_k, args.create_index)
+        for dimensions in [None, *args.dimensions]
+    ]
+    ground_truth = results[0]["retrieved"]
+    for result in results:
+        result[f"recall@{args.top_k}"] = recall_at_k(result.pop("retrieved"), ground_truth)
+
+    print(tabulate(results, headers="keys", floatfmt=".3f"))
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"top_k": args.top_k, "num_queries": len(queries), "results": results}, f, indent=2)
+        logger.info(f"Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Manage the indexes and storage of a LanceDB contracts table.
+"""
+import json
+import logging
+from datetime import timedelta
+
+from procureme.vectordb.lance_vectordb import LanceDBVectorStore, VectorIndexType
+from procureme.vectordb.quantization import QuantizationType
+from procureme.vectordb.utils import embedding_dimensions, get_embedding_client
+
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger("lancedb_index")
+
+
+def main():
+    """Create, optimize or inspect the vector and full-text indexes of a table."""
+    import argparse
+    from dotenv import load_dotenv
+
+    parser = argparse.ArgumentParser(description="Manage the indexes of a LanceDB table")
+    parser.add_argument("--db-path", type=str, required=True, help="Path to LanceDB database")
+    parser.add_argument("--table-name", type=str, required=True, help="Name of the table")
+    parser.add_argument("--embed-client", type=str, required=True, help="Embedding client the table was built with")
+    parser.add_argument("--dimensions", type=int, default=None, help="Reduced embedding dimension the table was built with, EMBEDDING_DIMENSIONS_<TABLE_NAME> or EMBEDDING_DIMENSIONS if omitted")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    create_parser = subparsers.add_parser("create", help="Build or replace the vector index")
+    create_parser.add_argument("--index-type", type=str, default=None, choices=list(VectorIndexType), help="Index type, IVF_PQ if omitted; HNSW indexes are rebuilt instead of optimized")
+    subparsers.add_parser("create-fts", help="Build or replace the full-text index on content")
+    subparsers.add_parser("create-scalar", help="Build or replace the scalar indexes on the metadata columns")
+    subparsers.add_parser("optimize", help="Add unindexed rows to the existing vector and full-text indexes")
+    subparsers.add_parser("refresh", help="Create, rebuild or optimize the index depending on unindexed rows")
+    maintain_parser = subparsers.add_parser("maintain", help="Compact fragments, clean up old versions and optimize indexes")
+    maintain_parser.add_argument("--retention-days", type=float, default=7, help="Keep dataset versions younger than this many days")
+    maintain_parser.add_argument("--delete-unverified", action="store_true", help="Also remove files of unfinished transactions, only when no writer runs")
+    quantize_parser = subparsers.add_parser("quantize", help="Migrate the table, adding the quantized vector column if missing, and backfill it")
+    quantize_parser.add_argument("--quantization", type=str, required=True, choices=list(QuantizationType), help="Binary sign bits or int8 codes")
+    subparsers.add_parser("migrate", help="Add the columns introduced after the table was created")
+    subparsers.add_parser("stats", help="Show table and index statistics")
+
+    args = parser.parse_args()
+    load_dotenv(override=True)
+    dimensions = args.dimensions or embedding_dimensions(args.table_name)
+
+    vector_store = LanceDBVectorStore(
+        db_path=args.db_path,
+        table_name=args.table_name,
+        embedding_client=get_embedding_client(args.embed_client, dimensions=dimensions),
+        index_refresh_rows=None,
+        quantization=QuantizationType(args.quantization) if args.command == "quantize" else None,
+    )
+
+    if args.command == "create":
+        index_type = VectorIndexType(args.index_type) if args.index_type else None
+        params = vector_store.create_index(index_type)
+        logger.info(f"Vector index created with {params}")
+    elif args.command == "create-fts":
+        vector_store.create_fts_index()
+    elif args.command == "create-scalar":
+        vector_store.create_scalar_indexes()
+    elif args.command == "optimize":
+        vector_store.optimize_index()
+    elif args.command == "maintain":
+        result = vector_store.maintain(
+            cleanup_older_than=timedelta(days=args.retention_days),
+            delete_unverified=args.delete_unverified,
+        )
+        logger.info(f"Maintenance result: {result}")
+    elif args.command == "refresh":
+        action = vector_store.refresh_index(force=True)
+        logger.info(f"Index refresh result: {action or 'nothing to do'}")
+    elif args.command == "migrate":
+        logger.info(f"Added columns: {vector_store.migrate_schema()}")
+    elif args.command == "quantize":
+        vector_store.migrate_schema()
+        rows = vector_store.build_quantized_codes()
+        logger.info(f"Quantized {rows} vectors")
+
+    print(json.dumps(vector_store.get_stats(), indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
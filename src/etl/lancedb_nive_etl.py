@@ -7,9 +7,13 @@ from pathlib import Path
 from typing import Union, Dict, Any
 
 from procureme.models.contract_model import ParsedDocument
-from procureme.vectordb.lance_vectordb import LanceDBVectorStore
+from procureme.vectordb.lance_vectordb import DEFAULT_INDEX_REFRESH_ROWS, IngestMode, LanceDBVectorStore
+from procureme.clients.cached_embedder import CachedEmbeddingClient
+from procureme.vectordb.utils import get_embedding_client
+from procureme.clients.local_embedder import LocalEmbeddingClient
 from procureme.clients.ollama_embedder import OllamaEmbeddingClient
-from procureme.clients.openai_embedder import OpenAIEmbeddingClient
+from procureme.vectordb.metadata import load_contract_metadata
+from procureme.vectordb.quantization import QuantizationType
 
 
 # Configure logging
@@ -35,7 +39,8 @@ class DocumentETLPipeline:
         
         Args:
             vector_store: Vector store instance to use for storing documents
-            batch_size: Number of documents to process in a batch
+            batch_size: Number of documents to process in a batch. All pages of a
+                batch are embedded together, so larger batches mean fewer embedding requests.
         """
         self.vector_store = vector_store
         self.batch_size = batch_size
@@ -45,6 +50,7 @@ class DocumentETLPipeline:
         self, 
         directory_path: Union[str, Path],
         upsert: bool = False,
+        skip_unchanged: bool = True,
     ) -> Dict[str, Any]:
         """
         Load documents from a directory of JSON files.
@@ -52,6 +58,8 @@ class DocumentETLPipeline:
         Args:
             directory_path: Path to directory containing JSON files
             upsert: Whether to upsert documents (update if exists) instead of insert
+            skip_unchanged: On upsert, only re-embed pages whose text changed and
+                delete pages that no longer exist
             
         Returns:
             Dictionary containing stats about the ETL process
@@ -94,7 +102,7 @@ class DocumentETLPipeline:
                     # Process batch if reached batch size
                     if len(current_batch) >= self.batch_size:
                         if upsert:
-                            self.vector_store.upsert(current_batch)
+                            self.vector_store.upsert(current_batch, skip_unchanged=skip_unchanged)
                         else:
                             self.vector_store.insert(current_batch)
                         logger.info(f"Processed batch of {len(current_batch)} documents")
@@ -109,7 +117,7 @@ class DocumentETLPipeline:
         # Process any remaining documents
         if current_batch:
             if upsert:
-                self.vector_store.upsert(current_batch)
+                self.vector_store.upsert(current_batch, skip_unchanged=skip_unchanged)
             else:
                 self.vector_store.insert(current_batch)
             logger.info(f"Processed final batch of {len(current_batch)} documents")
@@ -127,37 +135,74 @@ def main():
     parser.add_argument("--db-path", type=str, required=True, help="Path to LanceDB database")
     parser.add_argument("--table-name", type=str, required=True, help="Name of the table")
     parser.add_argument("--data-dir", type=str, required=True, help="Directory containing JSON files")
-    parser.add_argument("--embed-client", type=str, required=True, help="Embedding client to use")
+    parser.add_argument("--embed-client", type=str, required=True, help="Embedding client to use: openai, ollama or local (CPU sentence-transformers model)")
     parser.add_argument("--batch-size", type=int, default=100, help="Batch size for processing")
+    parser.add_argument("--dimensions", type=int, default=None, help="Reduced embedding dimension, full model size if omitted")
+    parser.add_argument("--embed-batch-size", type=int, default=None, help="Number of texts per embedding request, the model's preferred batch size if omitted")
     parser.add_argument("--upsert", action="store_true", help="Upsert documents instead of insert")
+    parser.add_argument("--reembed-all", action="store_true", help="On upsert, re-embed every page instead of only changed ones")
+    parser.add_argument("--metadata-dir", type=str, default=None, help="Directory with gold contract metadata JSON files to join onto the chunks")
+    parser.add_argument("--maintain", action="store_true", help="Compact fragments and clean up old versions after loading")
+    parser.add_argument("--embedding-cache", type=str, default=None, help="SQLite file caching embeddings across runs")
+    parser.add_argument("--index-refresh-rows", type=int, default=DEFAULT_INDEX_REFRESH_ROWS, help="Create or refresh the vector index after this many unindexed rows")
+    parser.add_argument("--ingest-mode", type=str, default=IngestMode.ARROW, choices=list(IngestMode), help="Write chunks as Arrow record batches or LanceModel rows")
+    parser.add_argument("--num-workers", type=int, default=1, help="Encode processes holding the model, only with --embed-client local")
+    parser.add_argument("--max-tasks-per-worker", type=int, default=None, help="Restart an encode process after this many chunks to cap its memory, only with --num-workers")
+    parser.add_argument("--quantization", type=str, default=None, choices=list(QuantizationType), help="Also store binary or int8 codes of every vector for two-pass search")
     
     
     
     args = parser.parse_args()
+    if args.num_workers > 1 and args.embed_client != "local":
+        parser.error("--num-workers is only supported with --embed-client local")
+    if args.max_tasks_per_worker is not None and args.num_workers < 2:
+        parser.error("--max-tasks-per-worker needs --num-workers 2 or more")
     load_dotenv(override=True)
     
     # Initialize embedding client
-    if args.embed_client == "openai":
-        embedding_client = OpenAIEmbeddingClient()
-    elif args.embed_client == "ollama":
-        embedding_client = OllamaEmbeddingClient()
-    else:
-        raise ValueError(f"Unknown embedding client: {args.embed_client}")
+    client_kwargs = {"batch_size": args.embed_batch_size, "dimensions": args.dimensions}
+    if args.embed_client == "local":
+        # Each worker encodes its share of a --batch-size batch, so larger batches keep more cores busy
+        client_kwargs["num_workers"] = args.num_workers
+        client_kwargs["max_tasks_per_worker"] = args.max_tasks_per_worker
+    embedding_client = base_client = get_embedding_client(args.embed_client, **client_kwargs)
+    if isinstance(base_client, OllamaEmbeddingClient):
+        # Load the model before the first batch instead of inside it
+        base_client.warm_up()
+    if args.embedding_cache:
+        embedding_client = CachedEmbeddingClient(embedding_client, args.embedding_cache)
     
     # Initialize vector store
     vector_store = LanceDBVectorStore(
         db_path=args.db_path,
         table_name=args.table_name,
-        embedding_client=embedding_client
+        embedding_client=embedding_client,
+        ingest_mode=IngestMode(args.ingest_mode),
+        index_refresh_rows=args.index_refresh_rows,
+        contract_metadata=load_contract_metadata(args.metadata_dir) if args.metadata_dir else None,
+        quantization=QuantizationType(args.quantization) if args.quantization else None,
     )
+    # The API only warns about missing columns, the loader adds them before writing
+    added = vector_store.migrate_schema()
+    if added:
+        logger.info(f"Migrated {args.table_name}, added columns {added}")
     
     # Initialize ETL pipeline
     etl = DocumentETLPipeline(vector_store=vector_store, batch_size=args.batch_size)
     
     # Load documents
-    stats = etl.load_from_json_directory(args.data_dir, upsert=args.upsert)
+    stats = etl.load_from_json_directory(args.data_dir, upsert=args.upsert, skip_unchanged=not args.reembed_all)
+    if vector_store.ensure_fts_index():
+        logger.info("Created full-text index on content for hybrid search")
+    vector_store.create_scalar_indexes()
+    if args.maintain:
+        vector_store.maintain()
     
     print(f"ETL process completed with stats: {stats}")
+    if args.embedding_cache:
+        print(f"Embedding cache stats: {embedding_client.get_stats()}")
+    if isinstance(base_client, (LocalEmbeddingClient, OllamaEmbeddingClient)):
+        base_client.close()
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@ from pathlib import Path
 from datetime import date
 from typing import Optional, List
 import json
+import os
 import ollama
 from pydantic import BaseModel, Field, ValidationError
 from tqdm import tqdm
@@ -88,15 +89,22 @@ Guidelines:
 You will now be given the full contract document as input.
 """
 
-def extract_metadata(contract_text: str, model: str) -> ExtractedContractMetadata:
+def warm_up_model(client: ollama.Client, model: str, keep_alive: str):
+    # An empty prompt only loads the model, so the first contract doesn't wait for it
+    logger.info(f"Loading {model} (keep alive {keep_alive})...")
+    client.generate(model=model, prompt="", keep_alive=keep_alive)
+
+
+def extract_metadata(contract_text: str, model: str, client: ollama.Client, keep_alive: str) -> ExtractedContractMetadata:
     logger.info("Extracting metadata...")
-    response = ollama.chat(
+    response = client.chat(
         model=model,
         format=ExtractedContractMetadata.model_json_schema(),
         messages=[
             {'role': 'system', 'content': SYSTEM_PROMPT},
             {'role': 'user', 'content': contract_text}
-        ]
+        ],
+        keep_alive=keep_alive,
     )
     content = response['message']['content']
     logger.info(f"Metadata extracted as {str(content)[:100]}...")
@@ -128,6 +136,7 @@ def main(
     destination: Path = typer.Option(..., "--dst", '-d', help="Destination folder for metadata JSONs"),
     dryrun: bool = typer.Option(False, help="Run without writing output"),
     model: str = typer.Option("gemma3:4b", help="Ollama model to use"),
+    keep_alive: str = typer.Option(os.getenv("OLLAMA_KEEP_ALIVE", "30m"), help="How long Ollama keeps the model loaded between files"),
     log_level: str = typer.Option("INFO", help="Logging level: DEBUG, INFO, WARNING, ERROR"),
     limit: Optional[int] = typer.Option(None, help="Process only N number of files"),
     logfile: Optional[Path] = typer.Option(None, help="Path to a log file"),
@@ -141,11 +150,15 @@ def main(
         files = files[:limit]
     logger.info(f"Processing {len(files)} contract(s)...")
 
+    # One client keeps its HTTP connection open across all files
+    client = ollama.Client(host=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"))
+    warm_up_model(client, model, keep_alive)
+
     for file_path in tqdm(files, desc="Extracting metadata", unit="file"):
         try:
             contract_data = load_json_contract(file_path)
             contract_text = contract_data.get("text", "")
-            extracted_metadata = extract_metadata(contract_text, model)
+            extracted_metadata = extract_metadata(contract_text, model, client, keep_alive)
             contract_metadata = add_cwid(extracted_metadata, file_path)
             save_metadata(contract_metadata, destination, dryrun)
         except ValidationError as e:
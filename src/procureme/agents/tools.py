@@ -4,6 +4,8 @@ from procureme.configurations.app_configs import Settings
 from procureme.dbmodels.doc_summery import ContractSummary
 from procureme.dbmodels.doc_metadata import ContractMetadata
 from procureme.vectordb.utils import get_vector_store
+from procureme.vectordb.lance_vectordb import SearchMode
+from procureme.vectordb.filters import eq_filter
 from sqlmodel import Session, create_engine, select
 import json
 import pandas as pd
@@ -79,6 +81,10 @@ vectordb_retriver_tool_description = {
                 "question": {
                     "type": "string",
                     "description": "The user question or query to find the answer for",
+                },
+                "cwid": {
+                    "type": "string",
+                    "description": "The CWID of the contract (e.g. CW0307), only if the question is about one specific contract",
                 }
             },
             "required": ["question"],
@@ -87,12 +93,15 @@ vectordb_retriver_tool_description = {
 }
 
 
-def vector_db_retriver_tool(question: str) -> str:
-    """Query the database with a user question."""
+def vector_db_retriver_tool(question: str, cwid: str | None = None) -> str:
+    """Query the database with a user question, restricted to one contract if a CWID is given."""
     logger.info("=== Entering Retrival Tool ===")
     try:
         vector_store = get_vector_store()
-        documents = vector_store.search(query=question, top_k=5)
+        where = eq_filter("cwid", cwid) if cwid else None
+        # Hybrid BM25 + vector search ranks exact tokens like CWIDs well, so fewer chunks are needed;
+        # tables without a full-text index fall back to a vector search
+        documents = vector_store.search(query=question, top_k=3, mode=SearchMode.HYBRID, where=where)
         document_ids = [f"{doc['doc_id']}-{doc['part']}" for doc in documents]
 
         logger.info(f"Following document parts is retrieved: {document_ids}")
@@ -0,0 +1,219 @@
+from procureme.clients.embedder import EmbeddingClientABC
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WAIT_MS = 5.0
+DEFAULT_MAX_BATCH_SIZE = 64
+
+_STOP = object()
+
+
+class MicroBatchingEmbeddingClient(EmbeddingClientABC):
+    """
+    Coalesce concurrent small embedding calls into one batched call of the wrapped client.
+
+    Texts arriving within max_wait_ms of the first waiting text, up to
+    max_batch_size of them, are embedded together by a background thread and
+    every caller's future is resolved with its own vectors. A lone caller waits
+    at most max_wait_ms longer than it would without the wrapper. Calls with
+    more than max_batch_size texts are already batched and go straight through.
+    Query and document texts share the window but are embedded in separate
+    calls, since some models embed them differently.
+    """
+
+    def __init__(
+        self,
+        client: EmbeddingClientABC,
+        max_wait_ms: float = DEFAULT_MAX_WAIT_MS,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+    ):
+        """
+        Initialize the micro-batching client.
+
+        Args:
+            client: Embedding client that computes the batched vectors
+            max_wait_ms: How long the first text of a batch waits for others to join
+            max_batch_size: Maximum number of texts embedded in one call
+        """
+        self.client = client
+        self.model_name = getattr(client, "model_name", type(client).__name__)
+        self.max_wait_ms = max_wait_ms
+        self.max_batch_size = max_batch_size
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        self._batches = 0
+        self._texts = 0
+
+    @property
+    def dimension(self) -> int:
+        """Return the dimension of the embeddings produced by the wrapped client."""
+        return self.client.dimension
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="embedding-micro-batcher", daemon=True)
+                self._worker.start()
+
+    def _submit(self, texts: List[str], query: bool) -> List[Future]:
+        self._ensure_worker()
+        futures = []
+        for text in texts:
+            future: Future = Future()
+            self._queue.put((text, query, future))
+            futures.append(future)
+        return futures
+
+    def _collect(self, first: Tuple[str, bool, Future]) -> List[Tuple[str, bool, Future]]:
+        """Gather more waiting texts until the window closes or the batch is full."""
+        pending = [first]
+        deadline = time.monotonic() + self.max_wait_ms / 1000
+        while len(pending) < self.max_batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                # Finish this batch first, then stop
+                self._queue.put(_STOP)
+                break
+            pending.append(item)
+        return pending
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            pending = self._collect(item)
+            for query in (False, True):
+                batch = [(text, future) for text, is_query, future in pending if is_query == query]
+                if batch:
+                    self._embed_batch(batch, query)
+
+    def _embed_batch(self, pending: List[Tuple[str, Future]], query: bool) -> None:
+        # Identical texts from different callers are embedded once
+        unique_texts = list(dict.fromkeys(text for text, _ in pending))
+        try:
+            embed = self.client.get_query_embeddings if query else self.client.get_embeddings
+            embeddings = embed(unique_texts)
+            if len(embeddings) != len(unique_texts):
+                raise ValueError(f"Embedding client returned {len(embeddings)} vectors for {len(unique_texts)} texts")
+            vectors = dict(zip(unique_texts, embeddings))
+            results = [list(vectors[text]) for text, _ in pending]
+        except Exception as e:
+            # Fail every caller of the batch, the worker keeps serving later batches
+            logger.error(f"Batched embedding of {len(unique_texts)} texts failed: {e}")
+            for _, future in pending:
+                future.set_exception(e)
+            return
+        self._batches += 1
+        self._texts += len(pending)
+        for (_, future), result in zip(pending, results):
+            future.set_result(result)
+
+    def get_embedding(self, text: str) -> List[float]:
+        """
+        Get embedding for a query text, batched with concurrent callers.
+
+        Args:
+            text: The text to embed
+
+        Returns:
+            List of floats representing the embedding vector
+        """
+        return self._submit([text], query=True)[0].result()
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Get embeddings for multiple texts, batched with concurrent callers if the call is small.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            List of embedding vectors in the same order as the input texts
+        """
+        if len(texts) > self.max_batch_size:
+            return self.client.get_embeddings(texts)
+        return [future.result() for future in self._submit(list(texts), query=False)]
+
+    def get_query_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings for multiple query texts, batched with concurrent callers if the call is small."""
+        if len(texts) > self.max_batch_size:
+            return self.client.get_query_embeddings(texts)
+        return [future.result() for future in self._submit(list(texts), query=True)]
+
+    async def aget_embedding(self, text: str) -> List[float]:
+        """
+        Get embedding for a query text without blocking the event loop, batched with concurrent callers.
+
+        Args:
+            text: The text to embed
+
+        Returns:
+            List of floats representing the embedding vector
+        """
+        return await asyncio.wrap_future(self._submit([text], query=True)[0])
+
+    async def aget_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Get embeddings for multiple texts without blocking the event loop.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            List of embedding vectors in the same order as the input texts
+        """
+        if len(texts) > self.max_batch_size:
+            return await self.client.aget_embeddings(texts)
+        return await self._await_all(self._submit(list(texts), query=False))
+
+    async def aget_query_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings for multiple query texts without blocking the event loop."""
+        if len(texts) > self.max_batch_size:
+            return await self.client.aget_query_embeddings(texts)
+        return await self._await_all(self._submit(list(texts), query=True))
+
+    @staticmethod
+    async def _await_all(futures: List[Future]) -> List[List[float]]:
+        return list(await asyncio.gather(*(asyncio.wrap_future(future) for future in futures)))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get batching statistics.
+
+        Returns:
+            Dictionary with the number of batched calls, texts and the mean batch size
+        """
+        return {
+            "batches": self._batches,
+            "texts": self._texts,
+            "mean_batch_size": self._texts / self._batches if self._batches else 0.0,
+            "max_wait_ms": self.max_wait_ms,
+            "max_batch_size": self.max_batch_size,
+        }
+
+    def close(self) -> None:
+        """Stop the background thread after the texts already queued are embedded."""
+        if self._worker is not None and self._worker.is_alive():
+            self._queue.put(_STOP)
+            self._worker.join()
+
+    def __repr__(self) -> str:
+        """Return string representation of the client."""
+        return f"MicroBatchingEmbeddingClient(client={self.client!r}, max_wait_ms={self.max_wait_ms})"
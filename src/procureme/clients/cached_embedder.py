@@ -0,0 +1,251 @@
+from procureme.clients.embedder import EmbeddingClientABC
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Union
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+import unicodedata
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 500_000
+
+
+def normalize_text(text: str) -> str:
+    """Normalize unicode and collapse whitespace so trivially different texts share a cache entry."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class CachedEmbeddingClient(EmbeddingClientABC):
+    """
+    Persistent, content-addressed embedding cache around any EmbeddingClientABC.
+
+    Vectors are stored as float32 blobs in SQLite, keyed by the model name,
+    the vector dimension, whether the text was embedded as a query or a
+    document, and a SHA-256 of the normalized text. Only texts that
+    are not cached yet are sent to the wrapped client. The least recently used
+    entries are evicted once the cache holds more than max_entries vectors.
+    """
+
+    def __init__(
+        self,
+        client: EmbeddingClientABC,
+        cache_path: Union[str, Path],
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Initialize the cached embedding client.
+
+        Args:
+            client: Embedding client that computes vectors on cache misses
+            cache_path: Path to the SQLite cache file, created if missing
+            max_entries: Maximum number of cached vectors before LRU eviction
+        """
+        self.client = client
+        self.cache_path = Path(cache_path)
+        self.max_entries = max_entries
+        self.model_name = getattr(client, "model_name", type(client).__name__)
+        self._model_key = f"{self.model_name}:{client.dimension}"
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.cache_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "key TEXT PRIMARY KEY, vector BLOB NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS embeddings_last_used ON embeddings (last_used)")
+        self._conn.commit()
+        self._size = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    @property
+    def dimension(self) -> int:
+        """Return the dimension of the embeddings produced by the wrapped client."""
+        return self.client.dimension
+
+    def _key(self, text: str, query: bool) -> str:
+        digest = hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+        # Models with a query prompt embed the same text differently as a query
+        return f"{self._model_key}:query:{digest}" if query else f"{self._model_key}:{digest}"
+
+    def get_embedding(self, text: str) -> List[float]:
+        """
+        Get embedding for a query text, from the cache when possible.
+
+        Args:
+            text: The text to embed
+
+        Returns:
+            List of floats representing the embedding vector
+        """
+        return self.get_query_embeddings([text])[0]
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Get embeddings for multiple texts, embedding only the cache misses in one batch.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            List of embedding vectors in the same order as the input texts
+        """
+        return self._get_embeddings(texts, query=False)
+
+    def get_query_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings for multiple query texts, cached apart from the document embeddings."""
+        return self._get_embeddings(texts, query=True)
+
+    def _get_embeddings(self, texts: List[str], query: bool) -> List[List[float]]:
+        if not texts:
+            return []
+
+        keys, cached, missing = self._split_cached(texts, query)
+        if missing:
+            embed = self.client.get_query_embeddings if query else self.client.get_embeddings
+            vectors = embed(list(missing.values()))
+            computed = dict(zip(missing.keys(), vectors))
+            self._store(computed)
+            cached.update(computed)
+        return self._finish(keys, cached, missing)
+
+    async def aget_embedding(self, text: str) -> List[float]:
+        """
+        Get embedding for a query text, from the cache when possible.
+
+        Args:
+            text: The text to embed
+
+        Returns:
+            List of floats representing the embedding vector
+        """
+        return (await self.aget_query_embeddings([text]))[0]
+
+    async def aget_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Get embeddings for multiple texts, embedding only the cache misses with the async client.
+
+        SQLite reads and writes run in a worker thread so they do not block the event loop.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            List of embedding vectors in the same order as the input texts
+        """
+        return await self._aget_embeddings(texts, query=False)
+
+    async def aget_query_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings for multiple query texts, cached apart from the document embeddings."""
+        return await self._aget_embeddings(texts, query=True)
+
+    async def _aget_embeddings(self, texts: List[str], query: bool) -> List[List[float]]:
+        if not texts:
+            return []
+
+        keys, cached, missing = await asyncio.to_thread(self._split_cached, texts, query)
+        if missing:
+            embed = self.client.aget_query_embeddings if query else self.client.aget_embeddings
+            vectors = await embed(list(missing.values()))
+            computed = dict(zip(missing.keys(), vectors))
+            await asyncio.to_thread(self._store, computed)
+            cached.update(computed)
+        return self._finish(keys, cached, missing)
+
+    def _split_cached(
+        self, texts: List[str], query: bool
+    ) -> Tuple[List[str], Dict[str, List[float]], Dict[str, str]]:
+        """Return the key of every text, the cached vectors, and the missing texts by key."""
+        keys = [self._key(text, query) for text in texts]
+        cached = self._lookup(list(dict.fromkeys(keys)))
+
+        # Embed each missing text once, even if it appears several times in the batch
+        missing: Dict[str, str] = {}
+        for key, text in zip(keys, texts):
+            if key not in cached and key not in missing:
+                missing[key] = text
+        return keys, cached, missing
+
+    def _finish(
+        self, keys: List[str], vectors: Dict[str, List[float]], missing: Dict[str, str]
+    ) -> List[List[float]]:
+        """Count hits and misses and return the vectors in input order."""
+        with self._lock:
+            self._misses += len(missing)
+            self._hits += len(keys) - len(missing)
+        return [list(vectors[key]) for key in keys]
+
+    def _lookup(self, keys: List[str]) -> Dict[str, List[float]]:
+        found = {}
+        now = time.time()
+        with self._lock:
+            # Stay below SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                ).fetchall()
+                for key, blob in rows:
+                    vector = array("f")
+                    vector.frombytes(blob)
+                    found[key] = vector.tolist()
+            if found:
+                self._conn.executemany(
+                    "UPDATE embeddings SET last_used = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+                self._conn.commit()
+        return found
+
+    def _store(self, vectors: Dict[str, List[float]]) -> None:
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.executemany(
+                "INSERT OR IGNORE INTO embeddings (key, vector, last_used) VALUES (?, ?, ?)",
+                [(key, array("f", vector).tobytes(), now) for key, vector in vectors.items()],
+            )
+            self._size += max(cursor.rowcount, 0)
+            if self._size > self.max_entries:
+                evicted = self._conn.execute(
+                    "DELETE FROM embeddings WHERE key IN "
+                    "(SELECT key FROM embeddings ORDER BY last_used LIMIT ?)",
+                    (self._size - self.max_entries,),
+                ).rowcount
+                self._size -= evicted
+                logger.info(f"Evicted {evicted} least recently used embeddings from {self.cache_path}")
+            self._conn.commit()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hit and miss statistics of the cache.
+
+        Returns:
+            Dictionary with hits, misses, hit rate and the number of cached vectors
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "entries": self._size,
+                "max_entries": self.max_entries,
+                "cache_path": str(self.cache_path),
+            }
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __repr__(self) -> str:
+        """Return string representation of the client."""
+        return f"CachedEmbeddingClient(client={self.client!r}, cache_path={self.cache_path})"
@@ -1,22 +1,112 @@
 from abc import ABC, abstractmethod
-from typing import List
+import asyncio
+from typing import Iterator, List, Optional, Sequence, TypeVar
+import math
+import weakref
+
+
+DEFAULT_EMBED_BATCH_SIZE = 64
+# Embedding requests a client keeps in flight at once on the async path
+DEFAULT_MAX_CONCURRENCY = 8
+
+T = TypeVar("T")
+
+
+def iter_batches(items: Sequence[T], batch_size: int) -> Iterator[Sequence[T]]:
+    """Yield consecutive slices of at most batch_size items."""
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be a positive integer, got {batch_size}")
+    for start in range(0, len(items), batch_size):
+        yield items[start:start + batch_size]
+
+
+def truncate_embedding(vector: List[float], dimensions: Optional[int]) -> List[float]:
+    """
+    Keep the first dimensions components of a Matryoshka embedding and L2-normalize the result.
+
+    Returns the vector unchanged when dimensions is None or not smaller than its length.
+    """
+    if dimensions is None or dimensions >= len(vector):
+        return vector
+    truncated = vector[:dimensions]
+    norm = math.sqrt(sum(value * value for value in truncated))
+    if norm == 0:
+        return truncated
+    return [value / norm for value in truncated]
+
+
+def check_embedding_dimension(model_name: str, expected: int, vector: List[float]) -> None:
+    """Raise if a vector returned by the model does not have the dimension the client announced."""
+    if len(vector) != expected:
+        raise ValueError(
+            f"{model_name} returned {len(vector)}-dimensional embeddings, expected {expected}. "
+            f"Check the model's entry in EMBEDDING_MODEL_SPECS."
+        )
+
+
+class ConcurrencyLimiter:
+    """
+    Bound the number of concurrent requests of a client.
+
+    asyncio semaphores belong to one event loop, so one semaphore is kept per
+    running loop and a client can be shared by code using different loops.
+    """
+
+    def __init__(self, limit: int = DEFAULT_MAX_CONCURRENCY):
+        if limit < 1:
+            raise ValueError(f"limit must be a positive integer, got {limit}")
+        self.limit = limit
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def __call__(self) -> asyncio.Semaphore:
+        """Return the semaphore of the running event loop."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.limit)
+        return semaphore
 
 
 class EmbeddingClientABC(ABC):
     """Abstract base class for embedding clients."""
-    
+
     @property
     @abstractmethod
     def dimension(self) -> int:
         """Return the dimension of the embeddings produced by this client."""
         pass
-    
+
     @abstractmethod
     def get_embedding(self, text: str) -> List[float]:
         """Get embedding for a query text."""
         pass
-    
+
     @abstractmethod
     def get_embeddings(self, texts: List[str]) -> List[List[float]]:
         """Get embeddings for multiple texts in batch."""
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    async def aget_embedding(self, text: str) -> List[float]:
+        """Get embedding for a query text without blocking the event loop."""
+        pass
+
+    @abstractmethod
+    async def aget_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings for multiple texts, sending the batches as concurrent requests."""
+        pass
+
+    def get_query_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Get embeddings for multiple query texts in batch.
+
+        ``get_embedding`` embeds a query and ``get_embeddings`` embeds documents.
+        Models that embed both the same way need not override this.
+        """
+        return self.get_embeddings(texts)
+
+    async def aget_query_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings for multiple query texts without blocking the event loop."""
+        return await self.aget_embeddings(texts)
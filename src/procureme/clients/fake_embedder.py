@@ -0,0 +1,88 @@
+from procureme.clients.embedder import EmbeddingClientABC
+from typing import Dict, List
+import hashlib
+import numpy as np
+
+
+DEFAULT_FAKE_DIMENSION = 384
+
+
+class FakeEmbeddingClient(EmbeddingClientABC):
+    """
+    Deterministic bag-of-words embedder for benchmarks and offline runs.
+
+    Every token maps to a fixed pseudo-random unit vector seeded from its hash,
+    and a text embeds to the normalized sum of its token vectors. Texts that
+    share words therefore land close to each other, which gives ANN indexes a
+    realistic clustered corpus, without any model or network call.
+    """
+
+    def __init__(self, dimension: int = DEFAULT_FAKE_DIMENSION):
+        """
+        Initialize the fake embedding client.
+
+        Args:
+            dimension: Dimension of the produced vectors
+        """
+        self._dimension = dimension
+        self.model_name = f"fake-bow-{dimension}"
+        self._token_vectors: Dict[str, np.ndarray] = {}
+
+    @property
+    def dimension(self) -> int:
+        """Return the dimension of the embeddings produced by this client."""
+        return self._dimension
+
+    def _token_vector(self, token: str) -> np.ndarray:
+        vector = self._token_vectors.get(token)
+        if vector is None:
+            seed = int.from_bytes(hashlib.blake2b(token.encode("utf-8"), digest_size=8).digest(), "little")
+            vector = np.random.default_rng(seed).standard_normal(self._dimension).astype(np.float32)
+            self._token_vectors[token] = vector
+        return vector
+
+    def embed_array(self, texts: List[str]) -> np.ndarray:
+        """Embed texts into a float32 matrix with one L2-normalized row per text."""
+        matrix = np.zeros((len(texts), self._dimension), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token in text.lower().split():
+                matrix[row] += self._token_vector(token)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+    def get_embedding(self, text: str) -> List[float]:
+        """
+        Get embedding for a query text.
+
+        Args:
+            text: The text to embed
+
+        Returns:
+            List of floats representing the embedding vector
+        """
+        return self.embed_array([text])[0].tolist()
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Get embeddings for multiple texts in batch.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            List of embedding vectors in the same order as the input texts
+        """
+        return self.embed_array(list(texts)).tolist()
+
+    async def aget_embedding(self, text: str) -> List[float]:
+        """Get embedding for a query text, computed locally without awaiting anything."""
+        return self.get_embedding(text)
+
+    async def aget_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings for multiple texts, computed locally without awaiting anything."""
+        return self.get_embeddings(texts)
+
+    def __repr__(self) -> str:
+        """Return string representation of the client."""
+        return f"FakeEmbeddingClient(dimension={self.dimension})"
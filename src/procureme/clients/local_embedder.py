@@ -0,0 +1,132 @@
+from procureme.clients.embedder import EmbeddingClientABC, check_embedding_dimension
+from procureme.configurations.aimodels import EmbeddingModelSelection, get_embedding_model_spec
+from procureme.embeeders import LocalRuntime, MixedbreadEmbedder
+from typing import List, Optional
+import asyncio
+import os
+import threading
+
+# mxbai-embed-large-v1 embeds queries with this instruction, documents without one
+MXBAI_QUERY_PROMPT = "Represent this sentence for searching relevant passages: "
+
+
+class LocalEmbeddingClient(EmbeddingClientABC):
+    """
+    CPU implementation of the EmbeddingClientABC interface on a local sentence-transformers model.
+
+    The model is loaded on the first embedding call, so building a client (and
+    asking for its dimension, which comes from the model config) is cheap.
+    Encoding runs under a lock because one model already uses every core; the
+    async methods run it in a worker thread to keep the event loop free.
+    """
+
+    def __init__(
+        self,
+        model_name: str = os.getenv("LOCAL_EMBEDDING_MODEL", EmbeddingModelSelection.MXBAI_LARGE),
+        runtime: LocalRuntime = os.getenv("LOCAL_EMBEDDING_RUNTIME", LocalRuntime.TORCH),
+        batch_size: Optional[int] = None,
+        dimensions: Optional[int] = None,
+        query_prompt: Optional[str] = None,
+        onnx_file_name: Optional[str] = None,
+        num_workers: int = 1,
+        max_tasks_per_worker: Optional[int] = None,
+    ):
+        """
+        Initialize the local embedding client without loading the model.
+
+        Args:
+            model_name: Hugging Face model id or local model directory
+            runtime: torch, onnx or onnx-int8 (dynamically quantized ONNX export)
+            batch_size: Number of texts per forward pass, the model's preferred batch size if None
+            dimensions: Truncate the vectors to this many dimensions (Matryoshka models only)
+            query_prompt: Instruction prepended to query texts, the mxbai prompt for mxbai models if None
+            onnx_file_name: ONNX file inside the model repository, overrides the runtime's default
+            num_workers: Number of encode processes each holding the model, for bulk embedding
+            max_tasks_per_worker: Restart an encode process after this many chunks to cap its memory
+        """
+        self.model_name = str(model_name)
+        self.spec = get_embedding_model_spec(self.model_name)
+        self.batch_size = batch_size or (self.spec.batch_size if self.spec else 32)
+        self.dimensions = dimensions
+        if query_prompt is None and "mxbai-embed" in self.model_name:
+            query_prompt = MXBAI_QUERY_PROMPT
+        self.query_prompt = query_prompt
+        self._embedder = MixedbreadEmbedder(
+            model_name=self.model_name,
+            truncate_dim=dimensions,
+            runtime=LocalRuntime(runtime),
+            batch_size=self.batch_size,
+            onnx_file_name=onnx_file_name,
+            num_workers=num_workers,
+            max_tasks_per_worker=max_tasks_per_worker,
+        )
+        self._encode_lock = threading.Lock()
+        self._dimension_verified = False
+
+    @property
+    def dimension(self) -> int:
+        """Return the dimension of the embeddings, read from the model config."""
+        return self._embedder.dimensions
+
+    def _encode(self, texts: List[str], prompt: Optional[str] = None) -> List[List[float]]:
+        with self._encode_lock:
+            embeddings = self._embedder.generate_embeddings(texts, prompt=prompt).tolist()
+        if not self._dimension_verified:
+            check_embedding_dimension(self.model_name, self.dimension, embeddings[0])
+            self._dimension_verified = True
+        return embeddings
+
+    def get_embedding(self, text: str) -> List[float]:
+        """
+        Get embedding for a query text.
+
+        Args:
+            text: The text to embed
+
+        Returns:
+            List of floats representing the embedding vector
+        """
+        return self._encode([text], prompt=self.query_prompt)[0]
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Get embeddings for multiple document texts in batch, without the query prompt.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            List of embedding vectors in the same order as the input texts
+        """
+        if not texts:
+            return []
+        return self._encode(list(texts))
+
+    def get_query_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings for multiple query texts, each with the query prompt."""
+        if not texts:
+            return []
+        return self._encode(list(texts), prompt=self.query_prompt)
+
+    async def aget_embedding(self, text: str) -> List[float]:
+        """Get embedding for a query text, encoded in a worker thread."""
+        return await asyncio.to_thread(self.get_embedding, text)
+
+    async def aget_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings for multiple texts, encoded in a worker thread."""
+        return await asyncio.to_thread(self.get_embeddings, texts)
+
+    async def aget_query_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """Get embeddings for multiple query texts, encoded in a worker thread."""
+        return await asyncio.to_thread(self.get_query_embeddings, texts)
+
+    def close(self) -> None:
+        """Stop the encode processes, if any were started."""
+        self._embedder.close()
+
+    def __repr__(self) -> str:
+        """Return string representation of the client."""
+        return (
+            f"LocalEmbeddingClient(model_name={self.model_name}, runtime={self._embedder.runtime}, "
+            f"batch_size={self.batch_size}, num_workers={self._embedder.num_workers})"
+        )
@@ -1,86 +1,228 @@
-from procureme.clients.embedder import EmbeddingClientABC
-from typing import Any, Dict, List, Optional
-from llama_index.embeddings.ollama import OllamaEmbedding
+from procureme.clients.embedder import (
+    DEFAULT_EMBED_BATCH_SIZE,
+    DEFAULT_MAX_CONCURRENCY,
+    ConcurrencyLimiter,
+    EmbeddingClientABC,
+    check_embedding_dimension,
+    iter_batches,
+    truncate_embedding,
+)
+from procureme.configurations.aimodels import EmbeddingModelSelection, get_embedding_model_spec
+from typing import Any, Dict, List, Optional, Sequence, Union
+import asyncio
+import httpx
+import logging
 import os
+import weakref
+
+logger = logging.getLogger(__name__)
+
+# How long Ollama keeps a model loaded after the last request, long enough to span a batch job
+DEFAULT_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
+
 
 class OllamaEmbeddingClient(EmbeddingClientABC):
-    """Ollama implementation of the EmbeddingClientABC interface."""
-    
+    """
+    Ollama implementation of the EmbeddingClientABC interface.
+
+    Talks to the batch ``/api/embed`` endpoint over a persistent connection
+    pool, one request per ``batch_size`` texts, and asks Ollama to keep the
+    model loaded for ``keep_alive`` so batch jobs do not pay a reload between
+    requests. Call warm_up() at startup to load the model before the first
+    real request.
+    """
+
     def __init__(
         self,
-        model_name: str = "nomic-embed-text:v1.5",
+        model_name: str = EmbeddingModelSelection.NOMIC,
         base_url: str = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"),
         additional_kwargs: Optional[Dict[str, Any]] = None,
-        timeout: int = 60
+        timeout: int = 60,
+        batch_size: Optional[int] = None,
+        dimensions: Optional[int] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        keep_alive: Union[str, int] = DEFAULT_KEEP_ALIVE,
     ):
         """
         Initialize the Ollama embedding client.
-        
+
         Args:
             model_name: Name of the embedding model to use (default: nomic-embed-text:v1.5)
             base_url: Base URL for the Ollama API (default: http://localhost:11434)
-            additional_kwargs: Additional keyword arguments to pass to Ollama
+            additional_kwargs: Model options sent with every request
             timeout: Timeout for API requests in seconds
+            batch_size: Maximum number of texts sent to /api/embed in one request,
+                the model's preferred batch size if None
+            dimensions: Truncate the vectors to this many dimensions and re-normalize them,
+                only meaningful for Matryoshka models such as nomic-embed-text v1.5
+            max_concurrency: Maximum number of /api/embed requests in flight on the async path,
+                also the size of the connection pool
+            keep_alive: How long Ollama keeps the model loaded after a request, e.g. "30m",
+                or -1 to keep it loaded indefinitely
         """
         self.model_name = model_name
+        self.spec = get_embedding_model_spec(model_name)
         self.base_url = base_url
         self.additional_kwargs = additional_kwargs or {"mirostat": 0}
         self.timeout = timeout
-        
-        # Initialize the underlying client
-        self._client = OllamaEmbedding(
-            model_name=self.model_name,
-            base_url=self.base_url,
-            ollama_additional_kwargs=self.additional_kwargs,
-            timeout=self.timeout
+        self.batch_size = batch_size or (self.spec.batch_size if self.spec else DEFAULT_EMBED_BATCH_SIZE)
+        self.dimensions = dimensions
+        self.keep_alive = keep_alive
+        self._limiter = ConcurrencyLimiter(max_concurrency)
+        self._limits = httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency)
+
+        # Initialize the underlying connection pools, the async one per event loop
+        self._client = httpx.Client(base_url=self.base_url, timeout=self.timeout, limits=self._limits)
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
         )
-        
-        # Calculate dimension with a test query
-        self._dimension = len(self._client.get_query_embedding("Test embedding dimension"))
-    
+
+        # Registered models need no probe request, the size is checked on the first real response
+        self._dimension = dimensions or (self.spec.dimension if self.spec else None)
+        self._dimension_verified = False
+
+    def _payload(self, texts: Sequence[str]) -> Dict[str, Any]:
+        return {
+            "model": self.model_name,
+            "input": list(texts),
+            "options": self.additional_kwargs,
+            "keep_alive": self.keep_alive,
+        }
+
+    def _parse(self, response: httpx.Response) -> List[List[float]]:
+        response.raise_for_status()
+        return [truncate_embedding(embedding, self.dimensions) for embedding in response.json()["embeddings"]]
+
+    def _embed_batch(self, batch: Sequence[str]) -> List[List[float]]:
+        return self._parse(self._client.post("/api/embed", json=self._payload(batch)))
+
+    def _verify_dimension(self, vector: List[float]) -> None:
+        if not self._dimension_verified:
+            check_embedding_dimension(self.model_name, self.dimension, vector)
+            self._dimension_verified = True
+
     @property
     def dimension(self) -> int:
         """Return the dimension of the embeddings produced by this client."""
+        if self._dimension is None:
+            # Models missing from the registry are probed once, on first use
+            self._dimension = len(self._embed_batch(["Test embedding dimension"])[0])
+            self._dimension_verified = True
         return self._dimension
-    
+
+    def warm_up(self) -> None:
+        """Load the model into Ollama and check its dimension, so the first real request is not a cold start."""
+        embedding = self._embed_batch(["warm up"])[0]
+        if self._dimension is None:
+            self._dimension = len(embedding)
+        self._verify_dimension(embedding)
+        logger.info(f"Ollama model {self.model_name} loaded, kept alive for {self.keep_alive}")
+
     def get_embedding(self, text: str) -> List[float]:
         """
         Get embedding for a query text.
-        
+
         Args:
             text: The text to embed
-            
+
         Returns:
             List of floats representing the embedding vector
         """
-        embedding = self._client.get_query_embedding(text)
+        embedding = self._embed_batch([text])[0]
+        self._verify_dimension(embedding)
         return embedding
 
-    
+
     def get_embeddings(self, texts: List[str]) -> List[List[float]]:
         """
         Get embeddings for multiple texts in batch.
-        
+
+        The texts are split into chunks of ``batch_size`` and each chunk is
+        sent to Ollama's ``/api/embed`` endpoint in a single request.
+
         Args:
             texts: List of texts to embed
-            
+
         Returns:
-            List of embedding vectors
+            List of embedding vectors in the same order as the input texts
         """
+        if not texts:
+            return []
         embeddings = []
-        for text in texts:
-            embedding = self.get_text_embedding(text)
-            embeddings.append(embedding)
+        for batch in iter_batches(texts, self.batch_size):
+            embeddings.extend(self._embed_batch(batch))
+        self._verify_dimension(embeddings[0])
+        return embeddings
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        # Pooled connections belong to the loop that opened them
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = self._async_clients[loop] = httpx.AsyncClient(
+                base_url=self.base_url, timeout=self.timeout, limits=self._limits
+            )
+        return client
+
+    async def _aembed_batch(self, batch: Sequence[str]) -> List[List[float]]:
+        async with self._limiter():
+            response = await self._get_async_client().post("/api/embed", json=self._payload(batch))
+        return self._parse(response)
+
+    async def aget_embedding(self, text: str) -> List[float]:
+        """
+        Get embedding for a query text with the async client.
+
+        Args:
+            text: The text to embed
+
+        Returns:
+            List of floats representing the embedding vector
+        """
+        embedding = (await self._aembed_batch([text]))[0]
+        self._verify_dimension(embedding)
+        return embedding
+
+    async def aget_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Get embeddings for multiple texts, sending the batches as concurrent requests.
+
+        At most ``max_concurrency`` requests are in flight at once.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            List of embedding vectors in the same order as the input texts
+        """
+        if not texts:
+            return []
+        batches = await asyncio.gather(
+            *(self._aembed_batch(batch) for batch in iter_batches(texts, self.batch_size))
+        )
+        embeddings = [embedding for batch in batches for embedding in batch]
+        self._verify_dimension(embeddings[0])
         return embeddings
-    
+
+    def close(self) -> None:
+        """Close the synchronous connection pool."""
+        self._client.close()
+
+    async def aclose(self) -> None:
+        """Close the connection pool of the running event loop."""
+        client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
     def __repr__(self) -> str:
         """Return string representation of the client."""
         return f"OllamaEmbeddingClient(model_name={self.model_name}, dimension={self.dimension})"
-    
+
 
 if __name__ == "__main__":
     client = OllamaEmbeddingClient()
+    client.warm_up()
     print(client.dimension)
     query = "I want to buy a keyboard and mouse."
     embedding = client.get_embedding(query)
-    print(embedding)
\ No newline at end of file
+    print(embedding)
@@ -1,7 +1,16 @@
-from procureme.clients.embedder import EmbeddingClientABC
-from typing import List
-from openai import OpenAI
-from procureme.configurations.aimodels import EmbeddingModelSelection
+from procureme.clients.embedder import (
+    DEFAULT_EMBED_BATCH_SIZE,
+    DEFAULT_MAX_CONCURRENCY,
+    ConcurrencyLimiter,
+    EmbeddingClientABC,
+    check_embedding_dimension,
+    iter_batches,
+)
+from typing import Any, Dict, List, Optional
+from openai import AsyncOpenAI, OpenAI
+import asyncio
+import weakref
+from procureme.configurations.aimodels import EmbeddingModelSelection, get_embedding_model_spec
 from procureme.configurations.app_configs import Settings
 
 
@@ -11,29 +20,63 @@ class OpenAIEmbeddingClient(EmbeddingClientABC):
     def __init__(
         self,
         model_name: str = EmbeddingModelSelection.EMBED_SMALL,
+        batch_size: Optional[int] = None,
+        dimensions: Optional[int] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ):
         """
         Initialize the Ollama embedding client.
         
         Args:
             model_name: Name of the embedding model to use (default: text-embedding-3-small)
+            batch_size: Maximum number of texts sent in one embeddings request,
+                the model's preferred batch size if None
+            dimensions: Ask the API for shortened vectors of this size, supported by
+                the text-embedding-3 models; None keeps the full size
+            max_concurrency: Maximum number of embeddings requests in flight on the async path
         """
+        self.spec = get_embedding_model_spec(model_name)
+        if dimensions is not None and self.spec is not None and not self.spec.supports_dimensions:
+            raise ValueError(f"{model_name} does not support reduced dimensions")
         self.model_name = model_name
+        self.batch_size = batch_size or (self.spec.batch_size if self.spec else DEFAULT_EMBED_BATCH_SIZE)
+        self.dimensions = dimensions
         self.setting = Settings()
 
         # Initialize the underlying client
         self._client = OpenAI(api_key=self.setting.OPENAI_API_KEY)
+        # One async client per event loop, its connection pool belongs to the loop that opened it
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._limiter = ConcurrencyLimiter(max_concurrency)
         
-        # Calculate dimension with a test query
-        self._dimension = self._set_embedding_dimension()
+        # Registered models need no probe request, the size is checked on the first real response
+        self._dimension = dimensions or (self.spec.dimension if self.spec else None)
+        self._dimension_verified = False
     
+    def _request_kwargs(self) -> Dict[str, Any]:
+        kwargs = {"model": self.model_name}
+        if self.dimensions is not None:
+            kwargs["dimensions"] = self.dimensions
+        return kwargs
+
     def _set_embedding_dimension(self):
-        response = self._client.embeddings.create(input="Test embedding dimension", model=self.model_name)
+        response = self._client.embeddings.create(input="Test embedding dimension", **self._request_kwargs())
         return len(response.data[0].embedding)
+
+    def _verify_dimension(self, vector: List[float]) -> None:
+        if not self._dimension_verified:
+            check_embedding_dimension(self.model_name, self.dimension, vector)
+            self._dimension_verified = True
     
     @property
     def dimension(self) -> int:
         """Return the dimension of the embeddings produced by this client."""
+        if self._dimension is None:
+            # Models missing from the registry are probed once, on first use
+            self._dimension = self._set_embedding_dimension()
+            self._dimension_verified = True
         return self._dimension
     
     def get_embedding(self, text: str) -> List[float]:
@@ -46,8 +89,10 @@ class OpenAIEmbeddingClient(EmbeddingClientABC):
         Returns:
             List of floats representing the embedding vector
         """
-        response = self._client.embeddings.create(input=text, model=self.model_name)
-        return response.data[0].embedding
+        response = self._client.embeddings.create(input=text, **self._request_kwargs())
+        embedding = response.data[0].embedding
+        self._verify_dimension(embedding)
+        return embedding
 
     
     def get_embeddings(self, texts: List[str]) -> List[List[float]]:
@@ -58,12 +103,63 @@ class OpenAIEmbeddingClient(EmbeddingClientABC):
             texts: List of texts to embed
             
         Returns:
-            List of embedding vectors
+            List of embedding vectors in the same order as the input texts
         """
         embeddings = []
-        for text in texts:
-            embedding = self.get_text_embedding(text)
-            embeddings.append(embedding)
+        for batch in iter_batches(texts, self.batch_size):
+            response = self._client.embeddings.create(input=list(batch), **self._request_kwargs())
+            # The API reports the input position of every vector, keep the caller's order
+            ordered = sorted(response.data, key=lambda item: item.index)
+            embeddings.extend(item.embedding for item in ordered)
+        if embeddings:
+            self._verify_dimension(embeddings[0])
+        return embeddings
+
+    def _get_async_client(self) -> AsyncOpenAI:
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = self._async_clients[loop] = AsyncOpenAI(api_key=self.setting.OPENAI_API_KEY)
+        return client
+
+    async def _aembed_batch(self, batch: List[str]) -> List[List[float]]:
+        async with self._limiter():
+            response = await self._get_async_client().embeddings.create(input=batch, **self._request_kwargs())
+        ordered = sorted(response.data, key=lambda item: item.index)
+        return [item.embedding for item in ordered]
+
+    async def aget_embedding(self, text: str) -> List[float]:
+        """
+        Get embedding for a query text with the async client.
+        
+        Args:
+            text: The text to embed
+            
+        Returns:
+            List of floats representing the embedding vector
+        """
+        embedding = (await self._aembed_batch([text]))[0]
+        self._verify_dimension(embedding)
+        return embedding
+
+    async def aget_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Get embeddings for multiple texts, sending the batches as concurrent requests.
+
+        At most ``max_concurrency`` requests are in flight at once.
+        
+        Args:
+            texts: List of texts to embed
+            
+        Returns:
+            List of embedding vectors in the same order as the input texts
+        """
+        batches = await asyncio.gather(
+            *(self._aembed_batch(list(batch)) for batch in iter_batches(texts, self.batch_size))
+        )
+        embeddings = [embedding for batch in batches for embedding in batch]
+        if embeddings:
+            self._verify_dimension(embeddings[0])
         return embeddings
     
     def __repr__(self) -> str:
@@ -1,4 +1,6 @@
+from dataclasses import dataclass
 from enum import StrEnum
+from typing import Dict, Optional
 
 class ChatModelSelection(StrEnum):
     GEMMA3 = "gemma3:4b"
@@ -8,9 +10,52 @@ class ChatModelSelection(StrEnum):
     LLAMA31 = "llama3.1:latest"
 
 
+@dataclass(frozen=True)
+class EmbeddingModelSpec:
+    """Static properties of an embedding model, known without calling it."""
+    dimension: int
+    max_input_tokens: int
+    batch_size: int
+    supports_dimensions: bool = False
+
+
 class EmbeddingModelSelection(StrEnum):
     EMBED_SMALL = "text-embedding-3-small"
     EMBED_LARGE = "text-embedding-3-large"
     EMBED_ADA = "text-embedding-ada-002"
     NOMIC = "nomic-embed-text:v1.5"
+    MXBAI_LARGE = "mixedbread-ai/mxbai-embed-large-v1"
+
+    @property
+    def spec(self) -> EmbeddingModelSpec:
+        """Dimension, input limit and preferred batch size of the model."""
+        return EMBEDDING_MODEL_SPECS[self]
+
+
+EMBEDDING_MODEL_SPECS: Dict[EmbeddingModelSelection, EmbeddingModelSpec] = {
+    EmbeddingModelSelection.EMBED_SMALL: EmbeddingModelSpec(
+        dimension=1536, max_input_tokens=8191, batch_size=256, supports_dimensions=True
+    ),
+    EmbeddingModelSelection.EMBED_LARGE: EmbeddingModelSpec(
+        dimension=3072, max_input_tokens=8191, batch_size=256, supports_dimensions=True
+    ),
+    EmbeddingModelSelection.EMBED_ADA: EmbeddingModelSpec(
+        dimension=1536, max_input_tokens=8191, batch_size=256
+    ),
+    # Matryoshka-trained, vectors can be truncated client-side
+    EmbeddingModelSelection.NOMIC: EmbeddingModelSpec(
+        dimension=768, max_input_tokens=8192, batch_size=64, supports_dimensions=True
+    ),
+    # Runs locally on CPU, small batches keep the padded forward pass cheap
+    EmbeddingModelSelection.MXBAI_LARGE: EmbeddingModelSpec(
+        dimension=1024, max_input_tokens=512, batch_size=32, supports_dimensions=True
+    ),
+}
+
 
+def get_embedding_model_spec(model_name: str) -> Optional[EmbeddingModelSpec]:
+    """Return the spec of a registered embedding model, None for models not in the registry."""
+    try:
+        return EmbeddingModelSelection(model_name).spec
+    except ValueError:
+        return None
@@ -1,19 +1,131 @@
-from typing import List
+from enum import StrEnum
+from pathlib import Path
+from typing import List, Optional
+import json
 import logging
-from sentence_transformers import SentenceTransformer
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Dynamically quantized ONNX export shipped in the model repositories of sentence-transformers models
+DEFAULT_ONNX_INT8_FILE = "onnx/model_quantized.onnx"
+
+
+class LocalRuntime(StrEnum):
+    TORCH = "torch"
+    ONNX = "onnx"
+    ONNX_INT8 = "onnx-int8"
+
 
 class MixedbreadEmbedder:
+    """
+    Sentence-transformers embedder that loads its model on first use.
+
+    The dimension is read from the model config, so it is known without
+    loading the weights. The model can run on PyTorch, ONNX Runtime, or an
+    int8-quantized ONNX export for faster CPU inference. With num_workers > 1
+    the texts are encoded by a pool of processes that each hold the model.
+    """
+
     def __init__(
-        self, model_name="mixedbread-ai/mxbai-embed-large-v1", truncate_dim=1024
+        self,
+        model_name="mixedbread-ai/mxbai-embed-large-v1",
+        truncate_dim=1024,
+        runtime: LocalRuntime = LocalRuntime.TORCH,
+        batch_size: int = 32,
+        onnx_file_name: Optional[str] = None,
+        num_workers: int = 1,
+        max_tasks_per_worker: Optional[int] = None,
     ):
-        self.dimensions = truncate_dim
-        self.model = SentenceTransformer(model_name, truncate_dim=truncate_dim)
-        logger.info(f"Model loaded from {model_name}")
+        """
+        Initialize the embedder without loading the model.
+
+        Args:
+            model_name: Hugging Face model id or local model directory
+            truncate_dim: Keep the first truncate_dim dimensions (Matryoshka), None keeps all
+            runtime: Inference runtime of the model
+            batch_size: Number of sentences encoded per forward pass
+            onnx_file_name: ONNX file inside the model repository, defaults to the
+                quantized export for ONNX_INT8 and to the plain export for ONNX
+            num_workers: Number of encode processes, 1 encodes in this process
+            max_tasks_per_worker: Restart an encode process after this many chunks to cap its memory
+        """
+        self.model_name = model_name
+        self.truncate_dim = truncate_dim
+        self.runtime = LocalRuntime(runtime)
+        self.batch_size = batch_size
+        self.onnx_file_name = onnx_file_name
+        self.num_workers = num_workers
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self._model = None
+        self._pool = None
+        self._dimension: Optional[int] = None
+        self._load_lock = threading.Lock()
+
+    @property
+    def model(self):
+        """The SentenceTransformer model, loaded on first access."""
+        if self._model is None:
+            with self._load_lock:
+                if self._model is None:
+                    self._model = self._load_model()
+        return self._model
+
+    def _load_model(self):
+        from sentence_transformers import SentenceTransformer
 
-    def generate_embeddings(self, docs: List[str]) -> List[List[float]]:
+        kwargs = {"truncate_dim": self.truncate_dim}
+        if self.runtime != LocalRuntime.TORCH:
+            kwargs["backend"] = "onnx"
+            file_name = self.onnx_file_name
+            if file_name is None and self.runtime == LocalRuntime.ONNX_INT8:
+                file_name = DEFAULT_ONNX_INT8_FILE
+            if file_name is not None:
+                kwargs["model_kwargs"] = {"file_name": file_name}
+        model = SentenceTransformer(self.model_name, **kwargs)
+        logger.info(f"Model loaded from {self.model_name} with the {self.runtime} runtime")
+        return model
+
+    def _get_pool(self):
+        """The encode pool, started on first use."""
+        if self._pool is None:
+            from procureme.encode_pool import EncodePool
+
+            with self._load_lock:
+                if self._pool is None:
+                    self._pool = EncodePool(
+                        embedder_config={
+                            "model_name": self.model_name,
+                            "truncate_dim": self.truncate_dim,
+                            "runtime": self.runtime,
+                            "batch_size": self.batch_size,
+                            "onnx_file_name": self.onnx_file_name,
+                        },
+                        num_workers=self.num_workers,
+                        chunk_size=max(self.batch_size, 1) * 8,
+                        max_tasks_per_worker=self.max_tasks_per_worker,
+                    )
+        return self._pool
+
+    def _config_dimension(self) -> int:
+        """Read the hidden size from the model config without loading the weights."""
+        config_path = Path(self.model_name) / "config.json"
+        if config_path.exists():
+            with open(config_path, "r", encoding="utf-8") as f:
+                return json.load(f)["hidden_size"]
+        from transformers import AutoConfig
+
+        return AutoConfig.from_pretrained(self.model_name).hidden_size
+
+    @property
+    def dimensions(self) -> int:
+        """Dimension of the produced embeddings, after truncation."""
+        if self._dimension is None:
+            hidden_size = self._config_dimension()
+            self._dimension = min(hidden_size, self.truncate_dim) if self.truncate_dim else hidden_size
+        return self._dimension
+
+    def generate_embeddings(self, docs: List[str], prompt: Optional[str] = None) -> List[List[float]]:
         if not isinstance(docs, list):
             raise TypeError("Input must be a list of sentences.")
 
@@ -23,9 +135,17 @@ class MixedbreadEmbedder:
         logger.info(
             f"Generating embeddings for {len(docs)} sentences with {self.dimensions} dimensions."
         )
-        embeddings = self.model.encode(docs)
+        if self.num_workers > 1:
+            return self._get_pool().encode(docs, prompt=prompt)
+        embeddings = self.model.encode(docs, batch_size=self.batch_size, prompt=prompt)
         return embeddings
 
+    def close(self) -> None:
+        """Stop the encode processes, if any were started."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
     def __len__(self):
         return self.dimensions
 
@@ -0,0 +1,151 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+import logging
+import math
+import multiprocessing
+import os
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Texts per task sent to a worker, bounds the activations a worker holds at once
+DEFAULT_CHUNK_SIZE = 256
+
+# The model of the current worker process, set by _init_worker
+_worker_embedder = None
+
+
+def _init_worker(embedder_config: Dict[str, Any], num_threads: int) -> None:
+    """Load the model once per worker and give it its share of the cores."""
+    global _worker_embedder
+    from procureme.embeeders import MixedbreadEmbedder
+
+    try:
+        import torch
+
+        torch.set_num_threads(num_threads)
+    except ImportError:
+        pass
+    _worker_embedder = MixedbreadEmbedder(**embedder_config)
+    _worker_embedder.model
+    logger.info(f"Encode worker {os.getpid()} ready with {num_threads} threads")
+
+
+def _encode_chunk(task: Tuple[List[str], Optional[str]]) -> np.ndarray:
+    texts, prompt = task
+    return np.asarray(_worker_embedder.generate_embeddings(texts, prompt=prompt), dtype=np.float32)
+
+
+class EncodePool:
+    """
+    Pool of worker processes that each hold a copy of a local embedding model.
+
+    Texts are split into chunks that are encoded in parallel and streamed back
+    in input order. At most two chunks per worker are in flight, so neither the
+    parent nor the result queue grows with the input, and the chunk size bounds
+    what a worker holds at once. Workers are started with spawn, because the
+    model runtimes are not fork-safe, and split the cores evenly between them.
+    A worker that cannot load the model breaks the pool, so the call fails
+    with BrokenProcessPool instead of waiting on workers that keep respawning.
+    """
+
+    def __init__(
+        self,
+        embedder_config: Dict[str, Any],
+        num_workers: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_tasks_per_worker: Optional[int] = None,
+    ):
+        """
+        Initialize the pool without starting the workers.
+
+        Args:
+            embedder_config: Keyword arguments of the MixedbreadEmbedder built in every worker
+            num_workers: Number of worker processes
+            chunk_size: Maximum number of texts sent to a worker in one task
+            max_tasks_per_worker: Restart a worker after this many tasks to release
+                the memory it accumulated, None keeps workers for the pool's lifetime
+        """
+        if num_workers < 1:
+            raise ValueError(f"num_workers must be at least 1, got {num_workers}")
+        self.embedder_config = embedder_config
+        self.num_workers = num_workers
+        self.chunk_size = chunk_size
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self._pool = None
+
+    def _ensure_pool(self):
+        if self._pool is None:
+            num_threads = max(1, (os.cpu_count() or 1) // self.num_workers)
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.num_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.embedder_config, num_threads),
+                max_tasks_per_child=self.max_tasks_per_worker,
+            )
+            logger.info(f"Started {self.num_workers} encode workers")
+        return self._pool
+
+    def _shard_size(self, num_texts: int) -> int:
+        # Small inputs are still spread over every worker
+        return max(1, min(self.chunk_size, math.ceil(num_texts / self.num_workers)))
+
+    def imap(self, texts: List[str], prompt: Optional[str] = None) -> Iterator[np.ndarray]:
+        """
+        Encode texts in parallel, yielding one float32 matrix per chunk in input order.
+
+        Args:
+            texts: Texts to encode
+            prompt: Instruction prepended to every text
+
+        Returns:
+            Iterator of embedding matrices whose rows follow the input order
+        """
+        pool = self._ensure_pool()
+        shard_size = self._shard_size(len(texts))
+        max_in_flight = 2 * self.num_workers
+        pending: Deque = deque()
+        try:
+            for start in range(0, len(texts), shard_size):
+                pending.append(pool.submit(_encode_chunk, (texts[start:start + shard_size], prompt)))
+                if len(pending) >= max_in_flight:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        except BrokenProcessPool:
+            # A broken pool accepts no more work, the next call starts a fresh one
+            logger.error("An encode worker died or could not load the model, stopping the pool")
+            pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+            raise
+
+    def encode(self, texts: List[str], prompt: Optional[str] = None) -> np.ndarray:
+        """
+        Encode texts in parallel into one float32 matrix.
+
+        Args:
+            texts: Texts to encode
+            prompt: Instruction prepended to every text
+
+        Returns:
+            Embedding matrix with one row per input text
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.concatenate(list(self.imap(texts, prompt)))
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def __enter__(self) -> "EncodePool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -1,6 +1,7 @@
 from uuid import uuid4
+from datetime import date
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Optional
 
 class ParsedDocumentParts(BaseModel):
     id_: str
@@ -13,3 +14,12 @@ class ParsedDocument(BaseModel):
     file_name: str
     text: str
     parts: List[ParsedDocumentParts]
+
+
+class ContractChunkMetadata(BaseModel):
+    """Contract level metadata stored on every chunk of the contract."""
+    cwid: str
+    supplier_name: Optional[str] = None
+    contract_type: Optional[str] = None
+    purchase_date: Optional[date] = None
+    expiry_date: Optional[date] = None
@@ -0,0 +1,251 @@
+import asyncio
+import logging
+import pyarrow as pa
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Mapping, Optional, Union
+from procureme.models.contract_model import ParsedDocument
+from procureme.vectordb.fusion import deduplicate_across_queries
+from procureme.vectordb.interface import VectorDBABC
+from procureme.vectordb.lance_vectordb import SearchMode, SearchResults, hits_to_arrow
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TABLE_TIMEOUT = 5.0
+DEFAULT_WORKERS_PER_TABLE = 4
+FEDERATED_SCORE = "_federated_score"
+FEDERATED_FIELDS = (pa.field(FEDERATED_SCORE, pa.float64()), pa.field("_table", pa.string()))
+
+
+def normalize_scores(hits: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Add a min-max normalized ``_federated_score`` in [0, 1] to the hits of one table, higher is better.
+
+    The raw score is ``_relevance_score`` for hybrid hits, ``_score`` for
+    full-text hits and the negated ``_distance`` for vector hits.
+    """
+    if not hits:
+        return hits
+    if "_relevance_score" in hits[0]:
+        raw = [hit["_relevance_score"] for hit in hits]
+    elif "_score" in hits[0]:
+        raw = [hit["_score"] for hit in hits]
+    else:
+        raw = [-hit["_distance"] for hit in hits]
+
+    low, high = min(raw), max(raw)
+    for hit, value in zip(hits, raw):
+        hit[FEDERATED_SCORE] = (value - low) / (high - low) if high > low else 1.0
+    return hits
+
+
+def merge_results(results: Mapping[str, List[Dict[str, Any]]], top_k: int, key: str = "chunk_id") -> List[Dict[str, Any]]:
+    """
+    Merge the normalized hits of several tables, keeping the best scored copy of every chunk.
+
+    Args:
+        results: Hits with ``_federated_score`` by table name
+        top_k: The number of results to return
+        key: Field identifying the same chunk across tables
+
+    Returns:
+        Hits with a ``_table`` field naming the table they came from, best first
+    """
+    best: Dict[Any, Dict[str, Any]] = {}
+    for table_name, hits in results.items():
+        for hit in hits:
+            current = best.get(hit[key])
+            if current is None or hit[FEDERATED_SCORE] > current[FEDERATED_SCORE]:
+                best[hit[key]] = {**hit, "_table": table_name}
+    return sorted(best.values(), key=lambda hit: hit[FEDERATED_SCORE], reverse=True)[:top_k]
+
+
+class FederatedVectorStore(VectorDBABC):
+    """
+    Fan one question out to several vector stores and merge their results.
+
+    Every table is searched concurrently with its own embedding client. Scores
+    are min-max normalized per table before merging, because distances of
+    different embedding models are not comparable. A table that fails or does
+    not answer within the timeout is left out of the merged results. Each
+    table has its own worker threads, so a hung table only ties up its own.
+    """
+
+    def __init__(
+        self,
+        stores: Mapping[str, VectorDBABC],
+        timeout: float = DEFAULT_TABLE_TIMEOUT,
+        workers_per_table: int = DEFAULT_WORKERS_PER_TABLE,
+    ):
+        """
+        Initialize the federated vector store.
+
+        Args:
+            stores: Vector stores by table name, the first one is the primary table
+            timeout: Seconds to wait for each table before leaving it out
+            workers_per_table: Concurrent searches per table, a running search cannot be cancelled
+                so searches past its timeout keep a worker until they return
+        """
+        if not stores:
+            raise ValueError("FederatedVectorStore needs at least one store")
+        self.stores = dict(stores)
+        self.timeout = timeout
+        self._executors = {
+            table_name: ThreadPoolExecutor(max_workers=workers_per_table, thread_name_prefix=f"federated-{table_name}")
+            for table_name in self.stores
+        }
+
+    @property
+    def dimension(self) -> int:
+        """Get the vector dimension of the primary table."""
+        return next(iter(self.stores.values())).dimension
+
+    def save(self) -> None:
+        """Save every table."""
+        for store in self.stores.values():
+            store.save()
+
+    def load(self) -> None:
+        """Load every table."""
+        for store in self.stores.values():
+            store.load()
+
+    def refresh(self) -> bool:
+        """
+        Check out the latest version of every table.
+
+        Returns:
+            True if any table moved to a newer version
+        """
+        refreshed = [store.refresh() for store in self.stores.values() if hasattr(store, "refresh")]
+        return any(refreshed)
+
+    def _gather(self, method: str, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """Call method on every store concurrently and collect the answers that arrived in time."""
+        futures = {
+            self._executors[table_name].submit(getattr(store, method), *args, **kwargs): table_name
+            for table_name, store in self.stores.items()
+        }
+        done, not_done = wait(futures, timeout=self.timeout)
+        for future in not_done:
+            # Only drops the call if it is still queued behind the table's busy workers
+            future.cancel()
+            logger.warning(f"Table {futures[future]} did not answer within {self.timeout}s, skipping it")
+
+        answers = {}
+        for future in done:
+            table_name = futures[future]
+            try:
+                answers[table_name] = future.result()
+            except Exception as e:
+                logger.error(f"Search on table {table_name} failed: {e}")
+        if not answers:
+            raise RuntimeError(f"No table answered in time: {list(self.stores)}")
+        return answers
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 20,
+        mode: SearchMode = SearchMode.VECTOR,
+        where: Optional[str] = None,
+        as_arrow: bool = False,
+    ) -> SearchResults:
+        """
+        Search all tables concurrently and merge the results.
+
+        Args:
+            query: The query text to search for
+            top_k: The number of results to return
+            mode: Search mode used on every table
+            where: SQL filter applied on every table
+            as_arrow: Return a pyarrow Table instead of a list of dicts
+
+        Returns:
+            Merged hits with ``_federated_score`` and ``_table``, best first
+        """
+        answers = self._gather("search", query, top_k=top_k, mode=mode, where=where)
+        merged = merge_results({name: normalize_scores(hits) for name, hits in answers.items()}, top_k)
+        return hits_to_arrow(merged, FEDERATED_FIELDS) if as_arrow else merged
+
+    async def asearch(
+        self,
+        query: str,
+        top_k: int = 20,
+        mode: SearchMode = SearchMode.VECTOR,
+        where: Optional[str] = None,
+        as_arrow: bool = False,
+    ) -> SearchResults:
+        """Async counterpart of search, awaiting every table's asearch with the timeout."""
+        table_names = list(self.stores)
+        answers = await asyncio.gather(
+            *(
+                asyncio.wait_for(self.stores[name].asearch(query, top_k, mode=mode, where=where), self.timeout)
+                for name in table_names
+            ),
+            return_exceptions=True,
+        )
+
+        results = {}
+        for table_name, answer in zip(table_names, answers):
+            if isinstance(answer, asyncio.TimeoutError):
+                logger.warning(f"Table {table_name} did not answer within {self.timeout}s, skipping it")
+            elif isinstance(answer, Exception):
+                logger.error(f"Search on table {table_name} failed: {answer}")
+            else:
+                results[table_name] = normalize_scores(answer)
+        if not results:
+            raise RuntimeError(f"No table answered in time: {table_names}")
+        merged = merge_results(results, top_k)
+        return hits_to_arrow(merged, FEDERATED_FIELDS) if as_arrow else merged
+
+    def search_many(self, queries: List[str], top_k: int = 20) -> List[List[Dict[str, Any]]]:
+        """
+        Search several queries on all tables and merge the results per query.
+
+        Args:
+            queries: The query texts to search for
+            top_k: The number of results to return per query
+
+        Returns:
+            One list of merged hits per query, without cross-query duplicates
+        """
+        if not queries:
+            return []
+        answers = self._gather("search_many", list(queries), top_k=top_k)
+        merged = [
+            merge_results({name: normalize_scores(lists[index]) for name, lists in answers.items()}, top_k)
+            for index in range(len(queries))
+        ]
+        return deduplicate_across_queries(merged, distance_key=FEDERATED_SCORE, higher_is_better=True)
+
+    def insert(self, documents: List[Union[ParsedDocument, Dict]]) -> None:
+        """Insert documents into every table, each embedding them with its own model."""
+        for store in self.stores.values():
+            store.insert(documents)
+
+    def delete(self, index_id: str) -> None:
+        """Delete a chunk from every table."""
+        for store in self.stores.values():
+            store.delete(index_id)
+
+    def upsert(self, documents: List[Union[ParsedDocument, Dict]]) -> None:
+        """Upsert documents into every table."""
+        for store in self.stores.values():
+            store.upsert(documents)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics of every table.
+
+        Returns:
+            Dictionary with the timeout and the stats of each table by name
+        """
+        return {
+            "timeout": self.timeout,
+            "tables": {name: store.get_stats() for name, store in self.stores.items()},
+        }
+
+    def close(self) -> None:
+        """Stop the worker threads without waiting for searches still running."""
+        for executor in self._executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
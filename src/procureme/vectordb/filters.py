@@ -0,0 +1,41 @@
+from datetime import date
+from typing import Any, Iterable, Optional
+
+
+def sql_literal(value: Any) -> str:
+    """Render a Python value as a literal for a LanceDB SQL filter, quoting strings safely."""
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, date):
+        return f"date '{value.isoformat()}'"
+    text = str(value).replace("'", "''")
+    return f"'{text}'"
+
+
+def eq_filter(column: str, value: Any) -> str:
+    """Filter rows where column equals value."""
+    return f"{column} = {sql_literal(value)}"
+
+
+def in_filter(column: str, values: Iterable[Any]) -> Optional[str]:
+    """Filter rows where column is one of values, None if values is empty."""
+    literals = [sql_literal(value) for value in values]
+    if not literals:
+        return None
+    return f"{column} IN ({', '.join(literals)})"
+
+
+def and_filters(*clauses: Optional[str]) -> Optional[str]:
+    """Combine clauses with AND, skipping empty ones. None if nothing is left."""
+    parts = [f"({clause})" for clause in clauses if clause]
+    return " AND ".join(parts) if parts else None
+
+
+def or_filters(*clauses: Optional[str]) -> Optional[str]:
+    """Combine clauses with OR, skipping empty ones. None if nothing is left."""
+    parts = [f"({clause})" for clause in clauses if clause]
+    return " OR ".join(parts) if parts else None
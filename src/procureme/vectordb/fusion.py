@@ -0,0 +1,79 @@
+from typing import Any, Dict, List, Sequence
+
+
+# Damping constant from the original RRF paper, keeps a single top rank from dominating
+RRF_K = 60
+
+
+def deduplicate_across_queries(
+    result_lists: Sequence[List[Dict[str, Any]]],
+    key: str = "chunk_id",
+    distance_key: str = "_distance",
+    higher_is_better: bool = False,
+) -> List[List[Dict[str, Any]]]:
+    """
+    Keep every hit only in the result list where it is closest to its query.
+
+    Ties, and hits without a distance, stay with the earliest query.
+
+    Args:
+        result_lists: One ranked list of result dictionaries per query
+        key: Field identifying the same hit across lists
+        distance_key: Field holding the distance of a hit, lower is better
+        higher_is_better: Treat distance_key as a score where higher is better
+
+    Returns:
+        The result lists in the same order, each keeping its own ranking
+    """
+    owner: Dict[Any, int] = {}
+    best_distance: Dict[Any, float] = {}
+    for list_index, results in enumerate(result_lists):
+        for hit in results:
+            hit_key = hit[key]
+            distance = hit.get(distance_key, float("-inf") if higher_is_better else float("inf"))
+            if higher_is_better:
+                distance = -distance
+            if hit_key not in owner or distance < best_distance[hit_key]:
+                owner[hit_key] = list_index
+                best_distance[hit_key] = distance
+
+    return [
+        [hit for hit in results if owner[hit[key]] == list_index]
+        for list_index, results in enumerate(result_lists)
+    ]
+
+
+def reciprocal_rank_fusion(
+    result_lists: Sequence[List[Dict[str, Any]]],
+    key: str = "chunk_id",
+    k: int = RRF_K,
+) -> List[Dict[str, Any]]:
+    """
+    Fuse ranked result lists with reciprocal rank fusion.
+
+    Every hit scores ``1 / (k + rank)`` in each list it appears in, and hits are
+    ordered by the sum of their scores. Fields of a hit found in several lists
+    are merged, so a fused hit keeps e.g. both ``_distance`` and ``_score``.
+
+    Args:
+        result_lists: Ranked lists of result dictionaries, best hit first
+        key: Field identifying the same hit across lists
+        k: RRF damping constant
+
+    Returns:
+        Merged hits with a ``_relevance_score`` field, best first
+    """
+    scores: Dict[Any, float] = {}
+    merged: Dict[Any, Dict[str, Any]] = {}
+    for results in result_lists:
+        for rank, hit in enumerate(results, start=1):
+            hit_key = hit[key]
+            scores[hit_key] = scores.get(hit_key, 0.0) + 1.0 / (k + rank)
+            merged.setdefault(hit_key, {}).update(hit)
+
+    fused = []
+    for hit_key in sorted(scores, key=scores.get, reverse=True):
+        hit = merged[hit_key]
+        hit["_relevance_score"] = scores[hit_key]
+        fused.append(hit)
+    return fused
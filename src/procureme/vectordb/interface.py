@@ -1,5 +1,6 @@
 from typing import Any, List
 from abc import ABC, abstractmethod
+import asyncio
 
 
 # Abstract base class for vector databases
@@ -25,6 +26,15 @@ class VectorDBABC(ABC):
         """Search for the top_k most similar vectors to the query_vector."""
         pass
 
+    async def asearch(self, query: str, top_k: int = 20, **kwargs) -> List[Any]:
+        """Search without blocking the event loop, runs search in a worker thread unless overridden."""
+        return await asyncio.to_thread(self.search, query, top_k, **kwargs)
+
+    @abstractmethod
+    def search_many(self, queries: List[str], top_k: int = 20) -> List[List[Any]]:
+        """Search several queries at once, returning per-query results without cross-query duplicates."""
+        pass
+
     @abstractmethod
     def insert(self, documents: list[Any]) -> None:
         """Insert a new vector with associated metadata into the database."""
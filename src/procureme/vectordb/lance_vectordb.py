@@ -1,15 +1,139 @@
+import asyncio
 import lancedb
+import logging
+import math
+import numpy as np
+import pyarrow as pa
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from enum import StrEnum
+from functools import lru_cache
 from lancedb.pydantic import Vector, LanceModel
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-from procureme.clients.embedder import EmbeddingClientABC
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
+from procureme.clients.embedder import EmbeddingClientABC, iter_batches
 from procureme.vectordb.interface import VectorDBABC
-from procureme.models.contract_model import ParsedDocument
+from procureme.vectordb.fusion import deduplicate_across_queries, reciprocal_rank_fusion
+from procureme.models.contract_model import ContractChunkMetadata, ParsedDocument, ParsedDocumentParts
+from procureme.vectordb.metadata import cwid_from_file_name
+from procureme.vectordb.filters import eq_filter, in_filter, or_filters
+from procureme.vectordb.result_cache import DEFAULT_RESULT_CACHE_SIZE, SearchResultCache
+from procureme.vectordb.quantization import (
+    DEFAULT_OVERSAMPLE,
+    QUANTIZED_COLUMN,
+    QuantizationType,
+    code_width,
+    codes_to_arrow,
+    first_pass_scores,
+    quantization_of_field,
+    quantize,
+    quantized_field,
+)
+import hashlib
 import json
  
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_DIMENSION = 768
+DEFAULT_WRITE_BATCH_SIZE = 1024
+DEFAULT_METRIC = "l2"
+# Named on every vector search, quantized tables carry a second fixed-size-list column
+VECTOR_COLUMN = "vector"
+# Below this many rows a flat scan is fast enough and IVF training has too little data
+MIN_ROWS_FOR_INDEX = 5_000
+DEFAULT_INDEX_REFRESH_ROWS = 10_000
+# Each side of a hybrid search fetches this many times top_k candidates before fusion
+HYBRID_CANDIDATE_FACTOR = 3
+DEFAULT_SEARCH_WORKERS = 4
+# Fragments with fewer rows than this are counted as small, compaction merges them
+SMALL_FRAGMENT_ROWS = 100_000
+# Old dataset versions are kept this long so readers on an older version do not break
+DEFAULT_VERSION_RETENTION = timedelta(days=7)
+RESULT_COLUMNS = [
+    'chunk_id', 'doc_id', 'file_name', 'total_pages', 'content', 'part',
+    'cwid', 'supplier_name', 'contract_type', 'purchase_date', 'expiry_date',
+]
+# Low-cardinality columns get BITMAP indexes, ids and range-filtered dates get BTREE
+SCALAR_INDEXES = {
+    "chunk_id": "BTREE",
+    "doc_id": "BTREE",
+    "file_name": "BTREE",
+    "cwid": "BITMAP",
+    "supplier_name": "BITMAP",
+    "contract_type": "BITMAP",
+    "purchase_date": "BTREE",
+    "expiry_date": "BTREE",
+}
+
+# Score columns of vector, full-text and fused hits
+SCORE_FIELDS = [
+    pa.field("_distance", pa.float32()),
+    pa.field("_score", pa.float32()),
+    pa.field("_relevance_score", pa.float32()),
+]
+
+SearchResults = Union[List[Dict[str, Any]], pa.Table]
+DocPart = Tuple[ParsedDocument, ParsedDocumentParts]
+
+
+class IngestMode(StrEnum):
+    """How document chunks are materialized before they are written to LanceDB."""
+    MODEL = "model"
+    ARROW = "arrow"
+
+
+class SearchMode(StrEnum):
+    """Retrieval strategies supported by LanceDBVectorStore.search."""
+    VECTOR = "vector"
+    FTS = "fts"
+    HYBRID = "hybrid"
+
+
+class VectorIndexType(StrEnum):
+    """ANN index types supported for the vector column."""
+    IVF_PQ = "IVF_PQ"
+    HNSW = "IVF_HNSW_SQ"
+
+
+def choose_index_params(
+    row_count: int,
+    dimension: int,
+    index_type: Optional[VectorIndexType] = None,
+) -> Dict[str, Any]:
+    """
+    Pick ANN index parameters for a table of the given size.
+
+    Args:
+        row_count: Number of rows in the table
+        dimension: Dimension of the vector column
+        index_type: Index type to build, IVF_PQ if None. HNSW indexes cannot be remapped
+            by compaction, so they are rebuilt instead of optimized and only used when asked for
+
+    Returns:
+        Keyword arguments for ``LanceTable.create_index``
+    """
+    index_type = VectorIndexType(index_type or VectorIndexType.IVF_PQ)
+
+    if index_type == VectorIndexType.HNSW:
+        # HNSW graphs search well inside large partitions, so keep the IVF layer coarse
+        return {
+            "index_type": index_type.value,
+            "num_partitions": max(1, row_count // 250_000),
+            "m": 20,
+            "ef_construction": 300,
+        }
+
+    # PQ sub-vectors of 16 dimensions (or 8/4 when the dimension does not divide evenly)
+    sub_vector_size = next((size for size in (16, 8, 4) if dimension % size == 0), 1)
+    return {
+        "index_type": index_type.value,
+        "num_partitions": max(1, int(math.sqrt(row_count))),
+        "num_sub_vectors": max(1, dimension // sub_vector_size),
+    }
+
 
+@lru_cache(maxsize=None)
 def get_schema_by_dimension(dimension: int) -> type[LanceModel]:
     class DocumentWithMetadata(LanceModel):
         """Lance DB model for document chunks with metadata."""
@@ -19,10 +143,44 @@ def get_schema_by_dimension(dimension: int) -> type[LanceModel]:
         total_pages: int
         content: str
         part: str
+        cwid: Optional[str] = None
+        supplier_name: Optional[str] = None
+        contract_type: Optional[str] = None
+        purchase_date: Optional[date] = None
+        expiry_date: Optional[date] = None
+        content_hash: Optional[str] = None
         vector: Vector(dimension)
     return DocumentWithMetadata
 
 
+def compute_content_hash(text: str) -> str:
+    """SHA-256 of the chunk text, used to detect unchanged pages on upsert."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def get_arrow_schema_by_dimension(dimension: int) -> pa.Schema:
+    """Arrow schema of the document chunk table for the given vector dimension."""
+    return get_schema_by_dimension(dimension).to_arrow_schema()
+
+
+@lru_cache(maxsize=None)
+def get_result_schema(extra_fields: Tuple[pa.Field, ...] = ()) -> pa.Schema:
+    """Arrow schema of search hits: the result columns, every score column, then extra_fields."""
+    table_schema = get_arrow_schema_by_dimension(DEFAULT_DIMENSION)
+    return pa.schema([table_schema.field(name) for name in RESULT_COLUMNS] + SCORE_FIELDS + list(extra_fields))
+
+
+def hits_to_arrow(hits: List[Dict[str, Any]], extra_fields: Tuple[pa.Field, ...] = ()) -> pa.Table:
+    """
+    Build a table from result dictionaries with a fixed schema.
+
+    Fused hits do not all carry the same score columns, so the schema is not
+    inferred from the first hit; a score a hit lacks is null.
+    """
+    return pa.Table.from_pylist(hits, schema=get_result_schema(extra_fields))
+
+
 class LanceDBVectorStore(VectorDBABC):
     """LanceDB implementation of VectorDBABC interface."""
     
@@ -31,6 +189,14 @@ class LanceDBVectorStore(VectorDBABC):
         db_path: Union[str, Path], 
         table_name: str,
         embedding_client: Optional[EmbeddingClientABC] = None,
+        ingest_mode: IngestMode = IngestMode.ARROW,
+        write_batch_size: int = DEFAULT_WRITE_BATCH_SIZE,
+        index_refresh_rows: Optional[int] = DEFAULT_INDEX_REFRESH_ROWS,
+        contract_metadata: Optional[Mapping[str, ContractChunkMetadata]] = None,
+        result_cache_size: int = DEFAULT_RESULT_CACHE_SIZE,
+        result_cache_ttl: Optional[float] = None,
+        quantization: Optional[QuantizationType] = None,
+        search_oversample: Optional[int] = None,
     ):
         """
         Initialize the LanceDB vector store.
@@ -39,13 +205,38 @@ class LanceDBVectorStore(VectorDBABC):
             db_path: Path to the LanceDB database file
             table_name: Name of the table to use
             embedding_client: Optional pre-configured embedding client
+            ingest_mode: Write chunks as streamed Arrow record batches or as LanceModel rows
+            write_batch_size: Number of chunks embedded and written per record batch
+            index_refresh_rows: Create or refresh the vector index after this many
+                unindexed rows have been written; None disables automatic maintenance
+            contract_metadata: Contract metadata by CWID, joined onto the chunks at ingestion
+            result_cache_size: Number of search result lists kept per table version, 0 disables the cache
+            result_cache_ttl: Seconds a cached result list stays valid, None keeps it until evicted
+            quantization: Also store binary or int8 codes of every vector for search_quantized;
+                None keeps the quantization of an existing table
+            search_oversample: Serve unfiltered vector searches on a quantized table through
+                search_quantized with this oversampling, None searches the vector index
         """
         self.db_path = Path(db_path) if isinstance(db_path, str) else db_path
         self.table_name = table_name
         self.embedding_client = embedding_client
+        self.ingest_mode = IngestMode(ingest_mode)
+        self.write_batch_size = write_batch_size
+        self.index_refresh_rows = index_refresh_rows
+        self.contract_metadata = contract_metadata or {}
+        self.quantization = QuantizationType(quantization) if quantization else None
+        self.search_oversample = search_oversample
         self._dimension = self.embedding_client.dimension
+        self._result_cache = SearchResultCache(result_cache_size, result_cache_ttl)
+        self._executor = ThreadPoolExecutor(
+            max_workers=DEFAULT_SEARCH_WORKERS, thread_name_prefix=f"lance-{table_name}"
+        )
         self.db = None
         self.table = None
+        self._async_table = None
+        self._async_table_version: Optional[int] = None
+        self._write_schema = None
+        self._quantized_codes: Optional[Tuple[int, pa.Array, np.ndarray]] = None
         self.connect()
     
     @property
@@ -64,12 +255,98 @@ class LanceDBVectorStore(VectorDBABC):
         # Open existing table or create new one
         if self.table_name in self.db.table_names():
             self.table = self.db.open_table(self.table_name)
+            self._check_dimension()
+            # Opening never writes, concurrent readers would race on the schema change
+            self._check_schema()
+            self._configure_quantization()
         
+        elif self.quantization is not None:
+            schema = get_arrow_schema_by_dimension(self.dimension)
+            self.table = self.db.create_table(
+                self.table_name,
+                schema=schema.append(quantized_field(self.quantization, self.dimension)),
+            )
+
         else:
             self.table = self.db.create_table(
                 self.table_name, 
                 schema=get_schema_by_dimension(self.dimension)
             )
+
+        if self.quantization is not None and self.ingest_mode != IngestMode.ARROW:
+            raise ValueError("Quantized tables can only be written in the Arrow ingest mode")
+
+        # Record batches are built in the table's column order
+        self._write_schema = self.table.schema
+        # The async handle is reopened on the next asearch so it sees the same table
+        self._async_table = None
+    
+    def _check_dimension(self) -> None:
+        """Fail on open, not on the first query, if the client's vectors do not fit the table."""
+        table_dimension = self.table.schema.field(VECTOR_COLUMN).type.list_size
+        if table_dimension != self.dimension:
+            raise ValueError(
+                f"Table {self.table_name} stores {table_dimension}-dimensional vectors but "
+                f"{self.embedding_client!r} produces {self.dimension}; "
+                f"set the embedding dimensions the table was built with"
+            )
+
+    def _missing_fields(self) -> List[pa.Field]:
+        """Columns of the current schema, and the requested quantized column, the table lacks."""
+        existing = set(self.table.schema.names)
+        missing = [
+            field for field in get_arrow_schema_by_dimension(self.dimension)
+            if field.name not in existing
+        ]
+        if self.quantization is not None and QUANTIZED_COLUMN not in existing:
+            missing.append(quantized_field(self.quantization, self.dimension))
+        return missing
+
+    def _check_schema(self) -> None:
+        """Warn about columns introduced after the table was created, migrate_schema adds them."""
+        missing = self._missing_fields()
+        if missing:
+            logger.warning(
+                f"Table {self.table_name} lacks the columns {[field.name for field in missing]}, "
+                f"they stay unset until the table is migrated (lancedb_index migrate)"
+            )
+
+    def migrate_schema(self) -> List[str]:
+        """
+        Add the columns the table lacks as all-null columns.
+
+        Run from the ETL or the index CLI, never while API workers open the table.
+        Existing rows stay without quantized codes until build_quantized_codes backfills them.
+
+        Returns:
+            The names of the added columns
+        """
+        if self.table is None:
+            self.connect()
+
+        missing = self._missing_fields()
+        if missing:
+            logger.info(f"Adding columns {[field.name for field in missing]} to {self.table_name}")
+            self.table.add_columns(pa.schema(missing))
+            # Migrated tables have the new columns last
+            self._write_schema = self.table.schema
+        return [field.name for field in missing]
+
+    def _has_quantized_column(self) -> bool:
+        """Whether the table stores quantized codes, requested ones exist only once migrated."""
+        return self.quantization is not None and QUANTIZED_COLUMN in self._write_schema.names
+
+    def _configure_quantization(self) -> None:
+        """Adopt the quantization of an existing table, or check it matches the requested one."""
+        schema = self.table.schema
+        if QUANTIZED_COLUMN in schema.names:
+            existing = quantization_of_field(schema.field(QUANTIZED_COLUMN))
+            if self.quantization is None:
+                self.quantization = existing
+            elif self.quantization != existing:
+                raise ValueError(
+                    f"Table {self.table_name} stores {existing} codes, cannot open it with {self.quantization}"
+                )
     
     def save(self) -> None:
         """Save the database. 
@@ -85,30 +362,475 @@ class LanceDBVectorStore(VectorDBABC):
         For LanceDB, this reconnects to the database.
         """
         self.connect()
+
+    def refresh(self) -> bool:
+        """
+        Check out the latest version of the table if another writer committed one.
+        
+        Returns:
+            True if the table handle moved to a newer version
+        """
+        if self.table is None:
+            self.connect()
+            return True
+
+        current_version = self.table.version
+        self.table.checkout_latest()
+        if self.table.version == current_version:
+            return False
+        # Another writer may have migrated the schema
+        self._write_schema = self.table.schema
+        self._async_table = None
+        return True
     
-    def search(self, query: str, top_k: int = 20) -> List[Dict[str, Any]]:
+    def search(
+        self,
+        query: str,
+        top_k: int = 20,
+        nprobes: Optional[int] = None,
+        refine_factor: Optional[int] = None,
+        mode: SearchMode = SearchMode.VECTOR,
+        where: Optional[str] = None,
+        as_arrow: bool = False,
+        oversample: Optional[int] = None,
+    ) -> SearchResults:
         """
         Search for the top_k most similar documents to the query.
         
         Args:
             query: The query text to search for
             top_k: The number of results to return
+            nprobes: Number of IVF partitions to probe, only used once a vector index exists
+            refine_factor: Re-rank ``top_k * refine_factor`` candidates with the full vectors
+            mode: Vector search, BM25 full-text search, or both fused with reciprocal rank fusion
+            where: SQL filter applied before the search, e.g. ``cwid = 'CW0307'``,
+                see procureme.vectordb.filters for helpers
+            as_arrow: Return a pyarrow Table instead of materializing one dict per hit
+            oversample: Run an unfiltered vector search on a quantized table as a two-pass
+                search_quantized with this oversampling, defaults to the store's search_oversample
             
         Returns:
-            List of document dictionaries with similarity scores
+            List of document dictionaries with similarity scores, or a Table if as_arrow
         """
         if self.table is None:
             self.connect()
-        
+
+        mode = SearchMode(mode)
+        oversample = self._quantized_oversample(mode, where, oversample)
+        # Keyed on the table version, so results cached before a write are never served after it
+        version = self.table.version
+        cache_key = self._result_cache.make_key(
+            query, top_k, mode=mode, where=where, nprobes=nprobes, refine_factor=refine_factor,
+            as_arrow=as_arrow, oversample=oversample,
+        )
+        results = self._result_cache.get(cache_key, version)
+        if results is None:
+            results = self._search(query, top_k, nprobes, refine_factor, mode, where, as_arrow, oversample)
+            self._result_cache.put(cache_key, version, results)
+        return results
+
+    def _search(
+        self,
+        query: str,
+        top_k: int,
+        nprobes: Optional[int],
+        refine_factor: Optional[int],
+        mode: SearchMode,
+        where: Optional[str],
+        as_arrow: bool = False,
+        oversample: Optional[int] = None,
+    ) -> SearchResults:
+        """Dispatch an uncached search to the vector, full-text, hybrid or quantized path."""
+        if oversample:
+            query_vector = self.embedding_client.get_embedding(query)
+            return self.search_quantized(query_vector, top_k, oversample, as_arrow)
+        mode = self._available_mode(mode)
+        if mode == SearchMode.FTS:
+            return self._fts_search(query, top_k, where, as_arrow)
+        if mode == SearchMode.HYBRID:
+            fused = self._hybrid_search(query, top_k, nprobes, refine_factor, where)
+            return hits_to_arrow(fused) if as_arrow else fused
+        return self._vector_search(query, top_k, nprobes, refine_factor, where, as_arrow)
+
+    def _quantized_oversample(self, mode: SearchMode, where: Optional[str], oversample: Optional[int]) -> Optional[int]:
+        """Oversampling of the two-pass quantized search, None if the search takes the regular path."""
+        oversample = oversample or self.search_oversample
+        # The first pass scans every code, so filtered searches keep the prefiltered index search
+        if not oversample or not self._has_quantized_column() or mode != SearchMode.VECTOR or where:
+            return None
+        return oversample
+
+    def _available_mode(self, mode: SearchMode) -> SearchMode:
+        """Run hybrid searches as vector searches on tables without a full-text index."""
+        if mode == SearchMode.HYBRID and self._fts_index() is None:
+            logger.warning(
+                f"Table {self.table_name} has no full-text index, running a vector search instead of a hybrid one"
+            )
+            return SearchMode.VECTOR
+        return mode
+
+    def _vector_search(
+        self,
+        query: str,
+        top_k: int,
+        nprobes: Optional[int] = None,
+        refine_factor: Optional[int] = None,
+        where: Optional[str] = None,
+        as_arrow: bool = False,
+    ) -> SearchResults:
+        """Embed the query and run a vector search, hits carry ``_distance``."""
         # Generate embedding for the query using the embedding client
         query_vector = self.embedding_client.get_embedding(query)
-        selected_columns = ['chunk_id', 'doc_id', 'file_name', 'total_pages', 'content', 'part', '_distance']
+        return self.search_by_vector(query_vector, top_k, nprobes, refine_factor, where, as_arrow)
+
+    def search_by_vector(
+        self,
+        query_vector: List[float],
+        top_k: int = 20,
+        nprobes: Optional[int] = None,
+        refine_factor: Optional[int] = None,
+        where: Optional[str] = None,
+        as_arrow: bool = False,
+    ) -> SearchResults:
+        """
+        Run a vector search for an already embedded query.
+        
+        Args:
+            query_vector: Query embedding with the table's dimension
+            top_k: The number of results to return
+            nprobes: Number of IVF partitions to probe, only used once a vector index exists
+            refine_factor: Re-rank ``top_k * refine_factor`` candidates with the full vectors
+            where: SQL filter applied before the search
+            as_arrow: Return a pyarrow Table instead of a list of dicts
+            
+        Returns:
+            List of document dictionaries with ``_distance``, or a Table if as_arrow
+        """
+        if self.table is None:
+            self.connect()
+
         # Perform vector search
-        results = self.table.search(query_vector).limit(top_k).select(selected_columns).to_list()
+        search_query = self.table.search(query_vector, vector_column_name=VECTOR_COLUMN).limit(top_k)
+        if where:
+            # Prefiltering narrows the candidates through the scalar indexes before the vector scan
+            search_query = search_query.where(where, prefilter=True)
+        if nprobes is not None:
+            search_query = search_query.nprobes(nprobes)
+        if refine_factor is not None:
+            search_query = search_query.refine_factor(refine_factor)
+        search_query = search_query.select(RESULT_COLUMNS + ["_distance"])
+        return search_query.to_arrow() if as_arrow else search_query.to_list()
+
+    def search_many(
+        self,
+        queries: List[str],
+        top_k: int = 20,
+        nprobes: Optional[int] = None,
+        refine_factor: Optional[int] = None,
+        where: Optional[str] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run vector searches for several queries at the latency cost of about one.
+
+        All queries are embedded in one batched call and searched concurrently.
+        A chunk retrieved by several queries is only kept for the query it is closest to.
         
-        # Convert to list of dictionaries
+        Args:
+            queries: The query texts to search for
+            top_k: The number of results to return per query
+            nprobes: Number of IVF partitions to probe, only used once a vector index exists
+            refine_factor: Re-rank ``top_k * refine_factor`` candidates with the full vectors
+            where: SQL filter applied before every search
+            
+        Returns:
+            One list of document dictionaries per query, in query order
+        """
+        if not queries:
+            return []
+        if self.table is None:
+            self.connect()
+
+        query_vectors = self.embedding_client.get_query_embeddings(list(queries))
+        futures = [
+            self._executor.submit(
+                self.search_by_vector, query_vector, top_k, nprobes, refine_factor, where
+            )
+            for query_vector in query_vectors
+        ]
+        return deduplicate_across_queries([future.result() for future in futures])
+
+    def _load_quantized_codes(self) -> Tuple[pa.Array, np.ndarray]:
+        """Return the chunk ids and the code matrix of the current table version, reading them once per version."""
+        version = self.table.version
+        if self._quantized_codes is None or self._quantized_codes[0] != version:
+            codes_table = (
+                self.table.search()
+                .where(f"{QUANTIZED_COLUMN} IS NOT NULL")
+                .select(["chunk_id", QUANTIZED_COLUMN])
+                .limit(None)
+                .to_arrow()
+            )
+            codes = codes_table[QUANTIZED_COLUMN].combine_chunks().flatten().to_numpy(zero_copy_only=False)
+            width = code_width(self.quantization, self.dimension)
+            self._quantized_codes = (
+                version,
+                codes_table["chunk_id"].combine_chunks(),
+                codes.reshape(len(codes_table), width),
+            )
+        return self._quantized_codes[1], self._quantized_codes[2]
+
+    def search_quantized(
+        self,
+        query_vector: List[float],
+        top_k: int = 20,
+        oversample: int = DEFAULT_OVERSAMPLE,
+        as_arrow: bool = False,
+    ) -> SearchResults:
+        """
+        Two-pass search: a NumPy scan over the quantized codes, then float32 rescoring.
+
+        The first pass ranks every row by Hamming distance (binary) or int8 dot
+        product and keeps ``top_k * oversample`` candidates. Only those rows are
+        read with their full vectors and re-ranked by exact L2 distance.
+
+        Args:
+            query_vector: Query embedding with the table's dimension
+            top_k: The number of results to return
+            oversample: Candidates kept by the first pass per requested result
+            as_arrow: Return a pyarrow Table instead of a list of dicts
+
+        Returns:
+            List of document dictionaries with ``_distance``, or a Table if as_arrow
+        """
+        if self.table is None:
+            self.connect()
+        if not self._has_quantized_column():
+            raise ValueError(f"Table {self.table_name} has no quantized column")
+
+        chunk_ids, codes = self._load_quantized_codes()
+        query = np.asarray(query_vector, dtype=np.float32)
+        scores = first_pass_scores(codes, quantize(query, self.quantization), self.quantization)
+        num_candidates = min(top_k * oversample, len(scores))
+        if num_candidates == 0:
+            return pa.table({}) if as_arrow else []
+        candidates = np.argpartition(-scores, num_candidates - 1)[:num_candidates]
+
+        candidate_ids = chunk_ids.take(pa.array(candidates)).to_pylist()
+        rows = (
+            self.table.search()
+            .where(in_filter("chunk_id", candidate_ids))
+            .select(RESULT_COLUMNS + ["vector"])
+            .limit(len(candidate_ids))
+            .to_arrow()
+        )
+        vectors = rows["vector"].combine_chunks().flatten().to_numpy(zero_copy_only=False)
+        # Squared L2, the distance LanceDB reports for the l2 metric
+        distances = ((vectors.reshape(len(rows), self.dimension) - query) ** 2).sum(axis=1)
+        ranked = np.argsort(distances)[:top_k]
+        hits = rows.drop_columns(["vector"]).take(pa.array(ranked))
+        hits = hits.append_column("_distance", pa.array(distances[ranked], type=pa.float32()))
+        return hits if as_arrow else hits.to_pylist()
+
+    def _fts_search(
+        self, query: str, top_k: int, where: Optional[str] = None, as_arrow: bool = False
+    ) -> SearchResults:
+        """Run a BM25 full-text search on the content column, hits carry ``_score``."""
+        search_query = self.table.search(query, query_type="fts").limit(top_k)
+        if where:
+            search_query = search_query.where(where, prefilter=True)
+        search_query = search_query.select(RESULT_COLUMNS)
+        return search_query.to_arrow() if as_arrow else search_query.to_list()
+
+    def _hybrid_search(
+        self,
+        query: str,
+        top_k: int,
+        nprobes: Optional[int] = None,
+        refine_factor: Optional[int] = None,
+        where: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run the vector and BM25 searches concurrently and fuse them with RRF.
+
+        Both sides fetch ``top_k * HYBRID_CANDIDATE_FACTOR`` candidates so that
+        hits ranked moderately by both searches can still reach the top_k.
+        """
+        candidate_k = top_k * HYBRID_CANDIDATE_FACTOR
+        vector_future = self._executor.submit(
+            self._vector_search, query, candidate_k, nprobes, refine_factor, where
+        )
+        fts_future = self._executor.submit(self._fts_search, query, candidate_k, where)
+        fused = reciprocal_rank_fusion([vector_future.result(), fts_future.result()])
+        return fused[:top_k]
+
+    async def _get_async_table(self) -> Any:
+        """
+        Return the table on LanceDB's async connection, at the version of the sync handle.
+
+        The sync handle moves with every write through this store and with refresh,
+        so async searches read the same version their results are cached under.
+        """
+        version = self.table.version
+        if self._async_table is None:
+            db = await lancedb.connect_async(self.db_path)
+            self._async_table = await db.open_table(self.table_name)
+            self._async_table_version = None
+        if self._async_table_version != version:
+            await self._async_table.checkout(version)
+            self._async_table_version = version
+        return self._async_table
+
+    async def asearch(
+        self,
+        query: str,
+        top_k: int = 20,
+        nprobes: Optional[int] = None,
+        refine_factor: Optional[int] = None,
+        mode: SearchMode = SearchMode.VECTOR,
+        where: Optional[str] = None,
+        as_arrow: bool = False,
+        oversample: Optional[int] = None,
+    ) -> SearchResults:
+        """
+        Async counterpart of search for use inside an event loop.
+
+        The query is embedded with the client's async call and the table is
+        scanned through LanceDB's async API, so concurrent searches share one
+        event loop and one table handle instead of a thread each.
+
+        Args:
+            query: The query text to search for
+            top_k: The number of results to return
+            nprobes: Number of IVF partitions to probe, only used once a vector index exists
+            refine_factor: Re-rank ``top_k * refine_factor`` candidates with the full vectors
+            mode: Vector search, BM25 full-text search, or both fused with reciprocal rank fusion
+            where: SQL filter applied before the search
+            as_arrow: Return a pyarrow Table instead of materializing one dict per hit
+            oversample: Run an unfiltered vector search on a quantized table as a two-pass
+                search_quantized with this oversampling, defaults to the store's search_oversample
+
+        Returns:
+            List of document dictionaries with similarity scores, or a Table if as_arrow
+        """
+        if self.table is None:
+            self.connect()
+
+        mode = SearchMode(mode)
+        oversample = self._quantized_oversample(mode, where, oversample)
+        version = self.table.version
+        cache_key = self._result_cache.make_key(
+            query, top_k, mode=mode, where=where, nprobes=nprobes, refine_factor=refine_factor,
+            as_arrow=as_arrow, oversample=oversample,
+        )
+        results = self._result_cache.get(cache_key, version)
+        if results is None:
+            results = await self._asearch(query, top_k, nprobes, refine_factor, mode, where, as_arrow, oversample)
+            self._result_cache.put(cache_key, version, results)
         return results
+
+    async def _asearch(
+        self,
+        query: str,
+        top_k: int,
+        nprobes: Optional[int],
+        refine_factor: Optional[int],
+        mode: SearchMode,
+        where: Optional[str],
+        as_arrow: bool = False,
+        oversample: Optional[int] = None,
+    ) -> SearchResults:
+        """Dispatch an uncached async search to the vector, full-text, hybrid or quantized path."""
+        if oversample:
+            query_vector = await self.embedding_client.aget_embedding(query)
+            # The NumPy scan and the rescoring read are synchronous
+            return await asyncio.to_thread(self.search_quantized, query_vector, top_k, oversample, as_arrow)
+        mode = self._available_mode(mode)
+        if mode == SearchMode.FTS:
+            return await self._afts_search(query, top_k, where, as_arrow)
+        if mode == SearchMode.HYBRID:
+            candidate_k = top_k * HYBRID_CANDIDATE_FACTOR
+            vector_hits, fts_hits = await asyncio.gather(
+                self._avector_search(query, candidate_k, nprobes, refine_factor, where),
+                self._afts_search(query, candidate_k, where),
+            )
+            fused = reciprocal_rank_fusion([vector_hits, fts_hits])[:top_k]
+            return hits_to_arrow(fused) if as_arrow else fused
+        return await self._avector_search(query, top_k, nprobes, refine_factor, where, as_arrow)
+
+    async def _avector_search(
+        self,
+        query: str,
+        top_k: int,
+        nprobes: Optional[int] = None,
+        refine_factor: Optional[int] = None,
+        where: Optional[str] = None,
+        as_arrow: bool = False,
+    ) -> SearchResults:
+        """Embed the query and run an async vector search, hits carry ``_distance``."""
+        query_vector, table = await asyncio.gather(
+            self.embedding_client.aget_embedding(query), self._get_async_table()
+        )
+        # Async queries prefilter by default
+        search_query = table.query().nearest_to(query_vector).column(VECTOR_COLUMN).limit(top_k)
+        if where:
+            search_query = search_query.where(where)
+        if nprobes is not None:
+            search_query = search_query.nprobes(nprobes)
+        if refine_factor is not None:
+            search_query = search_query.refine_factor(refine_factor)
+        search_query = search_query.select(RESULT_COLUMNS)
+        return await (search_query.to_arrow() if as_arrow else search_query.to_list())
+
+    async def _afts_search(
+        self, query: str, top_k: int, where: Optional[str] = None, as_arrow: bool = False
+    ) -> SearchResults:
+        """Run an async BM25 full-text search on the content column, hits carry ``_score``."""
+        table = await self._get_async_table()
+        search_query = table.query().nearest_to_text(query, columns="content").limit(top_k)
+        if where:
+            search_query = search_query.where(where)
+        search_query = search_query.select(RESULT_COLUMNS)
+        return await (search_query.to_arrow() if as_arrow else search_query.to_list())
+
+    def _fts_index(self) -> Optional[Any]:
+        """Return the index configuration of the full-text index on content, if one exists."""
+        for index in self.table.list_indices():
+            if "content" in index.columns and index.index_type == "FTS":
+                return index
+        return None
+
+    def create_fts_index(self, replace: bool = True) -> None:
+        """
+        Build the BM25 full-text index on the content column.
+
+        Rows written after the build are still found by full-text search and are
+        folded into the index by ``optimize_index``.
+        """
+        if self.table is None:
+            self.connect()
+
+        logger.info(f"Creating full-text index on {self.table_name}.content")
+        self.table.create_fts_index("content", use_tantivy=False, replace=replace)
+
+    def ensure_fts_index(self) -> bool:
+        """Create the full-text index if it does not exist, returns True if it was created."""
+        if self.table is None:
+            self.connect()
+
+        if self._fts_index() is not None:
+            return False
+        self.create_fts_index(replace=False)
+        return True
     
+    def create_scalar_indexes(self, replace: bool = True) -> None:
+        """Build the scalar indexes that back prefiltered searches on the metadata columns."""
+        if self.table is None:
+            self.connect()
+
+        for column, index_type in SCALAR_INDEXES.items():
+            logger.info(f"Creating {index_type} index on {self.table_name}.{column}")
+            self.table.create_scalar_index(column, index_type=index_type, replace=replace)
+
     def insert(self, documents: List[Union[ParsedDocument, Dict]]) -> None:
         """
         Insert documents into the database.
@@ -119,16 +841,11 @@ class LanceDBVectorStore(VectorDBABC):
         if self.table is None:
             self.connect()
         
-        lance_documents = []
-        for doc in documents:
-            if isinstance(doc, dict):
-                doc = ParsedDocument.model_validate(doc)
-            
-            lance_docs = self._convert_doc_to_lance_format(doc)
-            lance_documents.extend(lance_docs)
+        lance_documents = self._prepare_write_data(self._collect_doc_parts(documents))
         
-        if lance_documents:
+        if lance_documents is not None:
             self.table.add(lance_documents)
+            self.refresh_index()
     
     def delete(self, index_id: str) -> None:
         """
@@ -141,33 +858,370 @@ class LanceDBVectorStore(VectorDBABC):
             self.connect()
         
         # For LanceDB, we use a where clause to delete by chunk_id
-        self.table.delete(f'chunk_id = "{index_id}"')
+        self.table.delete(eq_filter("chunk_id", index_id))
+
+    def delete_where(
+        self,
+        doc_ids: Optional[List[str]] = None,
+        file_names: Optional[List[str]] = None,
+        cwids: Optional[List[str]] = None,
+    ) -> int:
+        """
+        Delete every chunk matching any of the given ids in a single delete transaction.
+
+        The id columns are backed by scalar indexes (see create_scalar_indexes),
+        so purging a whole contract touches one predicate instead of one commit per chunk.
+        
+        Args:
+            doc_ids: Delete all chunks of these document ids
+            file_names: Delete all chunks of these source files
+            cwids: Delete all chunks of these contracts
+            
+        Returns:
+            Number of chunks deleted
+        """
+        if self.table is None:
+            self.connect()
+
+        predicate = or_filters(
+            in_filter("doc_id", doc_ids or []),
+            in_filter("file_name", file_names or []),
+            in_filter("cwid", cwids or []),
+        )
+        if predicate is None:
+            raise ValueError("delete_where needs at least one of doc_ids, file_names or cwids")
+
+        deleted = self.table.count_rows(predicate)
+        if deleted:
+            self.table.delete(predicate)
+            logger.info(f"Deleted {deleted} chunks from {self.table_name} where {predicate}")
+        return deleted
     
-    def upsert(self, documents: List[Union[ParsedDocument, Dict]]) -> None:
+    def upsert(
+        self,
+        documents: List[Union[ParsedDocument, Dict]],
+        skip_unchanged: bool = True,
+    ) -> None:
         """
         Upsert documents into the database (insert if not exists, update if exists).
+
+        With skip_unchanged, the stored content hashes of the documents' chunks are
+        read in one query first. Only new or changed parts are embedded and written,
+        and chunks of these documents that are no longer present are deleted.
         
         Args:
             documents: List of ParsedDocument objects or dictionaries
+            skip_unchanged: Skip parts whose text is identical to the stored chunk
         """
         if self.table is None:
             self.connect()
         
-        lance_documents = []
-        for doc in documents:
-            if isinstance(doc, dict):
-                doc = ParsedDocument.model_validate(doc)
-            
-            lance_docs = self._convert_doc_to_lance_format(doc)
-            lance_documents.extend(lance_docs)
+        parsed_docs = self._parse_documents(documents)
+        doc_parts = [(doc, part) for doc in parsed_docs for part in doc.parts]
+        if skip_unchanged:
+            doc_parts, stale_chunk_ids = self._diff_against_stored(parsed_docs, doc_parts)
+            if stale_chunk_ids:
+                self.table.delete(in_filter("chunk_id", stale_chunk_ids))
+
+        lance_documents = self._prepare_write_data(doc_parts)
         
-        if lance_documents:
+        if lance_documents is not None:
             # Use merge_insert for upsert operation
             self.table.merge_insert("chunk_id") \
-                .when_matched_update() \
+                .when_matched_update_all() \
                 .when_not_matched_insert_all() \
                 .execute(lance_documents)
+            self.refresh_index()
+
+
+    def _vector_index(self) -> Optional[Any]:
+        """Return the index configuration of the vector column, if one exists."""
+        for index in self.table.list_indices():
+            if "vector" in index.columns:
+                return index
+        return None
+
+    def drop_vector_index(self) -> bool:
+        """Drop the index of the vector column, returns True if one existed."""
+        if self.table is None:
+            self.connect()
+
+        index = self._vector_index()
+        if index is None:
+            return False
+        logger.info(f"Dropping vector index {index.name} on {self.table_name}")
+        self.table.drop_index(index.name)
+        return True
+
+    def create_index(
+        self,
+        index_type: Optional[VectorIndexType] = None,
+        replace: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Build the ANN index on the vector column with parameters chosen from the row count.
+        
+        Args:
+            index_type: Build IVF_PQ (the default) or HNSW
+            replace: Replace an existing vector index
+            
+        Returns:
+            The parameters the index was built with
+        """
+        if self.table is None:
+            self.connect()
+
+        params = choose_index_params(self.table.count_rows(), self.dimension, index_type)
+        logger.info(f"Creating vector index on {self.table_name} with {params}")
+        self.table.create_index(
+            metric=DEFAULT_METRIC,
+            vector_column_name="vector",
+            replace=replace,
+            **params,
+        )
+        return params
+
+    def build_quantized_codes(self) -> int:
+        """
+        Backfill the quantized column from the stored vectors, e.g. after it was added to an existing table.
+
+        Returns:
+            The number of rows rewritten
+        """
+        if self.table is None:
+            self.connect()
+        if not self._has_quantized_column():
+            raise ValueError(f"Table {self.table_name} has no quantized column")
+
+        table = self.table.to_arrow()
+        if len(table) == 0:
+            return 0
+        vectors = table["vector"].combine_chunks().flatten().to_numpy(zero_copy_only=False)
+        codes = quantize(vectors.reshape(len(table), self.dimension), self.quantization)
+        table = table.set_column(
+            table.schema.get_field_index(QUANTIZED_COLUMN),
+            table.schema.field(QUANTIZED_COLUMN),
+            codes_to_arrow(codes),
+        )
+        self.table.merge_insert("chunk_id").when_matched_update_all().execute(table)
+        logger.info(f"Built {self.quantization} codes for {len(table)} rows of {self.table_name}")
+        return len(table)
+
+    def _has_hnsw_index(self) -> bool:
+        """True if the vector index is HNSW, which LanceDB cannot remap during compaction."""
+        index = self._vector_index()
+        return index is not None and index.index_type == VectorIndexType.HNSW.value
+
+    def optimize_index(self) -> None:
+        """
+        Add rows written since the last build to the existing vector and full-text indexes.
 
+        HNSW indexes cannot be updated in place and are rebuilt instead.
+        """
+        if self.table is None:
+            self.connect()
+
+        if self._has_hnsw_index():
+            logger.info(f"Rebuilding HNSW vector index on {self.table_name}")
+            self.create_index(VectorIndexType.HNSW)
+            return
+        logger.info(f"Optimizing vector index on {self.table_name}")
+        self.table.optimize()
+
+    def maintain(
+        self,
+        cleanup_older_than: timedelta = DEFAULT_VERSION_RETENTION,
+        delete_unverified: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Compact small fragments, remove old dataset versions and optimize the indexes.
+
+        Every insert, upsert and delete adds a fragment and a dataset version,
+        so this should run after ETL jobs or on a schedule. Tables with an HNSW
+        index are not compacted, because compaction would have to remap the
+        index; only old versions are removed and the index is rebuilt if needed.
+        
+        Args:
+            cleanup_older_than: Keep dataset versions younger than this
+            delete_unverified: Also delete files of unfinished transactions younger
+                than the retention; only safe when no writer is running
+            
+        Returns:
+            Storage statistics before and after the maintenance
+        """
+        if self.table is None:
+            self.connect()
+
+        before = self.get_storage_stats()
+        logger.info(f"Running maintenance on {self.table_name}, retention {cleanup_older_than}")
+        if self._has_hnsw_index():
+            self.table.cleanup_old_versions(older_than=cleanup_older_than, delete_unverified=delete_unverified)
+            self.refresh_index(force=True)
+        else:
+            # Native optimize runs compaction, version cleanup and index optimization in one call
+            self.table.optimize(cleanup_older_than=cleanup_older_than, delete_unverified=delete_unverified)
+        after = self.get_storage_stats()
+        logger.info(f"Maintenance finished on {self.table_name}: {before} -> {after}")
+        return {"before": before, "after": after}
+
+    def get_storage_stats(self) -> Dict[str, Any]:
+        """
+        Get fragment, version and on-disk size statistics of the table.
+        
+        Returns:
+            Dictionary with fragment count, small fragment count, version count and bytes on disk
+        """
+        if self.table is None:
+            self.connect()
+
+        fragment_rows = [fragment.count_rows() for fragment in self.table.to_lance().get_fragments()]
+        table_dir = self.db_path / f"{self.table_name}.lance"
+        disk_bytes = sum(
+            path.stat().st_size for path in table_dir.rglob("*") if path.is_file()
+        ) if table_dir.exists() else None
+        return {
+            "fragment_count": len(fragment_rows),
+            "small_fragment_count": sum(1 for rows in fragment_rows if rows < SMALL_FRAGMENT_ROWS),
+            "version_count": len(self.table.list_versions()),
+            "current_version": self.table.version,
+            "disk_bytes": disk_bytes,
+        }
+
+    def refresh_index(self, force: bool = False) -> Optional[str]:
+        """
+        Create, rebuild or optimize the vector index once enough rows are unindexed.
+
+        A missing index is created once the table reaches MIN_ROWS_FOR_INDEX rows.
+        An index that covers fewer rows than are still unindexed is rebuilt so the
+        partitions are retrained on the current data; otherwise it is optimized.
+        HNSW indexes are always rebuilt, they cannot be optimized in place.
+        
+        Args:
+            force: Ignore index_refresh_rows and refresh whenever rows are unindexed
+            
+        Returns:
+            "created", "rebuilt", "optimized", or None when nothing was done
+        """
+        if self.index_refresh_rows is None and not force:
+            return None
+        if self.table is None:
+            self.connect()
+
+        threshold = 1 if force else self.index_refresh_rows
+        index = self._vector_index()
+        if index is None:
+            if self.table.count_rows() < MIN_ROWS_FOR_INDEX:
+                return None
+            self.create_index()
+            return "created"
+
+        index_stats = self.table.index_stats(index.name)
+        if index_stats is None or index_stats.num_unindexed_rows < threshold:
+            return None
+        if index_stats.num_unindexed_rows > index_stats.num_indexed_rows or self._has_hnsw_index():
+            # Keep the index type that was chosen when the index was first built
+            known_types = {member.value for member in VectorIndexType}
+            index_type = VectorIndexType(index.index_type) if index.index_type in known_types else None
+            self.create_index(index_type)
+            return "rebuilt"
+        self.optimize_index()
+        return "optimized"
+
+    def _diff_against_stored(
+        self, parsed_docs: List[ParsedDocument], doc_parts: List[DocPart]
+    ) -> Tuple[List[DocPart], List[str]]:
+        """
+        Compare incoming parts with the content hashes stored for the same files.
+
+        Args:
+            parsed_docs: The documents being upserted
+            doc_parts: Their (document, part) pairs
+
+        Returns:
+            The parts that are new or changed, and the chunk ids of stored
+            chunks of these files that are not part of the upsert
+        """
+        file_names = list(dict.fromkeys(doc.file_name for doc in parsed_docs))
+        if not file_names:
+            return doc_parts, []
+        stored = (
+            self.table.search()
+            .where(in_filter("file_name", file_names))
+            .select(["chunk_id", "content_hash"])
+            .limit(None)
+            .to_arrow()
+        )
+        stored_hashes = dict(zip(stored["chunk_id"].to_pylist(), stored["content_hash"].to_pylist()))
+
+        changed = [
+            (doc, part) for doc, part in doc_parts
+            if stored_hashes.get(self._chunk_id(doc, part)) != compute_content_hash(part.text)
+        ]
+        incoming_ids = {self._chunk_id(doc, part) for doc, part in doc_parts}
+        stale_chunk_ids = [chunk_id for chunk_id in stored_hashes if chunk_id not in incoming_ids]
+        logger.info(
+            f"Upsert of {len(doc_parts)} parts: {len(changed)} new or changed, "
+            f"{len(doc_parts) - len(changed)} unchanged, {len(stale_chunk_ids)} stale"
+        )
+        return changed, stale_chunk_ids
+
+    def _prepare_write_data(
+        self, doc_parts: List[DocPart]
+    ) -> Optional[Union[List[LanceModel], pa.RecordBatchReader]]:
+        """
+        Build the payload for ``table.add`` / ``merge_insert`` in the configured ingest mode.
+
+        Args:
+            doc_parts: List of (document, part) pairs
+
+        Returns:
+            A list of LanceModel rows or a streaming RecordBatchReader,
+            or None if there are no parts
+        """
+        if not doc_parts:
+            return None
+        if self.ingest_mode == IngestMode.ARROW:
+            return pa.RecordBatchReader.from_batches(
+                self._write_schema,
+                self._iter_record_batches(doc_parts),
+            )
+        return self._build_lance_models(doc_parts)
+
+    @staticmethod
+    def _parse_documents(documents: List[Union[ParsedDocument, Dict]]) -> List[ParsedDocument]:
+        """Validate dictionaries into ParsedDocument objects."""
+        return [
+            ParsedDocument.model_validate(doc) if isinstance(doc, dict) else doc
+            for doc in documents
+        ]
+
+    @classmethod
+    def _collect_doc_parts(cls, documents: List[Union[ParsedDocument, Dict]]) -> List[DocPart]:
+        """Validate the documents and flatten them into (document, part) pairs."""
+        return [(doc, part) for doc in cls._parse_documents(documents) for part in doc.parts]
+
+    @staticmethod
+    def _chunk_id(doc: ParsedDocument, part: ParsedDocumentParts) -> str:
+        """Stable id of a chunk, derived from the file name and the part label."""
+        return f"{doc.file_name}-{part.part}"
+
+    def _chunk_metadata(self, doc: ParsedDocument) -> ContractChunkMetadata:
+        """Look up the contract metadata of a document, falling back to the CWID from its file name."""
+        cwid = cwid_from_file_name(doc.file_name)
+        return self.contract_metadata.get(cwid) or ContractChunkMetadata(cwid=cwid)
+
+    def _embed_parts(self, doc_parts: List[DocPart]) -> List[List[float]]:
+        """
+        Embed the text of all parts through a single ``get_embeddings`` call.
+
+        The embedding client splits the texts into requests of its configured batch size.
+        """
+        vectors = self.embedding_client.get_embeddings([part.text for _, part in doc_parts])
+        if len(vectors) != len(doc_parts):
+            raise ValueError(
+                f"Embedding client returned {len(vectors)} vectors for {len(doc_parts)} parts"
+            )
+        return vectors
 
     def _convert_doc_to_lance_format(self, doc: ParsedDocument) -> List[LanceModel]:
         """
@@ -179,23 +1233,86 @@ class LanceDBVectorStore(VectorDBABC):
         Returns:
             List of DocumentWithMetadata objects
         """
+        return self._build_lance_models(self._collect_doc_parts([doc]))
+
+    def _build_lance_models(self, doc_parts: List[DocPart]) -> List[LanceModel]:
+        """
+        Embed the parts and wrap each one in a DocumentWithMetadata model.
+        
+        Args:
+            doc_parts: List of (document, part) pairs
+            
+        Returns:
+            List of DocumentWithMetadata objects
+        """
+        vectors = self._embed_parts(doc_parts)
+        schema = get_schema_by_dimension(self.dimension)
         documents = []
-        for part in doc.parts:
-            # Generate embedding for the text using the embedding client
-            vector = self.embedding_client.get_embedding(part.text)
-            schema = get_schema_by_dimension(self.dimension)
+        for (doc, part), vector in zip(doc_parts, vectors):
+            metadata = self._chunk_metadata(doc)
             document_unit = schema(
-                chunk_id=f"{doc.file_name}-{part.part}",
+                chunk_id=self._chunk_id(doc, part),
                 doc_id=doc.id_,
                 file_name=doc.file_name,
                 total_pages=doc.total_pages,
                 content=part.text,
                 part=part.part,
+                **metadata.model_dump(),
+                content_hash=compute_content_hash(part.text),
                 vector=vector,
             )
             documents.append(document_unit)
         return documents
 
+    def _iter_record_batches(self, doc_parts: List[DocPart]) -> Iterator[pa.RecordBatch]:
+        """
+        Embed the parts in slices of ``write_batch_size`` and yield one record batch per slice.
+
+        Args:
+            doc_parts: List of (document, part) pairs
+
+        Yields:
+            Record batches matching the table's Arrow schema
+        """
+        for chunk in iter_batches(doc_parts, self.write_batch_size):
+            yield self._build_record_batch(chunk, self._embed_parts(chunk))
+
+    def _build_record_batch(
+        self, doc_parts: List[DocPart], vectors: List[List[float]]
+    ) -> pa.RecordBatch:
+        """
+        Build a columnar record batch without creating a model instance per chunk.
+
+        Args:
+            doc_parts: List of (document, part) pairs
+            vectors: Embedding for each part, in the same order
+
+        Returns:
+            Record batch with a fixed-size-list float32 vector column
+        """
+        schema = self._write_schema
+        flat_vectors = np.asarray(vectors, dtype=np.float32).reshape(-1)
+        metadata = [self._chunk_metadata(doc) for doc, _ in doc_parts]
+        columns = {
+            "chunk_id": pa.array([self._chunk_id(doc, part) for doc, part in doc_parts], pa.string()),
+            "doc_id": pa.array([doc.id_ for doc, _ in doc_parts], pa.string()),
+            "file_name": pa.array([doc.file_name for doc, _ in doc_parts], pa.string()),
+            "total_pages": pa.array([doc.total_pages for doc, _ in doc_parts], pa.int64()),
+            "content": pa.array([part.text for _, part in doc_parts], pa.string()),
+            "part": pa.array([part.part for _, part in doc_parts], pa.string()),
+            "cwid": pa.array([meta.cwid for meta in metadata], pa.string()),
+            "supplier_name": pa.array([meta.supplier_name for meta in metadata], pa.string()),
+            "contract_type": pa.array([meta.contract_type for meta in metadata], pa.string()),
+            "purchase_date": pa.array([meta.purchase_date for meta in metadata], pa.date32()),
+            "expiry_date": pa.array([meta.expiry_date for meta in metadata], pa.date32()),
+            "content_hash": pa.array([compute_content_hash(part.text) for _, part in doc_parts], pa.string()),
+            "vector": pa.FixedSizeListArray.from_arrays(pa.array(flat_vectors), self.dimension),
+        }
+        if QUANTIZED_COLUMN in schema.names:
+            codes = quantize(flat_vectors.reshape(-1, self.dimension), self.quantization)
+            columns[QUANTIZED_COLUMN] = codes_to_arrow(codes)
+        return pa.RecordBatch.from_arrays([columns[field.name] for field in schema], schema=schema)
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Get statistics about the vector database.
@@ -211,8 +1328,25 @@ class LanceDBVectorStore(VectorDBABC):
             "dimension": self.dimension,
             "db_path": str(self.db_path),
             "table_name": self.table_name,
-            "embedding_model": str(self.embedding_client)
+            "embedding_model": str(self.embedding_client),
+            "vector_index": None,
+            "fts_index": None,
+            "quantization": self.quantization,
         }
+        index = self._vector_index()
+        if index is not None:
+            index_stats = self.table.index_stats(index.name)
+            stats["vector_index"] = {
+                "name": index.name,
+                "index_type": index.index_type,
+                "num_indexed_rows": index_stats.num_indexed_rows if index_stats else None,
+                "num_unindexed_rows": index_stats.num_unindexed_rows if index_stats else None,
+            }
+        fts_index = self._fts_index()
+        if fts_index is not None:
+            stats["fts_index"] = {"name": fts_index.name, "columns": fts_index.columns}
+        stats["storage"] = self.get_storage_stats()
+        stats["result_cache"] = self._result_cache.get_stats()
         return stats
 
     def load_from_json_directory(self, directory_path: Union[str, Path]) -> None:
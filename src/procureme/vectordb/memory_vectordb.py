@@ -0,0 +1,231 @@
+import json
+import logging
+import os
+import numpy as np
+import pyarrow as pa
+from typing import Any, Dict, List, Optional, Union
+from procureme.clients.embedder import EmbeddingClientABC
+from procureme.models.contract_model import ParsedDocument
+from procureme.vectordb.fusion import deduplicate_across_queries
+from procureme.vectordb.interface import VectorDBABC
+from procureme.vectordb.lance_vectordb import RESULT_COLUMNS, LanceDBVectorStore, SearchMode, SearchResults
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_rows(vectors: np.ndarray) -> np.ndarray:
+    """L2-normalize every row so a dot product equals the cosine similarity."""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return (vectors / norms).astype(np.float32, copy=False)
+
+
+class InMemoryVectorStore(VectorDBABC):
+    """
+    Exact cosine search over an in-memory copy of a Lance table.
+
+    The vectors live in a contiguous, pre-normalized float32 matrix saved as an
+    ``.npy`` file next to the Lance table and memory-mapped on load; the other
+    columns are kept in an Arrow IPC file. A query is answered with one matrix
+    product and ``argpartition``. Writes go to the Lance table, which stays the
+    source of truth, and the copy is re-synced afterwards. Filtered, full-text
+    and hybrid searches are answered by the Lance table as well.
+
+    ``_distance`` is the squared L2 distance of the normalized vectors,
+    ``2 - 2 * cosine``, which is what the Lance table reports for the
+    normalized embeddings of every supported model.
+    """
+
+    def __init__(
+        self,
+        source: LanceDBVectorStore,
+        embedding_client: Optional[EmbeddingClientABC] = None,
+        auto_sync: bool = False,
+    ):
+        """
+        Initialize the in-memory vector store.
+
+        Args:
+            source: Lance vector store to mirror
+            embedding_client: Client for query embeddings, the source's client if None
+            auto_sync: Check the Lance table version before every search and re-sync when it changed
+        """
+        self.source = source
+        self.embedding_client = embedding_client or source.embedding_client
+        self.auto_sync = auto_sync
+        self.matrix_path = source.db_path / f"{source.table_name}.npy"
+        self.rows_path = source.db_path / f"{source.table_name}.rows.arrow"
+        self.version_path = source.db_path / f"{source.table_name}.version.json"
+        self._matrix: Optional[np.ndarray] = None
+        self._rows: Optional[pa.Table] = None
+        self._version: Optional[int] = None
+        self.load()
+
+    @property
+    def dimension(self) -> int:
+        """Get the dimension of the vectors used in the database."""
+        return self.source.dimension
+
+    def save(self) -> None:
+        """Write the matrix, the row columns and the mirrored table version next to the Lance table."""
+        self.matrix_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to temporary files first so a concurrent load never sees a half written copy
+        matrix_tmp = self.matrix_path.parent / f"{self.matrix_path.name}.tmp"
+        with open(matrix_tmp, "wb") as f:
+            np.save(f, np.ascontiguousarray(self._matrix, dtype=np.float32))
+        rows_tmp = self.rows_path.parent / f"{self.rows_path.name}.tmp"
+        with pa.OSFile(str(rows_tmp), "wb") as sink:
+            with pa.ipc.new_file(sink, self._rows.schema) as writer:
+                writer.write_table(self._rows)
+        os.replace(matrix_tmp, self.matrix_path)
+        os.replace(rows_tmp, self.rows_path)
+        self.version_path.write_text(json.dumps({"version": self._version}))
+
+    def load(self) -> None:
+        """Memory-map the saved copy if it matches the Lance table version, otherwise sync."""
+        saved_version = None
+        if self.version_path.exists() and self.matrix_path.exists() and self.rows_path.exists():
+            saved_version = json.loads(self.version_path.read_text()).get("version")
+
+        if saved_version is None or saved_version != self.source.table.version:
+            self.sync()
+            return
+
+        self._matrix = np.load(self.matrix_path, mmap_mode="r")
+        self._rows = pa.ipc.open_file(pa.memory_map(str(self.rows_path))).read_all()
+        self._version = saved_version
+        logger.info(f"Loaded {len(self._rows)} vectors of {self.source.table_name} from {self.matrix_path}")
+
+    def sync(self) -> None:
+        """Copy the current Lance table into memory and save it."""
+        table = self.source.table.to_arrow()
+        version = self.source.table.version
+        vectors = table["vector"].combine_chunks()
+        flat = vectors.flatten().to_numpy(zero_copy_only=False)
+        self._matrix = normalize_rows(flat.reshape(len(table), self.dimension))
+        self._rows = table.select(RESULT_COLUMNS)
+        self._version = version
+        self.save()
+        logger.info(f"Synced {len(table)} vectors of {self.source.table_name} at version {version}")
+
+    def refresh(self) -> bool:
+        """
+        Re-sync if the Lance table moved to a newer version.
+
+        Returns:
+            True if the in-memory copy was rebuilt
+        """
+        self.source.refresh()
+        if self.source.table.version == self._version:
+            return False
+        self.sync()
+        return True
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 20,
+        mode: SearchMode = SearchMode.VECTOR,
+        where: Optional[str] = None,
+        as_arrow: bool = False,
+    ) -> SearchResults:
+        """
+        Search for the top_k most similar documents to the query.
+
+        Args:
+            query: The query text to search for
+            top_k: The number of results to return
+            mode: Only vector search runs in memory, other modes go to the Lance table
+            where: SQL filter, filtered searches go to the Lance table
+            as_arrow: Return a pyarrow Table instead of a list of dicts
+
+        Returns:
+            List of document dictionaries with ``_distance``, or a Table if as_arrow
+        """
+        if mode != SearchMode.VECTOR or where:
+            return self.source.search(query, top_k=top_k, mode=mode, where=where, as_arrow=as_arrow)
+        return self.search_by_vector(self.embedding_client.get_embedding(query), top_k, as_arrow)
+
+    def search_by_vector(
+        self, query_vector: List[float], top_k: int = 20, as_arrow: bool = False
+    ) -> SearchResults:
+        """
+        Exact search for an already embedded query.
+
+        Args:
+            query_vector: Query embedding with the table's dimension
+            top_k: The number of results to return
+            as_arrow: Return a pyarrow Table instead of a list of dicts
+
+        Returns:
+            List of document dictionaries with ``_distance``, or a Table if as_arrow
+        """
+        if self.auto_sync:
+            self.refresh()
+        query = normalize_rows(np.asarray(query_vector, dtype=np.float32))
+        hits = self._top_k(self._matrix @ query, top_k)
+        return hits if as_arrow else hits.to_pylist()
+
+    def search_many(self, queries: List[str], top_k: int = 20) -> List[List[Dict[str, Any]]]:
+        """
+        Search several queries with one batched embedding call and one matrix product.
+
+        Args:
+            queries: The query texts to search for
+            top_k: The number of results to return per query
+
+        Returns:
+            One list of document dictionaries per query, without cross-query duplicates
+        """
+        if not queries:
+            return []
+        if self.auto_sync:
+            self.refresh()
+        query_matrix = normalize_rows(
+            np.asarray(self.embedding_client.get_query_embeddings(list(queries)), dtype=np.float32)
+        )
+        scores = query_matrix @ self._matrix.T
+        return deduplicate_across_queries([self._top_k(row, top_k).to_pylist() for row in scores])
+
+    def _top_k(self, scores: np.ndarray, top_k: int) -> pa.Table:
+        """Select the rows with the highest cosine similarity, best first."""
+        k = min(top_k, len(scores))
+        ranked = np.argpartition(-scores, k - 1)[:k] if k else np.empty(0, dtype=np.int64)
+        ranked = ranked[np.argsort(-scores[ranked])]
+        columns = [name for name in RESULT_COLUMNS if name in self._rows.column_names]
+        hits = self._rows.take(pa.array(ranked)).select(columns)
+        # Squared L2 of unit vectors, clipped at 0 against rounding of near-identical vectors
+        distances = np.maximum(2.0 - 2.0 * scores[ranked], 0.0)
+        return hits.append_column("_distance", pa.array(distances, type=pa.float32()))
+
+    def insert(self, documents: List[Union[ParsedDocument, Dict]]) -> None:
+        """Insert documents into the Lance table and re-sync the in-memory copy."""
+        self.source.insert(documents)
+        self.sync()
+
+    def delete(self, index_id: str) -> None:
+        """Delete a chunk from the Lance table and re-sync the in-memory copy."""
+        self.source.delete(index_id)
+        self.sync()
+
+    def upsert(self, documents: List[Union[ParsedDocument, Dict]]) -> None:
+        """Upsert documents into the Lance table and re-sync the in-memory copy."""
+        self.source.upsert(documents)
+        self.sync()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics about the in-memory copy.
+
+        Returns:
+            Dictionary containing stats about the database
+        """
+        return {
+            "total_documents": len(self._rows),
+            "dimension": self.dimension,
+            "matrix_bytes": int(self._matrix.nbytes),
+            "matrix_path": str(self.matrix_path),
+            "table_name": self.source.table_name,
+            "table_version": self._version,
+            "embedding_model": str(self.embedding_client),
+        }
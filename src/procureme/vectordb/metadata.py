@@ -0,0 +1,43 @@
+import json
+from logging import getLogger
+from pathlib import Path
+from typing import Dict, Union
+from pydantic import ValidationError
+from procureme.models.contract_model import ContractChunkMetadata
+
+logger = getLogger(__name__)
+
+
+def cwid_from_file_name(file_name: str) -> str:
+    """Derive the contract CWID from a file name such as ``CW0307.pdf``."""
+    return Path(file_name).name.split(".")[0]
+
+
+def load_contract_metadata(directory_path: Union[str, Path]) -> Dict[str, ContractChunkMetadata]:
+    """
+    Load the gold contract metadata JSON files, keyed by CWID.
+    
+    Args:
+        directory_path: Directory containing one ``<CWID>.json`` file per contract
+        
+    Returns:
+        Dictionary mapping CWID to the metadata stored on every chunk of that contract
+    """
+    if isinstance(directory_path, str):
+        directory_path = Path(directory_path)
+
+    if not directory_path.exists() or not directory_path.is_dir():
+        raise ValueError(f"Directory {directory_path} does not exist or is not a directory")
+
+    metadata = {}
+    for file_path in directory_path.glob("*.json"):
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            data.setdefault("cwid", cwid_from_file_name(file_path.name))
+            contract = ContractChunkMetadata.model_validate(data)
+            metadata[contract.cwid] = contract
+        except (json.JSONDecodeError, ValidationError) as e:
+            logger.error(f"Error loading metadata {file_path}: {e}")
+    logger.info(f"Loaded metadata for {len(metadata)} contracts from {directory_path}")
+    return metadata
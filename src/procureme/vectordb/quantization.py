@@ -0,0 +1,83 @@
+import numpy as np
+import pyarrow as pa
+from enum import StrEnum
+
+
+QUANTIZED_COLUMN = "vector_q"
+# Candidates fetched by the quantized first pass per requested result, before float32 rescoring
+DEFAULT_OVERSAMPLE = 8
+INT8_SCALE = 127
+# Rows scored at once, bounds the temporary arrays of the first pass
+SCORE_BLOCK_ROWS = 65_536
+
+# Number of set bits of every byte value
+_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1).astype(np.uint16)
+
+
+class QuantizationType(StrEnum):
+    BINARY = "binary"
+    INT8 = "int8"
+
+
+def code_width(quantization: QuantizationType, dimension: int) -> int:
+    """Number of code elements per vector: one byte per 8 dimensions for binary, one per dimension for int8."""
+    if QuantizationType(quantization) == QuantizationType.BINARY:
+        return (dimension + 7) // 8
+    return dimension
+
+
+def quantized_field(quantization: QuantizationType, dimension: int) -> pa.Field:
+    """Arrow field of the quantized vector column."""
+    value_type = pa.uint8() if QuantizationType(quantization) == QuantizationType.BINARY else pa.int8()
+    return pa.field(QUANTIZED_COLUMN, pa.list_(value_type, code_width(quantization, dimension)))
+
+
+def quantization_of_field(field: pa.Field) -> QuantizationType:
+    """Tell the quantization of an existing quantized column from its value type."""
+    if field.type.value_type == pa.uint8():
+        return QuantizationType.BINARY
+    return QuantizationType.INT8
+
+
+def quantize(vectors: np.ndarray, quantization: QuantizationType) -> np.ndarray:
+    """
+    Quantize a matrix of float vectors, one row per vector.
+
+    Binary codes keep the sign of every component, packed 8 per byte. Int8
+    codes scale the L2-normalized vector by 127, so their dot product ranks
+    like the cosine similarity.
+
+    Returns:
+        A uint8 matrix of packed sign bits or an int8 matrix
+    """
+    vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+    if QuantizationType(quantization) == QuantizationType.BINARY:
+        return np.packbits(vectors > 0, axis=1)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return np.clip(np.rint(vectors / norms * INT8_SCALE), -INT8_SCALE, INT8_SCALE).astype(np.int8)
+
+
+def codes_to_arrow(codes: np.ndarray) -> pa.FixedSizeListArray:
+    """Wrap a code matrix in a fixed-size-list array, one list per row."""
+    return pa.FixedSizeListArray.from_arrays(pa.array(codes.reshape(-1)), codes.shape[1])
+
+
+def first_pass_scores(codes: np.ndarray, query_code: np.ndarray, quantization: QuantizationType) -> np.ndarray:
+    """
+    Score every code against the query code, higher is more similar.
+
+    Binary codes score the negated Hamming distance, int8 codes the dot product.
+    """
+    binary = QuantizationType(quantization) == QuantizationType.BINARY
+    query = query_code.reshape(-1) if binary else query_code.reshape(-1).astype(np.float32)
+    scores = np.empty(len(codes), dtype=np.float32)
+    for start in range(0, len(codes), SCORE_BLOCK_ROWS):
+        block = codes[start:start + SCORE_BLOCK_ROWS]
+        if binary:
+            hamming = _POPCOUNT[np.bitwise_xor(block, query)].sum(axis=1)
+            scores[start:start + len(block)] = -hamming.astype(np.float32)
+        else:
+            # int8 products overflow in int8, widen one block at a time
+            scores[start:start + len(block)] = block.astype(np.float32) @ query
+    return scores
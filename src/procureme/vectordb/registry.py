@@ -0,0 +1,94 @@
+import threading
+from logging import getLogger
+from typing import Callable, Dict, List, Optional, Tuple
+from procureme.vectordb.interface import VectorDBABC
+
+logger = getLogger(__name__)
+
+RegistryKey = Tuple[str, str]
+
+
+class VectorStoreRegistry:
+    """
+    Thread-safe, process-wide cache of opened vector stores.
+
+    Stores are keyed by table name and embedding model, so the embedding client
+    and the Lance connection and table are created once per process and shared
+    by every caller.
+    """
+
+    def __init__(self):
+        self._stores: Dict[RegistryKey, VectorDBABC] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        table_name: str,
+        embedding_model: str,
+        factory: Callable[[], VectorDBABC],
+    ) -> VectorDBABC:
+        """
+        Return the shared store for the key, creating it with factory on first use.
+
+        Args:
+            table_name: Name of the Lance table
+            embedding_model: Name of the embedding model the table was built with
+            factory: Builds the store when it is not registered yet
+
+        Returns:
+            The shared vector store
+        """
+        key = (table_name, str(embedding_model))
+        store = self._stores.get(key)
+        if store is not None:
+            return store
+
+        with self._lock:
+            # Another thread may have built the store while we waited for the lock
+            store = self._stores.get(key)
+            if store is None:
+                store = factory()
+                self._stores[key] = store
+                logger.info(f"Registered vector store for table {table_name} with {embedding_model}")
+        return store
+
+    def reload(self, table_name: Optional[str] = None, force: bool = False) -> List[RegistryKey]:
+        """
+        Move registered stores to the latest table version.
+
+        Args:
+            table_name: Only reload stores of this table, all stores if None
+            force: Reconnect to the database instead of checking out the latest version
+
+        Returns:
+            Keys of the stores whose table changed (every matching key when forced)
+        """
+        with self._lock:
+            items = [
+                (key, store) for key, store in self._stores.items()
+                if table_name is None or key[0] == table_name
+            ]
+
+        reloaded = []
+        for key, store in items:
+            if force:
+                store.load()
+                reloaded.append(key)
+            elif store.refresh():
+                reloaded.append(key)
+        if reloaded:
+            logger.info(f"Reloaded vector stores: {reloaded}")
+        return reloaded
+
+    def clear(self) -> None:
+        """Forget all registered stores."""
+        with self._lock:
+            self._stores.clear()
+
+    def keys(self) -> List[RegistryKey]:
+        """Return the keys of all registered stores."""
+        with self._lock:
+            return list(self._stores)
+
+
+registry = VectorStoreRegistry()
@@ -0,0 +1,139 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
+import pyarrow as pa
+from procureme.clients.cached_embedder import normalize_text
+
+
+DEFAULT_RESULT_CACHE_SIZE = 1024
+
+CacheKey = Tuple[Hashable, ...]
+Results = Union[List[Dict[str, Any]], pa.Table]
+
+
+def estimate_result_bytes(results: Results) -> int:
+    """Rough size of a result list, counting the dictionaries and their values."""
+    if isinstance(results, pa.Table):
+        return results.nbytes
+    size = sys.getsizeof(results)
+    for hit in results:
+        size += sys.getsizeof(hit)
+        size += sum(sys.getsizeof(value) for value in hit.values())
+    return size
+
+
+class SearchResultCache:
+    """
+    Thread-safe LRU cache of search results with an optional time to live.
+
+    Entries belong to one table version: once the cache is asked for another
+    version, every entry of the previous version is dropped. Cached results are
+    copied on the way in and out, so callers may modify the hits they receive;
+    Arrow tables are immutable and shared as they are.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_RESULT_CACHE_SIZE, ttl_seconds: Optional[float] = None):
+        """
+        Initialize the result cache.
+
+        Args:
+            max_entries: Maximum number of cached result lists before LRU eviction
+            ttl_seconds: Drop entries older than this, None keeps them until evicted
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[CacheKey, Tuple[float, int, Results]]" = OrderedDict()
+        self._version: Optional[int] = None
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(query: str, top_k: int, **params: Any) -> CacheKey:
+        """Build a cache key from the normalized query, top_k and the other search parameters."""
+        return (normalize_text(query), top_k, *sorted((name, str(value)) for name, value in params.items()))
+
+    @staticmethod
+    def _copy(results: Results) -> Results:
+        if isinstance(results, pa.Table):
+            return results
+        return [dict(hit) for hit in results]
+
+    def get(self, key: CacheKey, version: int) -> Optional[Results]:
+        """
+        Return a copy of the cached results for key at version, or None on a miss.
+        """
+        with self._lock:
+            self._check_version(version)
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl_seconds is not None and time.monotonic() - entry[0] > self.ttl_seconds:
+                self._pop(key)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return self._copy(entry[2])
+
+    def put(self, key: CacheKey, version: int, results: Results) -> None:
+        """Cache a copy of results for key at version."""
+        if self.max_entries <= 0:
+            return
+        copied = self._copy(results)
+        size = estimate_result_bytes(copied)
+        with self._lock:
+            if self._version is None:
+                self._version = version
+            if version != self._version:
+                # The table moved on while this search ran, its results are already stale
+                return
+            if key in self._entries:
+                self._pop(key)
+            self._entries[key] = (time.monotonic(), size, copied)
+            self._bytes += size
+            while len(self._entries) > self.max_entries:
+                self._pop(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _check_version(self, version: int) -> None:
+        if version != self._version:
+            if self._entries:
+                self._invalidations += 1
+            self._entries.clear()
+            self._bytes = 0
+            self._version = version
+
+    def _pop(self, key: CacheKey) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get hit rate and memory statistics of the cache.
+
+        Returns:
+            Dictionary with hits, misses, hit rate, entries and approximate bytes held
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "approx_bytes": self._bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "table_version": self._version,
+                "invalidations": self._invalidations,
+            }
@@ -0,0 +1,18 @@
+import statistics
+from typing import List
+
+
+def percentile(values: List[float], pct: int) -> float:
+    """Return the pct-th percentile of values."""
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100, method="inclusive")[pct - 1]
+
+
+def recall_at_k(retrieved: List[List[str]], ground_truth: List[List[str]]) -> float:
+    """Mean share of the ground-truth hits that were retrieved, over all queries."""
+    recalls = [
+        len(set(hits) & set(truth)) / len(truth)
+        for hits, truth in zip(retrieved, ground_truth) if truth
+    ]
+    return statistics.fmean(recalls) if recalls else 0.0
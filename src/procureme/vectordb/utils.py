@@ -1,38 +1,139 @@
 from pathlib import Path
 from procureme.vectordb.lance_vectordb import LanceDBVectorStore
+from procureme.vectordb.memory_vectordb import InMemoryVectorStore
+from procureme.vectordb.federated_vectordb import DEFAULT_TABLE_TIMEOUT, FederatedVectorStore
+from procureme.vectordb.interface import VectorDBABC
+from procureme.vectordb.registry import RegistryKey, registry
 from procureme.clients.ollama_embedder import OllamaEmbeddingClient
 from procureme.clients.openai_embedder import OpenAIEmbeddingClient
+from procureme.clients.local_embedder import LocalEmbeddingClient
+from procureme.clients.embedder import EmbeddingClientABC
+from procureme.clients.cached_embedder import CachedEmbeddingClient
+from procureme.clients.batching_embedder import MicroBatchingEmbeddingClient
+from procureme.configurations.aimodels import EmbeddingModelSelection
 from logging import getLogger
+from typing import List, Optional
 import os
 
 logger = getLogger(__name__)
 
-def get_vector_store():
-    table_name = os.getenv("VECTOR_INDEX", "contracts_naive")
-    vector_db_path = Path("vectordb").joinpath("contracts.db")
+VECTOR_DB_PATH = Path("vectordb").joinpath("contracts.db")
+
+
+def get_embedding_client(name: str, **kwargs) -> EmbeddingClientABC:
+    """Create an embedding client by its short name ("openai", "ollama" or "local")."""
+    if name == "openai":
+        return OpenAIEmbeddingClient(**kwargs)
+    if name == "ollama":
+        return OllamaEmbeddingClient(**kwargs)
+    if name == "local":
+        return LocalEmbeddingClient(**kwargs)
+    raise ValueError(f"Unknown embedding client: {name}")
+
+
+def embedding_dimensions(table_name: str) -> Optional[int]:
+    """
+    Reduced embedding dimension a table was built with, None for the model's full size.
+
+    EMBEDDING_DIMENSIONS_<TABLE_NAME> (upper case) applies to one table and
+    overrides EMBEDDING_DIMENSIONS, which applies to all tables.
+    """
+    value = os.getenv(f"EMBEDDING_DIMENSIONS_{table_name.upper()}") or os.getenv("EMBEDDING_DIMENSIONS")
+    return int(value) if value else None
+
+
+def _create_vector_store(table_name: str, backend: str = "lance") -> VectorDBABC:
+    dimensions = embedding_dimensions(table_name)
     if table_name == "contracts_naive":
-        emb_client = OllamaEmbeddingClient()
-        vector_store = LanceDBVectorStore(
-            db_path=vector_db_path, 
-            table_name=table_name, 
-            embedding_client=emb_client
-        )
-        logger.info("Vector DB Loaded successfully.")
-        return vector_store
-    emb_client = OpenAIEmbeddingClient()
+        emb_client = OllamaEmbeddingClient(dimensions=dimensions)
+        try:
+            # Pay the model load at startup rather than on the first search
+            emb_client.warm_up()
+        except Exception as e:
+            logger.warning(f"Ollama warm-up failed, the model loads on the first request: {e}")
+    elif table_name.endswith("_local"):
+        emb_client = LocalEmbeddingClient(dimensions=dimensions)
+    else:
+        emb_client = OpenAIEmbeddingClient(dimensions=dimensions)
+    micro_batch_ms = os.getenv("EMBEDDING_MICRO_BATCH_MS")
+    if micro_batch_ms:
+        emb_client = MicroBatchingEmbeddingClient(emb_client, max_wait_ms=float(micro_batch_ms))
+    # The cache wraps the batcher so cache hits never wait for a batch window
+    cache_path = os.getenv("EMBEDDING_CACHE_PATH")
+    if cache_path:
+        emb_client = CachedEmbeddingClient(emb_client, cache_path)
+    result_cache_ttl = os.getenv("SEARCH_CACHE_TTL_SECONDS")
+    search_oversample = os.getenv("QUANTIZED_SEARCH_OVERSAMPLE")
     vector_store = LanceDBVectorStore(
-        db_path=vector_db_path, 
+        db_path=VECTOR_DB_PATH, 
         table_name=table_name, 
-        embedding_client=emb_client
+        embedding_client=emb_client,
+        result_cache_ttl=float(result_cache_ttl) if result_cache_ttl else None,
+        search_oversample=int(search_oversample) if search_oversample else None,
     )
+    if backend == "memory":
+        vector_store = InMemoryVectorStore(vector_store)
     logger.info("Vector DB Loaded successfully.")
     return vector_store
 
 
+def _get_table_store(table_name: str, backend: str) -> VectorDBABC:
+    if table_name == "contracts_naive":
+        embedding_model = EmbeddingModelSelection.NOMIC
+    elif table_name.endswith("_local"):
+        embedding_model = os.getenv("LOCAL_EMBEDDING_MODEL", EmbeddingModelSelection.MXBAI_LARGE)
+    else:
+        embedding_model = EmbeddingModelSelection.EMBED_SMALL
+    return registry.get(
+        table_name,
+        f"{embedding_model}:{embedding_dimensions(table_name) or 'full'}:{backend}",
+        lambda: _create_vector_store(table_name, backend),
+    )
+
+
+def get_vector_store() -> VectorDBABC:
+    """
+    Return the process-wide vector store for the table named by VECTOR_INDEX.
+
+    The embedding client and the Lance table are created on the first call
+    and shared by all later calls. Query embeddings are cached on disk when
+    EMBEDDING_CACHE_PATH is set, and concurrent query embeddings are coalesced
+    into batches when EMBEDDING_MICRO_BATCH_MS is set. VECTOR_BACKEND=memory serves searches from
+    an in-memory copy of the table instead of the Lance dataset. Tables whose
+    name ends in ``_local`` are embedded on CPU by LocalEmbeddingClient.
+    Tables built with reduced dimensions need EMBEDDING_DIMENSIONS (or
+    EMBEDDING_DIMENSIONS_<TABLE_NAME>) set to the same value.
+    Unfiltered vector searches on quantized tables run as a two-pass
+    quantized search when QUANTIZED_SEARCH_OVERSAMPLE is set.
+
+    A comma-separated VECTOR_INDEX, e.g. ``contracts_naive,contracts_oai``,
+    searches all listed tables concurrently and merges their results, waiting
+    at most FEDERATED_TABLE_TIMEOUT seconds for each table.
+    """
+    table_names = [name.strip() for name in os.getenv("VECTOR_INDEX", "contracts_naive").split(",") if name.strip()]
+    backend = os.getenv("VECTOR_BACKEND", "lance")
+    if len(table_names) == 1:
+        return _get_table_store(table_names[0], backend)
+
+    # Open the member tables first, the registry lock is not reentrant
+    stores = {name: _get_table_store(name, backend) for name in table_names}
+    timeout = float(os.getenv("FEDERATED_TABLE_TIMEOUT", DEFAULT_TABLE_TIMEOUT))
+    return registry.get(
+        ",".join(table_names),
+        f"federated:{backend}",
+        lambda: FederatedVectorStore(stores, timeout=timeout),
+    )
+
+
+def reload_vector_store(table_name: Optional[str] = None, force: bool = False) -> List[RegistryKey]:
+    """Move the shared vector stores to the latest table version, see VectorStoreRegistry.reload."""
+    return registry.reload(table_name, force=force)
+
+
 if __name__ == "__main__":
     from procureme.configurations.app_configs import Settings
     settings = Settings()
     os.environ["VECTOR_TABLE"] = "contracts_oai"
     os.environ["OPENAI_API_KEY"] = settings.OPENAI_API_KEY
     vector_store = get_vector_store()
-    print(vector_store.get_stats())
\ No newline at end of file
+    print(vector_store.get_stats())
@@ -1,7 +1,26 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
+from procureme.vectordb.utils import get_vector_store
 from .routers import chat
 
+import logging
 
-app = FastAPI()
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the vector store, and so warm up its embedding model, before the first request is served."""
+    try:
+        await run_in_threadpool(get_vector_store)
+    except Exception as e:
+        # Requests open the store themselves and report the error if it still fails
+        logger.error(f"Could not open the vector store at startup: {e}")
+    yield
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.include_router(chat.router)
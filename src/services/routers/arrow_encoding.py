@@ -0,0 +1,50 @@
+from typing import Iterator, Union
+import pyarrow as pa
+import pyarrow.compute as pc
+
+
+JSON_MEDIA_TYPE = "application/json"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+# Rows per streamed chunk, small enough to start sending quickly for a large top_k
+STREAM_BATCH_ROWS = 256
+
+# End-of-stream marker of the Arrow IPC streaming format
+_IPC_END_OF_STREAM = b"\xff\xff\xff\xff\x00\x00\x00\x00"
+
+
+def with_public_column_names(table: pa.Table) -> pa.Table:
+    """Strip the leading underscore of score columns such as ``_distance`` to match the response schema."""
+    return table.rename_columns([name.lstrip("_") for name in table.column_names])
+
+
+def _to_json(data: Union[pa.Table, pa.RecordBatch], lines: bool) -> str:
+    """
+    Serialize whole columns with pandas' C JSON encoder, without building a dict per row.
+
+    Dates and timestamps are cast to ISO strings in Arrow first, nulls become null.
+    """
+    columns = [pc.cast(column, pa.string()) if pa.types.is_temporal(column.type) else column for column in data.columns]
+    frame = type(data).from_arrays(columns, names=data.schema.names).to_pandas()
+    return frame.to_json(orient="records", lines=lines, force_ascii=False)
+
+
+def table_to_json(table: pa.Table) -> bytes:
+    """Encode a table as a JSON array of row objects."""
+    return _to_json(table, lines=False).encode("utf-8")
+
+
+def iter_ndjson(table: pa.Table) -> Iterator[bytes]:
+    """Yield a table as newline-delimited JSON, one chunk per record batch."""
+    for batch in table.to_batches(max_chunksize=STREAM_BATCH_ROWS):
+        if batch.num_rows:
+            yield (_to_json(batch, lines=True).rstrip("\n") + "\n").encode("utf-8")
+
+
+def iter_arrow_ipc(table: pa.Table) -> Iterator[bytes]:
+    """Yield a table in the Arrow IPC streaming format, one message per record batch."""
+    yield table.schema.serialize().to_pybytes()
+    for batch in table.to_batches(max_chunksize=STREAM_BATCH_ROWS):
+        yield batch.serialize().to_pybytes()
+    yield _IPC_END_OF_STREAM
@@ -1,4 +1,6 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Header
+from fastapi.responses import Response, StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from sqlmodel import Session, select
 from typing import List
 from uuid import UUID
@@ -7,7 +9,17 @@ import os
 
 from procureme.dbmodels.session import ChatSession, ChatMessage, ChatRole
 from .schema import ChatRequest, ChatResponse, EnvInfo, ChatSessionSummary, RetrievedDocument, QueryRequest
-from procureme.vectordb.utils import get_vector_store
+from .arrow_encoding import (
+    ARROW_STREAM_MEDIA_TYPE,
+    JSON_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    iter_arrow_ipc,
+    iter_ndjson,
+    table_to_json,
+    with_public_column_names,
+)
+from procureme.vectordb.utils import get_vector_store, reload_vector_store
+from procureme.vectordb.filters import and_filters, eq_filter
 from procureme.configurations.app_configs import get_session, DEFAULT_ENV_FILE
 from procureme.agents.orchrastrator import OrchrastratorAgent
 from procureme.clients.openai_chat import OpenAIClient
@@ -148,24 +160,43 @@ def chat_endpoint(payload: ChatRequest, db: Session = Depends(get_session)):
 
 
 @router.post("/search", response_model=List[RetrievedDocument])
-def search_vector_db(request: QueryRequest) -> list:
-    try:
-        vector_store = get_vector_store()
-        documents = vector_store.search(query=request.question, top_k=5)
-
-        # Optional: rename _distance to distance to avoid underscore issues
-        formatted = []
-        for doc in documents:
-            if '_distance' in doc:
-                doc['distance'] = doc.pop('_distance')  # rename for schema match
-            formatted.append(doc)
+async def search_vector_db(request: QueryRequest, accept: str = Header(default=JSON_MEDIA_TYPE)):
+    """
+    Retrieve chunks for a question, encoded straight from the Arrow result.
 
-        return formatted
+    Send ``Accept: application/vnd.apache.arrow.stream`` for Arrow IPC or
+    ``Accept: application/x-ndjson`` for streamed JSON lines; anything else gets a JSON array.
+    """
+    try:
+        # Only the first call opens the store, keep that off the event loop
+        vector_store = await run_in_threadpool(get_vector_store)
+        where = and_filters(
+            eq_filter("cwid", request.cwid) if request.cwid else None,
+            eq_filter("supplier_name", request.supplier_name) if request.supplier_name else None,
+        )
+        table = await vector_store.asearch(
+            query=request.question, top_k=request.top_k, mode=request.mode, where=where, as_arrow=True
+        )
+        # Rename _distance, _score and _relevance_score to match RetrievedDocument
+        table = with_public_column_names(table)
+
+        if ARROW_STREAM_MEDIA_TYPE in accept:
+            return StreamingResponse(iter_arrow_ipc(table), media_type=ARROW_STREAM_MEDIA_TYPE)
+        if NDJSON_MEDIA_TYPE in accept:
+            return StreamingResponse(iter_ndjson(table), media_type=NDJSON_MEDIA_TYPE)
+        return Response(table_to_json(table), media_type=JSON_MEDIA_TYPE)
     except Exception as e:
         logger.error(f"Retrieval error: {e}")
         raise HTTPException(status_code=500, detail=f"Could not query vector store: {e}")
 
 
+@router.post("/vector-store/reload")
+def reload_vector_db(force: bool = False):
+    """Point the shared vector store at the latest table version, e.g. after an ETL run."""
+    reloaded = reload_vector_store(force=force)
+    return {"success": True, "reloaded": [table_name for table_name, _ in reloaded]}
+
+
 # --------- DELETE Session ---------
 @router.delete("/{session_id}")
 def delete_session(session_id: UUID, db: Session = Depends(get_session)):
@@ -1,7 +1,8 @@
 from pydantic import BaseModel
 from uuid import UUID
 from typing import List, Optional
-from datetime import datetime
+from datetime import date, datetime
+from procureme.vectordb.lance_vectordb import SearchMode
 
 class ChatRequest(BaseModel):
     session_id: UUID
@@ -38,8 +39,19 @@ class RetrievedDocument(BaseModel):
     total_pages: int
     content: str
     part: Optional[str] = None
-    distance: float
+    cwid: Optional[str] = None
+    supplier_name: Optional[str] = None
+    contract_type: Optional[str] = None
+    purchase_date: Optional[date] = None
+    expiry_date: Optional[date] = None
+    distance: Optional[float] = None
+    score: Optional[float] = None
+    relevance_score: Optional[float] = None
 
 
 class QueryRequest(BaseModel):
-    question: str
\ No newline at end of file
+    question: str
+    top_k: int = 5
+    mode: SearchMode = SearchMode.VECTOR
+    cwid: Optional[str] = None
+    supplier_name: Optional[str] = None
\ No newline at end of file
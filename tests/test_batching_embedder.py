@@ -0,0 +1,61 @@
+from typing import List
+
+import pytest
+
+from procureme.clients.batching_embedder import MicroBatchingEmbeddingClient
+from procureme.clients.embedder import EmbeddingClientABC
+
+
+class ShortBatchClient(EmbeddingClientABC):
+    """Returns one vector too few on the first call, then behaves."""
+
+    def __init__(self):
+        self.calls = 0
+
+    @property
+    def dimension(self) -> int:
+        return 2
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.get_embeddings([text])[0]
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        self.calls += 1
+        vectors = [[float(len(text)), 1.0] for text in texts]
+        return vectors[:-1] if self.calls == 1 else vectors
+
+    async def aget_embedding(self, text: str) -> List[float]:
+        return self.get_embedding(text)
+
+    async def aget_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return self.get_embeddings(texts)
+
+
+def test_short_batch_fails_its_callers_and_the_worker_keeps_running():
+    client = MicroBatchingEmbeddingClient(ShortBatchClient(), max_wait_ms=1)
+    try:
+        with pytest.raises(ValueError, match="returned 1 vectors for 2 texts"):
+            client.get_embeddings(["a", "bb"])
+        assert client.get_embeddings(["a", "bb", "a"]) == [[1.0, 1.0], [2.0, 1.0], [1.0, 1.0]]
+    finally:
+        client.close()
+
+
+class PromptedClient(ShortBatchClient):
+    """Marks query vectors with a 2.0, like a model that prepends a query prompt."""
+
+    def __init__(self):
+        self.calls = 1
+
+    def get_query_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return [[float(len(text)), 2.0] for text in texts]
+
+
+def test_queries_and_documents_are_embedded_in_separate_calls():
+    client = MicroBatchingEmbeddingClient(PromptedClient(), max_wait_ms=1)
+    try:
+        assert client.get_embedding("a") == [1.0, 2.0]
+        assert client.get_query_embeddings(["a", "bb"]) == [[1.0, 2.0], [2.0, 2.0]]
+        assert client.get_embeddings(["a", "bb"]) == [[1.0, 1.0], [2.0, 1.0]]
+    finally:
+        client.close()
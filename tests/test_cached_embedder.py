@@ -0,0 +1,101 @@
+from typing import List
+
+from procureme.clients import cached_embedder
+from procureme.clients.cached_embedder import CachedEmbeddingClient
+from procureme.clients.embedder import EmbeddingClientABC
+
+
+class CountingClient(EmbeddingClientABC):
+    """Embeds a text to its length, marks query vectors with a 2.0 and counts the embedded texts."""
+
+    model_name = "counting"
+
+    def __init__(self):
+        self.embedded: List[str] = []
+
+    @property
+    def dimension(self) -> int:
+        return 2
+
+    def get_embedding(self, text: str) -> List[float]:
+        return self.get_query_embeddings([text])[0]
+
+    def get_embeddings(self, texts: List[str]) -> List[List[float]]:
+        self.embedded.extend(texts)
+        return [[float(len(text)), 1.0] for text in texts]
+
+    def get_query_embeddings(self, texts: List[str]) -> List[List[float]]:
+        self.embedded.extend(texts)
+        return [[float(len(text)), 2.0] for text in texts]
+
+    async def aget_embedding(self, text: str) -> List[float]:
+        return self.get_embedding(text)
+
+    async def aget_embeddings(self, texts: List[str]) -> List[List[float]]:
+        return self.get_embeddings(texts)
+
+
+def make_client(tmp_path, **kwargs) -> CachedEmbeddingClient:
+    return CachedEmbeddingClient(CountingClient(), tmp_path / "embeddings.sqlite", **kwargs)
+
+
+def test_queries_and_documents_are_cached_apart(tmp_path):
+    client = make_client(tmp_path)
+    try:
+        assert client.get_embeddings(["payment terms"]) == [[13.0, 1.0]]
+        assert client.get_embedding("payment terms") == [13.0, 2.0]
+        assert client.get_query_embeddings(["payment terms"]) == [[13.0, 2.0]]
+        assert client.get_embeddings(["payment terms"]) == [[13.0, 1.0]]
+        assert client.client.embedded == ["payment terms", "payment terms"]
+    finally:
+        client.close()
+
+
+def test_only_misses_reach_the_wrapped_client(tmp_path):
+    client = make_client(tmp_path)
+    try:
+        client.get_embeddings(["laptop", "mouse"])
+        assert client.get_embeddings(["mouse", "laptop  ", "laptop", "desk"]) == [
+            [5.0, 1.0], [6.0, 1.0], [6.0, 1.0], [4.0, 1.0]
+        ]
+        assert client.client.embedded == ["laptop", "mouse", "desk"]
+        stats = client.get_stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (3, 3, 3)
+    finally:
+        client.close()
+
+
+def test_least_recently_used_vectors_are_evicted(tmp_path, monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cached_embedder.time, "time", lambda: now[0])
+    client = make_client(tmp_path, max_entries=2)
+    try:
+        client.get_embeddings(["a"])
+        now[0] += 1
+        client.get_embeddings(["bb"])
+        now[0] += 1
+        # Using "a" again makes "bb" the least recently used vector
+        client.get_embeddings(["a"])
+        now[0] += 1
+        client.get_embeddings(["ccc"])
+        assert client.get_stats()["entries"] == 2
+
+        client.client.embedded.clear()
+        client.get_embeddings(["a", "ccc", "bb"])
+        assert client.client.embedded == ["bb"]
+    finally:
+        client.close()
+
+
+def test_vectors_survive_a_restart(tmp_path):
+    client = make_client(tmp_path)
+    client.get_embeddings(["laptop"])
+    client.close()
+
+    reopened = make_client(tmp_path)
+    try:
+        assert reopened.get_embeddings(["laptop"]) == [[6.0, 1.0]]
+        assert reopened.client.embedded == []
+        assert reopened.get_stats()["entries"] == 1
+    finally:
+        reopened.close()
@@ -0,0 +1,66 @@
+import threading
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+pytest.importorskip("lancedb")
+
+from procureme.vectordb.federated_vectordb import (
+    FEDERATED_SCORE,
+    FederatedVectorStore,
+    merge_results,
+    normalize_scores,
+)
+
+
+class StaticStore:
+    """Answers every search with fixed vector hits, after an optional event is set."""
+
+    def __init__(self, distances: Dict[str, float], release: Optional[threading.Event] = None):
+        self.distances = distances
+        self.release = release
+
+    def search(self, query: str, top_k: int = 20, **kwargs: Any) -> List[Dict[str, Any]]:
+        if self.release is not None:
+            self.release.wait()
+        hits = [{"chunk_id": chunk_id, "_distance": distance} for chunk_id, distance in self.distances.items()]
+        return sorted(hits, key=lambda hit: hit["_distance"])[:top_k]
+
+
+def test_normalize_scores_prefers_the_smallest_distance():
+    hits = normalize_scores([{"_distance": 0.5}, {"_distance": 1.0}, {"_distance": 1.5}])
+    assert [hit[FEDERATED_SCORE] for hit in hits] == [1.0, 0.5, 0.0]
+
+
+def test_normalize_scores_uses_the_relevance_score_of_hybrid_hits():
+    hits = normalize_scores([{"_distance": 9.0, "_relevance_score": 0.2}, {"_distance": 0.1, "_relevance_score": 0.1}])
+    assert [hit[FEDERATED_SCORE] for hit in hits] == [1.0, 0.0]
+    assert normalize_scores([{"_score": 3.0}])[0][FEDERATED_SCORE] == 1.0
+
+
+def test_merge_results_keeps_the_best_copy_of_every_chunk():
+    merged = merge_results(
+        {
+            "small": [{"chunk_id": "a", FEDERATED_SCORE: 0.4}, {"chunk_id": "b", FEDERATED_SCORE: 1.0}],
+            "large": [{"chunk_id": "a", FEDERATED_SCORE: 0.9}, {"chunk_id": "c", FEDERATED_SCORE: 0.1}],
+        },
+        top_k=2,
+    )
+    assert [(hit["chunk_id"], hit["_table"]) for hit in merged] == [("b", "small"), ("a", "large")]
+
+
+def test_hung_table_is_skipped_and_does_not_block_the_others():
+    release = threading.Event()
+    store = FederatedVectorStore(
+        {"fast": StaticStore({"a": 0.1, "b": 0.2}), "hung": StaticStore({"c": 0.0}, release)},
+        timeout=0.05,
+        workers_per_table=1,
+    )
+    try:
+        # More searches than the hung table has workers, the fast table still answers every one
+        for _ in range(3):
+            hits = store.search("delivery", top_k=2)
+            assert [(hit["chunk_id"], hit["_table"]) for hit in hits] == [("a", "fast"), ("b", "fast")]
+    finally:
+        release.set()
+        store.close()
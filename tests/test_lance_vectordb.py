@@ -0,0 +1,184 @@
+from typing import List
+import asyncio
+
+import pytest
+
+pytest.importorskip("lancedb")
+
+from procureme.clients.fake_embedder import FakeEmbeddingClient
+from procureme.models.contract_model import ParsedDocument, ParsedDocumentParts
+from procureme.vectordb.lance_vectordb import (
+    LanceDBVectorStore,
+    SearchMode,
+    VectorIndexType,
+    choose_index_params,
+    compute_content_hash,
+)
+from procureme.vectordb.quantization import QUANTIZED_COLUMN, QuantizationType
+
+
+DIMENSION = 32
+
+
+def make_document(file_name: str, pages: List[str]) -> ParsedDocument:
+    parts = [
+        ParsedDocumentParts(id_=f"{file_name}-{page}", text=text, part=str(page))
+        for page, text in enumerate(pages, start=1)
+    ]
+    return ParsedDocument(total_pages=len(pages), file_name=file_name, text=" ".join(pages), parts=parts)
+
+
+def make_store(tmp_path, **kwargs) -> LanceDBVectorStore:
+    kwargs.setdefault("index_refresh_rows", None)
+    return LanceDBVectorStore(
+        db_path=tmp_path / "contracts.db",
+        table_name="contracts_test",
+        embedding_client=FakeEmbeddingClient(DIMENSION),
+        **kwargs,
+    )
+
+
+def test_get_stats_and_maintain(tmp_path):
+    store = make_store(tmp_path)
+    store.insert([make_document("CW0001.pdf", ["laptop supply", "payment terms"])])
+    store.insert([make_document("CW0002.pdf", ["office furniture"])])
+
+    stats = store.get_stats()
+    assert stats["total_documents"] == 3
+    assert stats["storage"]["fragment_count"] == 2
+    assert stats["storage"]["small_fragment_count"] == 2
+    assert stats["storage"]["version_count"] >= 3
+
+    report = store.maintain()
+    assert report["before"]["fragment_count"] == 2
+    assert report["after"]["fragment_count"] == 1
+    assert store.get_stats()["total_documents"] == 3
+
+
+def make_pages(count: int, offset: int = 0) -> List[str]:
+    return [f"contract clause {page} delivery of item {page % 37} supplier {page % 11}" for page in range(offset, offset + count)]
+
+
+def test_ivf_pq_is_the_default_index():
+    assert choose_index_params(10_000, DIMENSION)["index_type"] == VectorIndexType.IVF_PQ
+
+
+@pytest.mark.parametrize("index_type", list(VectorIndexType))
+def test_refresh_after_insert_into_indexed_table(tmp_path, index_type):
+    store = make_store(tmp_path)
+    store.insert([make_document("CW0001.pdf", make_pages(512))])
+    store.create_index(index_type)
+    store.insert([make_document("CW0002.pdf", make_pages(16, offset=512))])
+
+    expected = "rebuilt" if index_type == VectorIndexType.HNSW else "optimized"
+    assert store.refresh_index(force=True) == expected
+    assert store.get_stats()["vector_index"]["num_unindexed_rows"] == 0
+
+    store.insert([make_document("CW0003.pdf", make_pages(16, offset=528))])
+    store.maintain()
+    assert store.get_stats()["total_documents"] == 544
+
+
+@pytest.mark.parametrize("quantization", list(QuantizationType))
+def test_quantized_table_serves_regular_searches(tmp_path, quantization):
+    store = make_store(tmp_path, quantization=quantization)
+    store.insert([make_document("CW0001.pdf", make_pages(64))])
+    store.ensure_fts_index()
+
+    for mode in SearchMode:
+        hits = store.search("delivery of item 5", top_k=3, mode=mode)
+        assert 0 < len(hits) <= 3
+        assert QUANTIZED_COLUMN not in hits[0]
+    assert len(asyncio.run(store.asearch("delivery of item 5", top_k=3))) == 3
+    assert [len(hits) for hits in store.search_many(["supplier 3", "item 9"], top_k=2)] == [2, 2]
+    assert len(store.search_quantized(store.embedding_client.get_embedding("item 5"), top_k=3)) == 3
+
+
+@pytest.mark.parametrize("quantization", list(QuantizationType))
+def test_vector_searches_on_quantized_tables_can_run_two_pass(tmp_path, quantization):
+    store = make_store(tmp_path, quantization=quantization, search_oversample=4)
+    store.insert([make_document("CW0001.pdf", make_pages(64))])
+
+    expected = store.search_quantized(store.embedding_client.get_embedding("delivery of item 5"), top_k=3, oversample=4)
+    hits = store.search("delivery of item 5", top_k=3)
+    assert [hit["chunk_id"] for hit in hits] == [hit["chunk_id"] for hit in expected]
+    async_hits = asyncio.run(store.asearch("delivery of item 5", top_k=3))
+    assert [hit["chunk_id"] for hit in async_hits] == [hit["chunk_id"] for hit in expected]
+    # Filtered searches keep the prefiltered index search
+    assert len(store.search("delivery of item 5", top_k=3, where="part = '5'")) == 1
+
+
+def test_upsert_replaces_changed_and_removes_stale_chunks(tmp_path):
+    store = make_store(tmp_path)
+    store.upsert([make_document("CW0001.pdf", ["laptop supply", "payment terms", "termination"])])
+    store.upsert([make_document("CW0001.pdf", ["laptop supply", "payment within 30 days"])])
+
+    rows = store.table.to_arrow().sort_by("chunk_id").select(["chunk_id", "content", "content_hash"]).to_pylist()
+    assert [(row["chunk_id"], row["content"]) for row in rows] == [
+        ("CW0001.pdf-1", "laptop supply"),
+        ("CW0001.pdf-2", "payment within 30 days"),
+    ]
+    assert rows[1]["content_hash"] == compute_content_hash("payment within 30 days")
+    assert store.search("payment within 30 days", top_k=1)[0]["chunk_id"] == "CW0001.pdf-2"
+
+
+def test_hybrid_arrow_results_keep_every_score_column(tmp_path):
+    store = make_store(tmp_path)
+    store.insert([make_document("CW0001.pdf", make_pages(64))])
+    store.ensure_fts_index()
+
+    table = store.search("delivery of item 5", top_k=10, mode=SearchMode.HYBRID, as_arrow=True)
+    for column in ("_distance", "_score", "_relevance_score"):
+        assert column in table.column_names
+    assert len(table) == 10
+
+
+def test_opening_a_table_with_another_dimension_fails(tmp_path):
+    make_store(tmp_path).insert([make_document("CW0001.pdf", ["laptop supply"])])
+
+    with pytest.raises(ValueError, match="32-dimensional vectors"):
+        LanceDBVectorStore(
+            db_path=tmp_path / "contracts.db",
+            table_name="contracts_test",
+            embedding_client=FakeEmbeddingClient(16),
+        )
+
+
+def test_asearch_sees_rows_inserted_after_the_first_async_search(tmp_path):
+    store = make_store(tmp_path)
+    store.insert([make_document("CW0001.pdf", make_pages(8))])
+
+    async def search_between_inserts():
+        first = await store.asearch("office furniture", top_k=1)
+        store.insert([make_document("CW0002.pdf", ["office furniture"])])
+        second = await store.asearch("office furniture", top_k=1)
+        return first, second
+
+    first, second = asyncio.run(search_between_inserts())
+    assert first[0]["chunk_id"] != "CW0002.pdf-1"
+    assert second[0]["chunk_id"] == "CW0002.pdf-1"
+
+
+def test_hybrid_search_without_fts_index_falls_back_to_vector(tmp_path):
+    store = make_store(tmp_path)
+    store.insert([make_document("CW0001.pdf", make_pages(16))])
+
+    hits = store.search("delivery of item 5", top_k=3, mode=SearchMode.HYBRID)
+    assert len(hits) == 3
+    assert "_distance" in hits[0]
+    assert len(asyncio.run(store.asearch("delivery of item 5", top_k=3, mode=SearchMode.HYBRID))) == 3
+
+
+def test_opening_never_changes_the_schema_until_migrated(tmp_path):
+    make_store(tmp_path).insert([make_document("CW0001.pdf", make_pages(8))])
+
+    store = make_store(tmp_path, quantization=QuantizationType.BINARY)
+    version = store.table.version
+    assert QUANTIZED_COLUMN not in store.table.schema.names
+    assert len(store.search("delivery of item 5", top_k=3, oversample=4)) == 3
+    assert store.table.version == version
+
+    assert store.migrate_schema() == [QUANTIZED_COLUMN]
+    assert store.build_quantized_codes() == 8
+    assert len(store.search_quantized(store.embedding_client.get_embedding("item 5"), top_k=3)) == 3
+    assert store.migrate_schema() == []
@@ -0,0 +1,18 @@
+import pytest
+
+pytest.importorskip("lancedb")
+
+from procureme.vectordb.memory_vectordb import InMemoryVectorStore
+from tests.test_lance_vectordb import make_document, make_pages, make_store
+
+
+def test_distances_match_the_lance_table(tmp_path):
+    source = make_store(tmp_path)
+    source.insert([make_document("CW0001.pdf", make_pages(32))])
+    store = InMemoryVectorStore(source)
+
+    lance_hits = source.search("delivery of item 5", top_k=5)
+    memory_hits = store.search("delivery of item 5", top_k=5)
+    assert [hit["chunk_id"] for hit in memory_hits] == [hit["chunk_id"] for hit in lance_hits]
+    for memory_hit, lance_hit in zip(memory_hits, lance_hits):
+        assert memory_hit["_distance"] == pytest.approx(lance_hit["_distance"], abs=1e-4)
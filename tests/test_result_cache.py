@@ -0,0 +1,67 @@
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from procureme.vectordb import result_cache
+from procureme.vectordb.result_cache import SearchResultCache
+
+
+HITS = [{"chunk_id": "CW0001.pdf-1", "_distance": 0.25}]
+
+
+def test_key_ignores_whitespace_and_keeps_the_search_parameters_apart():
+    key = SearchResultCache.make_key("payment  terms ", 3, mode="vector", where=None)
+    assert key == SearchResultCache.make_key("payment terms", 3, where=None, mode="vector")
+    assert key != SearchResultCache.make_key("payment terms", 3, mode="hybrid", where=None)
+
+
+def test_new_table_version_drops_every_entry():
+    cache = SearchResultCache()
+    key = cache.make_key("payment terms", 3)
+    cache.put(key, 1, HITS)
+    assert cache.get(key, 1) == HITS
+
+    assert cache.get(key, 2) is None
+    # Results of a search that started before the write are not cached for the new version
+    cache.put(key, 1, HITS)
+    assert cache.get(key, 2) is None
+    assert cache.get_stats()["invalidations"] == 1
+
+
+def test_entries_expire_after_the_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(result_cache.time, "monotonic", lambda: now[0])
+    cache = SearchResultCache(ttl_seconds=10)
+    key = cache.make_key("payment terms", 3)
+    cache.put(key, 1, HITS)
+
+    now[0] += 10
+    assert cache.get(key, 1) == HITS
+    now[0] += 1
+    assert cache.get(key, 1) is None
+    assert cache.get_stats()["entries"] == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = SearchResultCache(max_entries=2)
+    first, second, third = (cache.make_key(query, 3) for query in ("a", "b", "c"))
+    cache.put(first, 1, HITS)
+    cache.put(second, 1, HITS)
+    cache.get(first, 1)
+    cache.put(third, 1, HITS)
+
+    assert cache.get(second, 1) is None
+    assert cache.get(first, 1) == HITS
+    assert cache.get(third, 1) == HITS
+
+
+def test_callers_cannot_modify_the_cached_hits():
+    cache = SearchResultCache()
+    key = cache.make_key("payment terms", 3)
+    hits = [dict(hit) for hit in HITS]
+    cache.put(key, 1, hits)
+    hits[0]["_distance"] = 9.0
+
+    served = cache.get(key, 1)
+    served[0]["_federated_score"] = 1.0
+    assert cache.get(key, 1) == HITS
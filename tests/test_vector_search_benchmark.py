@@ -0,0 +1,23 @@
+import json
+
+import pytest
+
+pytest.importorskip("lancedb")
+
+from benchmarks.vector_search_benchmark import Backend, benchmark_size
+from procureme.vectordb.lance_vectordb import VectorIndexType
+
+
+def test_benchmark_runs_every_backend_on_its_own_index(tmp_path):
+    results = benchmark_size(
+        tmp_path, num_rows=2_000, backends=list(Backend), dimension=32,
+        num_queries=20, top_k=5, nprobes=None, refine_factor=None,
+    )
+
+    by_backend = {result["backend"]: result for result in results}
+    assert set(by_backend) == {str(backend) for backend in Backend}
+    assert by_backend[Backend.FLAT]["recall@5"] == 1.0
+    assert by_backend[Backend.IVF_PQ]["index_type"] == VectorIndexType.IVF_PQ
+    assert by_backend[Backend.HNSW]["index_type"] == VectorIndexType.HNSW
+    assert all(result["disk_bytes"] > 0 for result in results)
+    json.dumps(results)